@@ -0,0 +1,35 @@
+import importlib
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_imports(namespace: dict, imports: Mapping[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Создать функции ``__getattr__`` и ``__dir__`` пакета для ленивого импорта (PEP 562).
+
+    Подмодуль импортируется только при первом обращении к его имени, после чего имя сохраняется в пакете
+    и последующие обращения не проходят через ``__getattr__``.
+
+    Args:
+        namespace (:obj:`dict`): Глобальные переменные пакета.
+        imports (Mapping[:obj:`str`, :obj:`str`]): Пары имя/относительный путь подмодуля.
+
+    Returns:
+        tuple[Callable, Callable]: Функции ``__getattr__`` и ``__dir__``.
+    """
+
+    package = namespace['__name__']
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module = imports[name]
+        except KeyError:
+            raise AttributeError(f'module {package!r} has no attribute {name!r}') from None
+
+        value = getattr(importlib.import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(namespace.keys() | imports.keys())
+
+    return __getattr__, __dir__
@@ -0,0 +1,118 @@
+import time
+import asyncio
+import threading
+from typing import Optional
+
+
+class RateLimiter:
+    """Класс, представляющий ограничитель частоты запросов по алгоритму token bucket.
+
+    Потокобезопасен. Используется синхронными клиентами и утилитами.
+
+    Args:
+        rate (:obj:`float`): Количество запросов в секунду.
+        burst (:obj:`int`, optional): Максимальное количество запросов, которые можно отправить подряд.
+            По умолчанию равно 1.
+
+    Attributes:
+        rate (:obj:`float`): Количество запросов в секунду.
+        burst (:obj:`int`): Максимальное количество запросов, которые можно отправить подряд.
+
+    Raises:
+        ValueError: Указано неположительное значение rate или burst.
+    """
+
+    __slots__ = [
+        'rate',
+        'burst',
+        '_tokens',
+        '_updated',
+        '_lock'
+    ]
+
+    def __init__(self, rate: float, burst: Optional[int] = None) -> None:
+        if rate <= 0:
+            raise ValueError(f'Недопустимое значение rate :: {rate}')
+        if burst is None:
+            burst = 1
+        if burst <= 0:
+            raise ValueError(f'Недопустимое значение burst :: {burst}')
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def available(self) -> float:
+        """Количество запросов, которые можно отправить прямо сейчас."""
+
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+    def delay(self) -> float:
+        """Занять место под запрос без ожидания.
+
+        Returns:
+            :obj:`float`: Сколько секунд нужно подождать перед отправкой запроса.
+        """
+
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def penalize(self, seconds: float) -> None:
+        """Приостановить выдачу запросов, например после ответа 429.
+
+        Args:
+            seconds (:obj:`float`): На сколько секунд приостановить выдачу.
+        """
+
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+    def acquire(self) -> None:
+        """Дождаться возможности отправить запрос."""
+
+        delay = self.delay()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class AsyncRateLimiter(RateLimiter):
+    """Класс, представляющий асинхронный ограничитель частоты запросов по алгоритму token bucket.
+
+    Args:
+        rate (:obj:`float`): Количество запросов в секунду.
+        burst (:obj:`int`, optional): Максимальное количество запросов, которые можно отправить подряд.
+            По умолчанию равно 1.
+
+    Attributes:
+        rate (:obj:`float`): Количество запросов в секунду.
+        burst (:obj:`int`): Максимальное количество запросов, которые можно отправить подряд.
+    """
+
+    __slots__ = []
+
+    async def acquire(self) -> None:
+        """Дождаться возможности отправить запрос, не блокируя цикл событий."""
+
+        delay = self.delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def __aenter__(self) -> 'AsyncRateLimiter':
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
@@ -8,63 +8,85 @@ Licensed under the BSD 3-Clause License - Copyright (c) 2024-present, Lemon4ksan
 See LICENSE
 """
 
-from ._base import TraderClientObject
-
-from ._misc import SellHistoryItem
-from ._misc import InventoryItem
-from ._misc import Filter
-from ._misc import Filters
-from ._misc import BuyOrder
-from ._misc import Discount
-from ._misc import OperationsHistoryItem
-from ._misc import AltWebSocketMessage
-from ._misc import MultiBuyOrder
-from ._misc import ItemForExchange
-from ._misc import TradeDescription
-from ._misc import ExchangeItem
-
-from ._p2p import P2PTradeOffer
-from ._p2p import P2PSendObject
-from ._p2p import P2PReceiveObject
-from ._p2p import P2PConfirmObject
-
-from ._offers import BuyOffer
-from ._offers import SellOffer
-
-from ._sale import SellResult
-
-from ._buy import BuyResult
-from ._buy import BuyOrderResult
-from ._buy import MultiBuyResult
-
-from ._trade import ItemsForExchange
-from ._trade import ExchangeResult
-from ._trade import ExchangeP2PResult
-
-from ._account import WebSocketToken
-from ._account import Inventory
-from ._account import BuyOrders
-from ._account import Discounts
-from ._account import OperationsHistory
-from ._account import InventoryState
-from ._account import AltWebSocket
-
-from ._item_info import MinPrices
-from ._item_info import ItemInfo
-from ._item_info import OrderBook
-
-from ._edit_item import EditPriceResult
-from ._edit_item import DeleteItemResult
-from ._edit_item import GetDownOrdersResult
-
-from ._client import Client
-from ._client_async import ClientAsync
+from typing import TYPE_CHECKING
+
+from steam_trader._lazy import lazy_imports
+
+if TYPE_CHECKING:
+    from ._base import TraderClientObject
+
+    from ._misc import SellHistoryItem
+    from ._misc import InventoryItem
+    from ._misc import Filter
+    from ._misc import Filters
+    from ._misc import BuyOrder
+    from ._misc import Discount
+    from ._misc import OperationsHistoryItem
+    from ._misc import AltWebSocketMessage
+    from ._misc import MultiBuyOrder
+    from ._misc import ItemForExchange
+    from ._misc import TradeDescription
+    from ._misc import ExchangeItem
+
+    from ._p2p import P2PTradeOffer
+    from ._p2p import P2PSendObject
+    from ._p2p import P2PReceiveObject
+    from ._p2p import P2PConfirmObject
+
+    from ._offers import BuyOffer
+    from ._offers import SellOffer
+
+    from ._sale import SellResult
+
+    from ._buy import BuyResult
+    from ._buy import BuyOrderResult
+    from ._buy import MultiBuyResult
+
+    from ._trade import ItemsForExchange
+    from ._trade import ExchangeResult
+    from ._trade import ExchangeP2PResult
+
+    from ._account import WebSocketToken
+    from ._account import Inventory
+    from ._account import BuyOrders
+    from ._account import Discounts
+    from ._account import OperationsHistory
+    from ._account import InventoryState
+    from ._account import AltWebSocket
+
+    from ._item_info import MinPrices
+    from ._item_info import ItemInfo
+    from ._item_info import OrderBook
+
+    from ._edit_item import EditPriceResult
+    from ._edit_item import DeleteItemResult
+    from ._edit_item import GetDownOrdersResult
+
+    from ._compact_inventory import CompactInventory
+    from ._compact_inventory import InventoryRow
+
+    from ._filter_index import FilterEncoder
+    from ._filter_index import FilterIndex
+
+    from ._balance import BalanceCache
+
+    from ._scheduler import RequestScheduler
+    from ._scheduler import PRIORITY_TRADE
+    from ._scheduler import PRIORITY_ACCOUNT
+    from ._scheduler import PRIORITY_DATA
+
+    from ._client import Client
+    from ._client_async import ClientAsync
+
+    from ._pool import ClientPool
 
 __all__ = [
     'TraderClientObject',
     'Client',
     'WebSocketToken',
     'Inventory',
+    'CompactInventory',
+    'InventoryRow',
     'BuyOrders',
     'Discounts',
     'MultiBuyOrder',
@@ -77,6 +99,8 @@ __all__ = [
     'BuyOrder',
     'Filter',
     'Filters',
+    'FilterEncoder',
+    'FilterIndex',
     'ItemForExchange',
     'ExchangeItem',
     'Discount',
@@ -89,6 +113,12 @@ __all__ = [
     'P2PReceiveObject',
     'P2PTradeOffer',
     'ClientAsync',
+    'ClientPool',
+    'BalanceCache',
+    'RequestScheduler',
+    'PRIORITY_TRADE',
+    'PRIORITY_ACCOUNT',
+    'PRIORITY_DATA',
     'SellResult',
     'TradeDescription',
     'BuyOffer',
@@ -103,3 +133,58 @@ __all__ = [
     'DeleteItemResult',
     'OrderBook',
 ]
+
+# Подмодули импортируются при первом обращении, чтобы не загружать httpx, bs4 и lxml без необходимости
+__getattr__, __dir__ = lazy_imports(globals(), {
+    'TraderClientObject': '._base',
+    'SellHistoryItem': '._misc',
+    'InventoryItem': '._misc',
+    'Filter': '._misc',
+    'Filters': '._misc',
+    'BuyOrder': '._misc',
+    'Discount': '._misc',
+    'OperationsHistoryItem': '._misc',
+    'AltWebSocketMessage': '._misc',
+    'MultiBuyOrder': '._misc',
+    'ItemForExchange': '._misc',
+    'TradeDescription': '._misc',
+    'ExchangeItem': '._misc',
+    'P2PTradeOffer': '._p2p',
+    'P2PSendObject': '._p2p',
+    'P2PReceiveObject': '._p2p',
+    'P2PConfirmObject': '._p2p',
+    'BuyOffer': '._offers',
+    'SellOffer': '._offers',
+    'SellResult': '._sale',
+    'BuyResult': '._buy',
+    'BuyOrderResult': '._buy',
+    'MultiBuyResult': '._buy',
+    'ItemsForExchange': '._trade',
+    'ExchangeResult': '._trade',
+    'ExchangeP2PResult': '._trade',
+    'WebSocketToken': '._account',
+    'Inventory': '._account',
+    'BuyOrders': '._account',
+    'Discounts': '._account',
+    'OperationsHistory': '._account',
+    'InventoryState': '._account',
+    'AltWebSocket': '._account',
+    'MinPrices': '._item_info',
+    'ItemInfo': '._item_info',
+    'OrderBook': '._item_info',
+    'EditPriceResult': '._edit_item',
+    'DeleteItemResult': '._edit_item',
+    'GetDownOrdersResult': '._edit_item',
+    'CompactInventory': '._compact_inventory',
+    'InventoryRow': '._compact_inventory',
+    'FilterEncoder': '._filter_index',
+    'FilterIndex': '._filter_index',
+    'BalanceCache': '._balance',
+    'RequestScheduler': '._scheduler',
+    'PRIORITY_TRADE': '._scheduler',
+    'PRIORITY_ACCOUNT': '._scheduler',
+    'PRIORITY_DATA': '._scheduler',
+    'Client': '._client',
+    'ClientAsync': '._client_async',
+    'ClientPool': '._pool'
+})
@@ -20,14 +20,11 @@ class WebSocketToken(TraderClientObject):
         steam_id: (:obj:`str`): SteamID клиента.
         time: (:obj:`int`): Время создание токена.
         hash: (:obj:`str`): Хеш токена.
-        client (Union[:class:`steam_trader.Client`, :class:`steam_trader.ClientAsync`, :obj:`None`]):
-            Клиент Steam Trader.
     """
 
     steam_id: str
     time: int
     hash: str
-    client: Union['Client', 'ClientAsync', None]
 
     @classmethod
     def de_json(
@@ -48,7 +45,7 @@ class WebSocketToken(TraderClientObject):
 
         data = super(WebSocketToken, cls).de_json(data)
 
-        return cls(client=client, **data)
+        return cls(**data)
 
 
 @dataclass(slots=True)
@@ -61,8 +58,6 @@ class Inventory(TraderClientObject):
         gameid (:obj:`int`): AppID игры к которой принадлежит инвентарь.
         last_update (:obj:`int`): Timestamp последнего обновления инвентаря.
         items (Sequence[:class:`steam_trader.InventoryItem`]): Последовательность с предметами в инвентаре.
-        client (Union[:class:`steam_trader.Client`, :class:`steam_trader.ClientAsync`, :obj:`None`]):
-            Клиент Steam Trader.
     """
 
     success: bool
@@ -70,7 +65,6 @@ class Inventory(TraderClientObject):
     gameid: int
     last_update: int
     items: Sequence['InventoryItem']
-    client: Union['Client', 'ClientAsync', None]
 
     @classmethod
     def de_json(
@@ -90,27 +84,20 @@ class Inventory(TraderClientObject):
                     case 429:
                         raise TooManyRequests('Вы отправили слишком много запросов.')
             except KeyError:
-                del data['error']
-
-        data.update({
-            'gameid': data['game']
-        })
-        del data['game']
+                pass
 
         if status is not None:
-            new_data = []
-            for i, offer in enumerate(data['items']):
-                if offer['status'] in status:
-                    new_data.append(InventoryItem.de_json(offer))
-
-            data['items'] = new_data
+            items = [InventoryItem.de_json(offer) for offer in data['items'] if offer['status'] in status]
         else:
-            for i, offer in enumerate(data['items']):
-                data['items'][i] = InventoryItem.de_json(offer)
+            items = [InventoryItem.de_json(offer) for offer in data['items']]
 
-        data = super(Inventory, cls).de_json(data)
+        data = super(Inventory, cls).de_json(
+            data,
+            values={'gameid': data['game'], 'items': items},
+            ignore=('game', 'error')
+        )
 
-        return cls(client=client, **data)
+        return cls(**data)
 
 
 @dataclass(slots=True)
@@ -120,13 +107,10 @@ class BuyOrders(TraderClientObject):
     Attributes:
         success (:obj:`bool`): Результат запроса.
         data (Sequence[:class:`steam_trader.BuyOrder`]): Последовательность запросов на покупку.
-        client (Union[:class:`steam_trader.Client`, :class:`steam_trader.ClientAsync`, :obj:`None`]):
-            Клиент Steam Trader.
     """
 
     success: bool
     data: Sequence['BuyOrder']
-    client: Union['Client', 'ClientAsync', None]
 
     @classmethod
     def de_json(
@@ -146,12 +130,10 @@ class BuyOrders(TraderClientObject):
                 case 1:
                     raise NoBuyOrders('Нет запросов на покупку.')
 
-        for i, offer in enumerate(data['data']):
-            data['data'][i] = BuyOrder.de_json(offer)
-
-        data = super(BuyOrders, cls).de_json(data)
+        orders = [BuyOrder.de_json(offer) for offer in data['data']]
+        data = super(BuyOrders, cls).de_json(data, values={'data': orders})
 
-        return cls(client=client, **data)
+        return cls(**data)
 
 
 @dataclass(slots=True)
@@ -161,13 +143,10 @@ class Discounts(TraderClientObject):
     Attributes:
         success (:obj:`bool`): Результат запроса.
         data (dict[:obj:`int`, :class:`steam_trader.Discount`]): Словарь, содержащий комисии/скидки.
-        client (Union[:class:`steam_trader.Client`, :class:`steam_trader.ClientAsync`, :obj:`None`]):
-            Клиент Steam Trader.
     """
 
     success: bool
     data: dict[int, 'Discount']
-    client: Union['Client', 'ClientAsync', None]
 
     @classmethod
     def de_json(
@@ -186,10 +165,10 @@ class Discounts(TraderClientObject):
                     raise TooManyRequests('Вы отправили слишком много запросов.')
 
         # Конвертируем ключ в число для совместимости с константами
-        data['data'] = {int(appid): Discount.de_json(_dict) for appid, _dict in data['data'].items()}
-        data = super(Discounts, cls).de_json(data)
+        discounts = {int(appid): Discount.de_json(_dict) for appid, _dict in data['data'].items()}
+        data = super(Discounts, cls).de_json(data, values={'data': discounts})
 
-        return cls(client=client, **data)
+        return cls(**data)
 
 
 @dataclass(slots=True)
@@ -199,13 +178,10 @@ class OperationsHistory(TraderClientObject):
     Attributes:
         success (:obj:`bool`): Результат запроса.
         data (Sequence[:class:`steam_trader.OperationsHistoryItem`]): Последовательность историй операций.
-        client (Union[:class:`steam_trader.Client`, :class:`steam_trader.ClientAsync`, :obj:`None`]):
-            Клиент Steam Trader.
     """
 
     success: bool
     data: Sequence['OperationsHistoryItem']
-    client: Union['Client', 'ClientAsync', None]
 
     @classmethod
     def de_json(
@@ -223,12 +199,10 @@ class OperationsHistory(TraderClientObject):
                 case 429:
                     raise TooManyRequests('Вы отправили слишком много запросов.')
 
-        for i, item in enumerate(data['data']):
-            data['data'][i] = OperationsHistoryItem.de_json(item)
+        items = [OperationsHistoryItem.de_json(item) for item in data['data']]
+        data = super(OperationsHistory, cls).de_json(data, values={'data': items})
 
-        data = super(OperationsHistory, cls).de_json(data)
-
-        return cls(client=client, **data)
+        return cls(**data)
 
 
 @dataclass(slots=True)
@@ -240,15 +214,12 @@ class InventoryState(TraderClientObject):
         updating_now (:obj:`bool`): Инвентарь обновляется в данный момент.
         last_update (:obj:`int`): Timestamp, когда последний раз был обновлён инвентарь.
         items_in_cache (:obj:`int`): Количество предметов в инвентаре.
-        client (Union[:class:`steam_trader.Client`, :class:`steam_trader.ClientAsync`, :obj:`None`]):
-            Клиент Steam Trader.
     """
 
     success: bool
     updating_now: bool
     last_update: int
     items_in_cache: int
-    client: Union['Client', 'ClientAsync', None]
 
     @classmethod
     def de_json(
@@ -257,13 +228,6 @@ class InventoryState(TraderClientObject):
             client: Union['Client', 'ClientAsync', None] = None
     ) -> 'InventoryState':
 
-        data.update({  # перенос с camleCase на snake_case
-            'updating_now': data['updatingNow'],
-            'last_update': data['lastUpdate'],
-            'items_in_cache': data['itemsInCache']
-        })
-        del data['updatingNow'], data['lastUpdate'], data['itemsInCache']
-
         if not data['success']:
             match data['code']:
                 case 400:
@@ -273,9 +237,17 @@ class InventoryState(TraderClientObject):
                 case 429:
                     raise TooManyRequests('Вы отправили слишком много запросов.')
 
-        data = super(InventoryState, cls).de_json(data)
+        data = super(InventoryState, cls).de_json(
+            data,
+            values={  # перенос с camleCase на snake_case
+                'updating_now': data['updatingNow'],
+                'last_update': data['lastUpdate'],
+                'items_in_cache': data['itemsInCache']
+            },
+            ignore=('updatingNow', 'lastUpdate', 'itemsInCache')
+        )
 
-        return cls(client=client, **data)
+        return cls(**data)
 
 
 @dataclass(slots=True)
@@ -286,13 +258,10 @@ class AltWebSocket(TraderClientObject):
         success (:obj:`bool`): Результат запроса. Если false, сообщений в поле messages не будет,
             при этом соединение будет поддержано.
         messages (Sequence[:class:`steam_trader.AltWebSocketMessage`]): Последовательность с WebSocket сообщениями.
-        client (Union[:class:`steam_trader.Client`, :class:`steam_trader.ClientAsync`, :obj:`None`]):
-            Клиент Steam Trader.
     """
 
     success: bool
     messages: Sequence['AltWebSocketMessage']
-    client: Union['Client', 'ClientAsync', None]
 
     @classmethod
     def de_json(
@@ -305,9 +274,7 @@ class AltWebSocket(TraderClientObject):
             logging.debug('WebSocket соединение поддержано.')
             return
 
-        for i, message in enumerate(data['messages']):
-            data['messages'][i] = AltWebSocketMessage.de_json(message)
-
-        data = super(AltWebSocket, cls).de_json(data)
+        messages = [AltWebSocketMessage.de_json(message) for message in data['messages']]
+        data = super(AltWebSocket, cls).de_json(data, values={'messages': messages})
 
-        return cls(client=client, **data)
+        return cls(**data)
@@ -0,0 +1,147 @@
+import time
+import functools
+import threading
+from collections.abc import Callable
+from typing import Optional, TypeVar, Any
+
+from steam_trader.exceptions import NotEnoughMoney
+from ._buy import BuyResult, BuyOrderResult, MultiBuyResult
+from ._sale import SellResult
+from ._edit_item import EditPriceResult, DeleteItemResult, GetDownOrdersResult
+from ._account import AltWebSocket
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+class BalanceCache:
+    """Класс, представляющий локальную копию баланса клиента.
+
+    Баланс запрашивается с сайта не чаще, чем раз в ttl секунд. Между запросами он изменяется локально
+    по ценам из :class:`steam_trader.BuyResult`, :class:`steam_trader.MultiBuyResult` и
+    :class:`steam_trader.SellResult`. Операции, влияние которых на баланс нельзя посчитать точно
+    (заявки на покупку, изменение цены, снятие с продажи, ошибка NotEnoughMoney, сообщения WebSocket),
+    сбрасывают кэш, и следующее обращение к балансу выполнит запрос.
+
+    Args:
+        ttl (:obj:`float`): Время в секундах, через которое баланс будет сверен с сайтом.
+
+    Attributes:
+        ttl (:obj:`float`): Время в секундах, через которое баланс будет сверен с сайтом.
+
+    Raises:
+        ValueError: Указано неположительное значение ttl.
+    """
+
+    __slots__ = [
+        'ttl',
+        '_value',
+        '_updated',
+        '_lock'
+    ]
+
+    def __init__(self, ttl: float) -> None:
+        if ttl <= 0:
+            raise ValueError(f'Недопустимое значение ttl :: {ttl}')
+
+        self.ttl = ttl
+        self._value: Optional[float] = None
+        self._updated = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> Optional[float]:
+        """Получить баланс, если он ещё актуален.
+
+        Returns:
+            :obj:`float`, optional: Баланс или None, если его нужно запросить с сайта.
+        """
+
+        if self._value is not None and time.monotonic() - self._updated < self.ttl:
+            return self._value
+        return None
+
+    def set(self, value: float) -> None:
+        """Сохранить баланс, полученный с сайта.
+
+        Args:
+            value (:obj:`float`): Баланс.
+        """
+
+        with self._lock:
+            self._value = value
+            self._updated = time.monotonic()
+
+    def add(self, amount: float) -> None:
+        """Изменить баланс локально. Время последней сверки не меняется.
+
+        Args:
+            amount (:obj:`float`): Изменение баланса. Отрицательное для списаний.
+        """
+
+        with self._lock:
+            if self._value is not None:
+                self._value = round(self._value + amount, 2)
+
+    def invalidate(self) -> None:
+        """Сбросить баланс. Следующее обращение выполнит запрос."""
+
+        with self._lock:
+            self._value = None
+
+    def apply(self, result: Any) -> None:
+        """Учесть результат торговой операции.
+
+        Args:
+            result (Any): Результат метода клиента.
+        """
+
+        match result:
+            case BuyResult(success=True, price=price):
+                self.add(-price)
+            case MultiBuyResult(balance=balance) if balance is not None:
+                self.set(balance)
+            case MultiBuyResult(spent=spent) if spent is not None:
+                self.add(-spent)
+            case SellResult(fast_execute=True, price=price) if price is not None:
+                self.add(price)
+            case SellResult() | None:
+                pass
+            case BuyOrderResult(executed=0) | EditPriceResult(fast_execute=False):
+                pass
+            case BuyOrderResult() | EditPriceResult() | DeleteItemResult() | GetDownOrdersResult() | AltWebSocket():
+                self.invalidate()
+
+
+def tracks_balance(method: F) -> F:
+    """Учитывать результат метода клиента в его :class:`BalanceCache`."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs) -> Any:
+        if self.balance_cache is None:
+            return method(self, *args, **kwargs)
+        try:
+            result = method(self, *args, **kwargs)
+        except NotEnoughMoney:
+            self.balance_cache.invalidate()
+            raise
+        self.balance_cache.apply(result)
+        return result
+
+    return wrapper
+
+
+def tracks_balance_async(method: F) -> F:
+    """Учитывать результат метода асинхронного клиента в его :class:`BalanceCache`."""
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs) -> Any:
+        if self.balance_cache is None:
+            return await method(self, *args, **kwargs)
+        try:
+            result = await method(self, *args, **kwargs)
+        except NotEnoughMoney:
+            self.balance_cache.invalidate()
+            raise
+        self.balance_cache.apply(result)
+        return result
+
+    return wrapper
@@ -1,8 +1,10 @@
+import functools
 import dataclasses
 import logging
 from abc import ABCMeta
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Union
+from collections.abc import Collection
+from typing import TYPE_CHECKING, Optional, Union
 
 if TYPE_CHECKING:
     from ._client import Client
@@ -11,39 +13,65 @@ if TYPE_CHECKING:
 class TraderClientObject:
     """Базовый класс для всех api объектов библиотеки.
 
+    Объекты не хранят ссылку на клиент и могут быть сериализованы через :mod:`pickle`.
+
     Changes:
         0.3.0: Удалён метод is_valid_data из-за ненадобности.
+        0.5.0: Удалено поле client у датаклассов. Аргумент client метода de_json оставлен для совместимости.
     """
 
     __metaclass__ = ABCMeta
 
     @classmethod
-    def de_json(cls: dataclass, data: dict, client: Union['Client', 'ClientAsync', None] = None) -> dict:
+    def de_json(
+            cls: dataclass,
+            data: dict,
+            client: Union['Client', 'ClientAsync', None] = None,
+            *,
+            values: Optional[dict] = None,
+            ignore: Collection[str] = ()
+    ) -> dict:
         """Десериализация объекта.
 
+        Исходный словарь не изменяется и не копируется, поэтому один ответ можно десериализовать несколько раз,
+        например из кэша. Датаклассы передают сюда уже преобразованные поля через values.
+
         Args:
             data (:obj:`dict`): Поля и значения десериализуемого объекта.
             client (Union[:class:`steam_trader.Client`, :class:`steam_trader.ClientAsync`, :obj:`None`]):
-                Клиент Steam Trader.
+                Клиент Steam Trader. Не используется.
+            values (:obj:`dict`, optional): Преобразованные значения полей. Заменяют значения из data.
+                Словарь будет дополнен и возвращён.
+            ignore (Collection[:obj:`str`]): Ключи data, которые не нужно передавать датаклассу.
 
         Returns:
             :obj:`dict`, optional: Словарь с валидными аттрибутами для создания датакласса.
-        """
 
-        data = data.copy()
+        Changes:
+            0.5.0: Добавлены аргументы values и ignore. Словарь data больше не копируется.
+        """
 
-        fields = {f.name for f in dataclasses.fields(cls)}
+        fields = _fields(cls)
 
-        cleaned_data = {}
-        unknown_data = {}
+        cleaned_data = {} if values is None else values
+        unknown_data = None
 
         for k, v in data.items():
+            if k in cleaned_data or k in ignore:
+                continue
             if k in fields:
                 cleaned_data[k] = v
             else:
+                if unknown_data is None:
+                    unknown_data = {}
                 unknown_data[k] = v
 
         if unknown_data:
             logging.warning(f'Были получены неизвестные аттриубты для класса {cls} :: {unknown_data}')
 
         return cleaned_data
+
+
+@functools.cache
+def _fields(cls: type) -> frozenset[str]:
+    return frozenset(f.name for f in dataclasses.fields(cls))
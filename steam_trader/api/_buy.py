@@ -24,8 +24,6 @@ class BuyResult(TraderClientObject):
         new_price (:obj:`float`): Новая цена лучшего предложения о продаже для варианта покупки Commodity,
             если у группы предметов ещё имеются предложения о продаже. Для остальных вариантов покупки будет 0
         discount (:obj:`float`): Размер скидки в процентах, за которую был куплен предмет.
-        client (Union[:class:`steam_trader.api.api.Client`, :class:`steam_trader.api.api.ClientAsync`, :obj:`None`]):
-            Клиент Steam Trader.
     """
 
     success: bool
@@ -35,7 +33,6 @@ class BuyResult(TraderClientObject):
     price: float
     new_price: float
     discount: float
-    client: Union['Client', 'ClientAsync', None]
 
     @classmethod
     def de_json(
@@ -63,7 +60,7 @@ class BuyResult(TraderClientObject):
 
         data = super(BuyResult, cls).de_json(data)
 
-        return cls(client=client, **data)
+        return cls(**data)
 
 @dataclass(slots=True)
 class BuyOrderResult(TraderClientObject):
@@ -73,14 +70,11 @@ class BuyOrderResult(TraderClientObject):
         success (:obj:`bool`): Результат запроса.
         executed (:obj:`int`): Количество исполненных заявок.
         placed (:obj:`int`): Количество размещённых на маркет заявок.
-        client (Union[:class:`steam_trader.api.api.Client`, :class:`steam_trader.api.api.ClientAsync`, :obj:`None`]):
-            Клиент Steam Trader.
     """
 
     success: bool
     executed: int
     placed: int
-    client: Union['Client', 'ClientAsync', None]
 
     @classmethod
     def de_json(
@@ -89,8 +83,6 @@ class BuyOrderResult(TraderClientObject):
             client: Union['Client', 'ClientAsync', None] = None
     ) -> 'BuyOrderResult':
 
-        del data['orders']  # Конфликт с steam_trader.api.api.BuyOrder
-
         if not data['success']:
             match data['code']:
                 case 400:
@@ -110,9 +102,9 @@ class BuyOrderResult(TraderClientObject):
                 case 5:
                     raise exceptions.NotEnoughMoney('Недостаточно средств.')
 
-        data = super(BuyOrderResult, cls).de_json(data)
+        data = super(BuyOrderResult, cls).de_json(data, ignore=('orders',))  # Конфликт с steam_trader.api.api.BuyOrder
 
-        return cls(client=client, **data)
+        return cls(**data)
 
 @dataclass(slots=True)
 class MultiBuyResult(TraderClientObject):
@@ -125,8 +117,6 @@ class MultiBuyResult(TraderClientObject):
         orders (Sequence[:class:`steam_trader.api.api.MultiBuyOrder`], optional):
             Последовательность купленных предметов. Указывается если success = True
         left (:obj:`int`): Сколько предметов по этой цене осталось. Если операция прошла успешно, всегда равен 0.
-        client (Union[:class:`steam_trader.api.api.Client`, :class:`steam_trader.api.api.ClientAsync`, :obj:`None`]):
-            Клиент Steam Trader.
 
     Changes:
         0.2.3: Теперь, если во время операции закончиться баланс, вместо ошибки,
@@ -134,7 +124,6 @@ class MultiBuyResult(TraderClientObject):
     """
 
     success: bool
-    client: Union['Client', 'ClientAsync', None]
     balance: Optional[float] = None
     spent: Optional[float] = None
     orders: Optional[Sequence['MultiBuyOrder']] = None
@@ -164,9 +153,7 @@ class MultiBuyResult(TraderClientObject):
                 case 5:
                     raise exceptions.NotEnoughMoney('Недостаточно средств.')
 
-        for i, offer in enumerate(data['orders']):
-            data['orders'][i] = MultiBuyOrder.de_json(offer)
-
-        data = super(MultiBuyResult, cls).de_json(data)
+        orders = [MultiBuyOrder.de_json(offer) for offer in data['orders']]
+        data = super(MultiBuyResult, cls).de_json(data, values={'orders': orders})
 
-        return cls(client=client, **data)
+        return cls(**data)
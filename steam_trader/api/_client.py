@@ -13,6 +13,8 @@ from ._sale import SellResult
 from ._edit_item import EditPriceResult, DeleteItemResult, GetDownOrdersResult
 from ._item_info import MinPrices, ItemInfo, OrderBook
 from ._trade import ItemsForExchange, ExchangeResult, ExchangeP2PResult
+from ._compact_inventory import CompactInventory
+from ._balance import BalanceCache, tracks_balance
 
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -45,6 +47,8 @@ class Client(TraderClientObject):
         base_url (:obj:`str`, optional): Ссылка на API Steam Trader.
         headers (:obj:`dict`, optional): Словарь, содержащий сведения об устройстве, с которого выполняются запросы.
             Используется при каждом запросе на сайт.
+        balance_ttl (:obj:`float`, optional): Если указан, баланс кэшируется и сверяется с сайтом не чаще,
+            чем раз в balance_ttl секунд. Между сверками он изменяется локально по результатам покупок и продаж.
         **kwargs: Будут переданы httpx клиенту. Например timeout.
 
     Attributes:
@@ -53,6 +57,7 @@ class Client(TraderClientObject):
         base_url (:obj:`str`, optional): Ссылка на API Steam Trader.
         headers (:obj:`dict`, optional): Словарь, содержащий сведения об устройстве, с которого выполняются запросы.
             Используется при каждом запросе на сайт.
+        balance_cache (:class:`steam_trader.api.BalanceCache`, optional): Кэш баланса.
 
     Raises:
         BadRequestError: Неправильный запрос.
@@ -63,7 +68,8 @@ class Client(TraderClientObject):
     __slots__ = [
         'sessionid',
         'proxy',
-        'base_url'
+        'base_url',
+        'balance_cache'
     ]
 
     def __init__(
@@ -73,6 +79,7 @@ class Client(TraderClientObject):
             proxy: Optional[str] = None,
             base_url: Optional[str] = None,
             headers: Optional[dict] = None,
+            balance_ttl: Optional[float] = None,
             **kwargs
     ) -> None:
 
@@ -93,6 +100,7 @@ class Client(TraderClientObject):
 
         self._httpx_client = None
         self.proxy = proxy
+        self.balance_cache = BalanceCache(balance_ttl) if balance_ttl is not None else None
         self.kwargs = kwargs
 
     def __enter__(self) -> 'Client':
@@ -104,7 +112,10 @@ class Client(TraderClientObject):
 
     @property
     def balance(self) -> float:
-        """Баланс клиента."""
+        """Баланс клиента. Если указан balance_ttl, запрос выполняется только при устаревшем кэше."""
+
+        if self.balance_cache is not None and (balance := self.balance_cache.get()) is not None:
+            return balance
 
         url = self.base_url + 'getbalance/'
         result = (self._httpx_client or httpx).get(
@@ -117,9 +128,12 @@ class Client(TraderClientObject):
                     raise Unauthorized('Неправильный api-токен.')
                 case 429:
                     raise TooManyRequests('Вы отправили слишком много запросов.')
+        if self.balance_cache is not None:
+            self.balance_cache.set(result['balance'])
         return result['balance']
 
     @log
+    @tracks_balance
     def sell(self, itemid: int, assetid: int, price: float) -> 'SellResult':
         """Создать предложение о продаже определённого предмета.
 
@@ -156,6 +170,7 @@ class Client(TraderClientObject):
         return SellResult.de_json(result, self)
 
     @log
+    @tracks_balance
     def buy(self, _id: Union[int, str], _type: int, price: float, currency: int = 1) -> 'BuyResult':
         """Создать предложение о покупке предмета по строго указанной цене.
 
@@ -196,6 +211,7 @@ class Client(TraderClientObject):
         return BuyResult.de_json(result, self)
 
     @log
+    @tracks_balance
     def create_buy_order(self, gid: int, price: float, *, count: int = 1) -> 'BuyOrderResult':
         """Создать заявку на покупку предмета с определённым GID.
 
@@ -233,6 +249,7 @@ class Client(TraderClientObject):
         return BuyOrderResult.de_json(result, self)
 
     @log
+    @tracks_balance
     def multi_buy(self, gid: int, max_price: float, count: int) -> 'MultiBuyResult':
         """Создать запрос о покупке нескольких предметов с определённым GID.
 
@@ -273,6 +290,7 @@ class Client(TraderClientObject):
         return MultiBuyResult.de_json(result, self)
 
     @log
+    @tracks_balance
     def edit_price(self, _id: int, price: float) -> 'EditPriceResult':
         """Редактировать цену предмета/заявки на покупку.
 
@@ -302,6 +320,7 @@ class Client(TraderClientObject):
         return EditPriceResult.de_json(result, self)
 
     @log
+    @tracks_balance
     def delete_item(self, _id: int) -> 'DeleteItemResult':
         """Снять предмет с продажи/заявку на покупку.
 
@@ -326,6 +345,7 @@ class Client(TraderClientObject):
         return DeleteItemResult.de_json(result, self)
 
     @log
+    @tracks_balance
     def get_down_orders(self, gameid: int, *, order_type: LiteralString = 'sell') -> 'GetDownOrdersResult':
         """Снять все заявки на продажу/покупку предметов.
 
@@ -454,7 +474,7 @@ class Client(TraderClientObject):
                 или с момента его подключения ещё не прошло 7 дней.
         """
 
-        url = self.base_url + 'exchange/'
+        url = self.base_url + 'exchangep2p/'
         result = (self._httpx_client or httpx).get(
             url,
             headers=self.headers
@@ -553,7 +573,13 @@ class Client(TraderClientObject):
         return WebSocketToken.de_json(result, self)
 
     @log
-    def get_inventory(self, gameid: int, *, status: Optional[Sequence[int]] = None) -> 'Inventory':
+    def get_inventory(
+            self,
+            gameid: int,
+            *,
+            status: Optional[Sequence[int]] = None,
+            compact: bool = False
+    ) -> Union['Inventory', 'CompactInventory']:
         """Получить инвентарь клиента, включая заявки на покупку и купленные предметы.
 
         По умолчанию возвращает список предметов из инвентаря Steam, которые НЕ выставлены на продажу.
@@ -569,9 +595,12 @@ class Client(TraderClientObject):
                 2 - Передать
                 3 - Ожидается
                 4 - Заявка на покупку
+            compact (:obj:`bool`): Вернуть инвентарь в компактном виде :class:`steam_trader.CompactInventory`.
+                Рекомендуется для инвентарей с десятками тысяч предметов. По умолчанию False.
 
         Returns:
-            :class:`steam_trader.Inventory`: Инвентарь клиента, включая заявки на покупку и купленные предметы.
+            Union[:class:`steam_trader.Inventory`, :class:`steam_trader.CompactInventory`]: Инвентарь клиента,
+                включая заявки на покупку и купленные предметы.
 
         Raises:
             UnsupportedAppID: Указан недействительный gameid.
@@ -595,6 +624,8 @@ class Client(TraderClientObject):
             params=params,
             headers=self.headers
         ).json()
+        if compact:
+            return CompactInventory.de_json(result, status)
         return Inventory.de_json(result, status, self)
 
     @log
@@ -797,6 +828,7 @@ class Client(TraderClientObject):
         return InventoryState.de_json(result, self)
 
     @log
+    @tracks_balance
     def trigger_alt_web_socket(self) -> Optional['AltWebSocket']:
         """Создать запрос альтернативным WebSocket.
         Для поддержания активного соединения нужно делать этот запрос каждые 2 минуты.
@@ -13,6 +13,9 @@ from ._sale import SellResult
 from ._edit_item import EditPriceResult, DeleteItemResult, GetDownOrdersResult
 from ._item_info import MinPrices, ItemInfo, OrderBook
 from ._trade import ItemsForExchange, ExchangeResult, ExchangeP2PResult
+from ._scheduler import RequestScheduler
+from ._compact_inventory import CompactInventory
+from ._balance import BalanceCache, tracks_balance_async
 
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -45,6 +48,10 @@ class ClientAsync(TraderClientObject):
         base_url (:obj:`str`, optional): Ссылка на API Steam Trader.
         headers (:obj:`dict`, optional): Словарь, содержащий сведения об устройстве, с которого выполняются запросы.
             Используется при каждом запросе на сайт.
+        scheduler (:class:`steam_trader.api.RequestScheduler`, optional): Планировщик запросов. Если указан,
+            торговые запросы отправляются вне очереди, а остальные делят общий лимит частоты.
+        balance_ttl (:obj:`float`, optional): Если указан, баланс кэшируется и сверяется с сайтом не чаще,
+            чем раз в balance_ttl секунд. Между сверками он изменяется локально по результатам покупок и продаж.
         **kwargs: Будут переданы httpx клиенту. Например timeout.
 
     Attributes:
@@ -53,6 +60,8 @@ class ClientAsync(TraderClientObject):
         base_url (:obj:`str`, optional): Ссылка на API Steam Trader.
         headers (:obj:`dict`, optional): Словарь, содержащий сведения об устройстве, с которого выполняются запросы.
             Используется при каждом запросе на сайт.
+        scheduler (:class:`steam_trader.api.RequestScheduler`, optional): Планировщик запросов.
+        balance_cache (:class:`steam_trader.api.BalanceCache`, optional): Кэш баланса.
 
     Raises:
         BadRequestError: Неправильный запрос.
@@ -63,7 +72,9 @@ class ClientAsync(TraderClientObject):
     __slots__ = [
         'sessionid',
         'proxy',
-        'base_url'
+        'base_url',
+        'scheduler',
+        'balance_cache'
     ]
 
     def __init__(
@@ -73,6 +84,8 @@ class ClientAsync(TraderClientObject):
             proxy: Optional[str] = None,
             base_url: Optional[str] = None,
             headers: Optional[dict] = None,
+            scheduler: Optional['RequestScheduler'] = None,
+            balance_ttl: Optional[float] = None,
             **kwargs
     ) -> None:
 
@@ -92,10 +105,19 @@ class ClientAsync(TraderClientObject):
         self.headers = headers
 
         self.proxy = proxy
+        self.scheduler = scheduler
+        self.balance_cache = BalanceCache(balance_ttl) if balance_ttl is not None else None
         self.kwargs = kwargs
 
     async def __aenter__(self) -> 'ClientAsync':
-        self._async_client = httpx.AsyncClient(proxy=self.proxy, **self.kwargs)
+        kwargs = self.kwargs
+        if self.scheduler is not None:
+            event_hooks = kwargs.get('event_hooks', {})
+            kwargs = kwargs | {'event_hooks': event_hooks | {
+                'request': [self.scheduler.on_request, *event_hooks.get('request', [])],
+                'response': [self.scheduler.on_response, *event_hooks.get('response', [])]
+            }}
+        self._async_client = httpx.AsyncClient(proxy=self.proxy, **kwargs)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -103,7 +125,10 @@ class ClientAsync(TraderClientObject):
 
     @property
     async def balance(self) -> float:
-        """Баланс клиента."""
+        """Баланс клиента. Если указан balance_ttl, запрос выполняется только при устаревшем кэше."""
+
+        if self.balance_cache is not None and (balance := self.balance_cache.get()) is not None:
+            return balance
 
         url = self.base_url + 'getbalance/'
         result = await self._async_client.get(
@@ -117,9 +142,12 @@ class ClientAsync(TraderClientObject):
                     raise Unauthorized('Неправильный api-токен.')
                 case 429:
                     raise TooManyRequests('Вы отправили слишком много запросов.')
+        if self.balance_cache is not None:
+            self.balance_cache.set(result['balance'])
         return result['balance']
 
     @log
+    @tracks_balance_async
     async def sell(self, itemid: int, assetid: int, price: float) -> 'SellResult':
         """Создать предложение о продаже определённого предмета.
 
@@ -156,6 +184,7 @@ class ClientAsync(TraderClientObject):
         return SellResult.de_json(result.json(), self)
 
     @log
+    @tracks_balance_async
     async def buy(self, _id: Union[int, str], _type: int, price: float, currency: int = 1) -> 'BuyResult':
         """Создать предложение о покупке предмета по строго указанной цене.
 
@@ -196,6 +225,7 @@ class ClientAsync(TraderClientObject):
         return BuyResult.de_json(result.json(), self)
 
     @log
+    @tracks_balance_async
     async def create_buy_order(self, gid: int, price: float, *, count: int = 1) -> 'BuyOrderResult':
         """Создать заявку на покупку предмета с определённым GID.
 
@@ -233,6 +263,7 @@ class ClientAsync(TraderClientObject):
         return BuyOrderResult.de_json(result.json(), self)
 
     @log
+    @tracks_balance_async
     async def multi_buy(self, gid: int, max_price: float, count: int) -> 'MultiBuyResult':
         """Создать запрос о покупке нескольких предметов с определённым GID.
 
@@ -273,6 +304,7 @@ class ClientAsync(TraderClientObject):
         return MultiBuyResult.de_json(result.json(), self)
 
     @log
+    @tracks_balance_async
     async def edit_price(self, _id: int, price: float) -> 'EditPriceResult':
         """Редактировать цену предмета/заявки на покупку.
 
@@ -302,6 +334,7 @@ class ClientAsync(TraderClientObject):
         return EditPriceResult.de_json(result.json(), self)
 
     @log
+    @tracks_balance_async
     async def delete_item(self, _id: int) -> 'DeleteItemResult':
         """Снять предмет с продажи/заявку на покупку.
 
@@ -326,6 +359,7 @@ class ClientAsync(TraderClientObject):
         return DeleteItemResult.de_json(result.json(), self)
 
     @log
+    @tracks_balance_async
     async def get_down_orders(self, gameid: int, *, order_type: LiteralString = 'sell') -> 'GetDownOrdersResult':
         """Снять все заявки на продажу/покупку предметов.
 
@@ -453,7 +487,7 @@ class ClientAsync(TraderClientObject):
                 или с момента его подключения ещё не прошло 7 дней.
         """
 
-        url = self.base_url + 'exchange/'
+        url = self.base_url + 'exchangep2p/'
         result = await self._async_client.get(
             url,
             headers=self.headers
@@ -551,7 +585,13 @@ class ClientAsync(TraderClientObject):
         return WebSocketToken.de_json(result.json(), self)
 
     @log
-    async def get_inventory(self, gameid: int, *, status: Optional[Sequence[int]] = None) -> 'Inventory':
+    async def get_inventory(
+            self,
+            gameid: int,
+            *,
+            status: Optional[Sequence[int]] = None,
+            compact: bool = False
+    ) -> Union['Inventory', 'CompactInventory']:
         """Получить инвентарь клиента, включая заявки на покупку и купленные предметы.
 
         По умолчанию возвращает список предметов из инвентаря Steam, которые НЕ выставлены на продажу.
@@ -567,9 +607,12 @@ class ClientAsync(TraderClientObject):
                 2 - Передать
                 3 - Ожидается
                 4 - Заявка на покупку
+            compact (:obj:`bool`): Вернуть инвентарь в компактном виде :class:`steam_trader.CompactInventory`.
+                Рекомендуется для инвентарей с десятками тысяч предметов. По умолчанию False.
 
         Returns:
-            :class:`steam_trader.Inventory`: Инвентарь клиента, включая заявки на покупку и купленные предметы.
+            Union[:class:`steam_trader.Inventory`, :class:`steam_trader.CompactInventory`]: Инвентарь клиента,
+                включая заявки на покупку и купленные предметы.
 
         Raises:
             UnsupportedAppID: Указан недействительный gameid.
@@ -593,6 +636,8 @@ class ClientAsync(TraderClientObject):
             params=params,
             headers=self.headers
         )
+        if compact:
+            return CompactInventory.de_json(result.json(), status)
         return Inventory.de_json(result.json(), status, self)
 
     @log
@@ -807,6 +852,7 @@ class ClientAsync(TraderClientObject):
         return InventoryState.de_json(result.json(), self)
 
     @log
+    @tracks_balance_async
     async def trigger_alt_web_socket(self) -> Optional['AltWebSocket']:
         """Создать запрос альтернативным WebSocket.
         Для поддержания активного соединения нужно делать этот запрос каждые 2 минуты.
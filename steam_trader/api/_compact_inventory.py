@@ -0,0 +1,305 @@
+import math
+import itertools
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Optional, Union
+
+from ._misc import InventoryItem
+from steam_trader.exceptions import BadRequestError, Unauthorized, TooManyRequests
+
+_NONE = -2 ** 63
+
+COLUMNS: dict[str, str] = {
+    'id': 'q',
+    'assetid': 'q',
+    'gid': 'q',
+    'itemid': 'q',
+    'price': 'd',
+    'currency': 'q',
+    'timer': 'q',
+    'type': 'q',
+    'status': 'q',
+    'position': 'q',
+    'nc': 'q',
+    'percent': 'd',
+    'steam_item': 'b',
+    'nm': 'b'
+}
+"""Колонки компактного инвентаря и коды типов :mod:`array`. Пустые значения хранятся как -2**63 или NaN."""
+
+_STR_COLUMNS = frozenset({'assetid'})  # API возвращает строки, в колонке они хранятся числами
+
+
+def _pack(typecode: str, value) -> Union[int, float]:
+    if typecode == 'd':
+        return math.nan if value is None else float(value)
+    if typecode == 'b':
+        return bool(value)
+    return _NONE if value is None else int(value)
+
+
+def _unpack(typecode: str, value: Union[int, float]):
+    if typecode == 'd':
+        return None if math.isnan(value) else value
+    if typecode == 'b':
+        return bool(value)
+    return None if value == _NONE else value
+
+
+class InventoryRow:
+    """Класс, представляющий строку компактного инвентаря.
+
+    Поля читаются из колонок инвентаря при обращении и совпадают с полями :class:`steam_trader.InventoryItem`.
+    """
+
+    __slots__ = [
+        '_inventory',
+        '_index'
+    ]
+
+    def __init__(self, inventory: 'CompactInventory', index: int) -> None:
+        self._inventory = inventory
+        self._index = index
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in COLUMNS)
+        return f'InventoryRow({fields})'
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (InventoryRow, InventoryItem)):
+            return all(getattr(self, name) == getattr(other, name) for name in COLUMNS)
+        return NotImplemented
+
+    def to_item(self) -> 'InventoryItem':
+        """Создать полноценный объект предмета.
+
+        Returns:
+            :class:`steam_trader.InventoryItem`: Предмет в инвентаре.
+        """
+
+        return InventoryItem(**{name: getattr(self, name) for name in COLUMNS})
+
+
+def _column_property(name: str, typecode: str) -> property:
+    def getter(self: InventoryRow):
+        value = _unpack(typecode, self._inventory._columns[name][self._index])
+        return str(value) if value is not None and name in _STR_COLUMNS else value
+
+    return property(getter)
+
+
+for _name, _typecode in COLUMNS.items():
+    setattr(InventoryRow, _name, _column_property(_name, _typecode))
+
+
+class CompactInventory(Sequence):
+    """Класс, представляющий инвентарь клиента в компактном виде.
+
+    Вместо объекта на каждый предмет поля хранятся в типизированных массивах по колонкам, поэтому
+    большой инвентарь занимает в несколько раз меньше памяти и почти не создаёт работы сборщику мусора.
+    Строки создаются только при обращении и ведут себя как :class:`steam_trader.InventoryItem`.
+
+    Колонки поддерживают протокол буфера и могут быть переданы в ``numpy.frombuffer`` без копирования.
+
+    Attributes:
+        success (:obj:`bool`): Результат запроса.
+        count (:obj:`int`): Количество всех предметов в инвентаре Steam.
+        gameid (:obj:`int`): AppID игры к которой принадлежит инвентарь.
+        last_update (:obj:`int`): Timestamp последнего обновления инвентаря.
+    """
+
+    __slots__ = [
+        'success',
+        'count',
+        'gameid',
+        'last_update',
+        '_columns'
+    ]
+
+    def __init__(
+            self,
+            success: bool,
+            count: int,
+            gameid: int,
+            last_update: int,
+            columns: Optional[dict[str, array]] = None
+    ) -> None:
+        self.success = success
+        self.count = count
+        self.gameid = gameid
+        self.last_update = last_update
+        self._columns = columns if columns is not None else {name: array(code) for name, code in COLUMNS.items()}
+
+    @classmethod
+    def de_json(cls, data: dict, status: Optional[Sequence[int]] = None) -> 'CompactInventory':
+        """Десериализация объекта.
+
+        Args:
+            data (:obj:`dict`): Поля и значения десериализуемого объекта.
+            status (Sequence[:obj:`int`], optional): Статусы предметов, которые нужно оставить.
+
+        Returns:
+            :class:`steam_trader.CompactInventory`: Инвентарь клиента.
+        """
+
+        if not data['success']:
+            match data.get('code'):
+                case 400:
+                    raise BadRequestError('Неправильный запрос.')
+                case 401:
+                    raise Unauthorized('Неправильный api-токен.')
+                case 429:
+                    raise TooManyRequests('Вы отправили слишком много запросов.')
+
+        inventory = cls(data['success'], data['count'], data['game'], data['last_update'])
+        inventory.extend(
+            item for item in data['items'] if status is None or item['status'] in status
+        )
+        return inventory
+
+    @classmethod
+    def from_items(
+            cls,
+            items: Iterable[Union['InventoryItem', dict]],
+            *,
+            success: bool = True,
+            count: Optional[int] = None,
+            gameid: int = 0,
+            last_update: int = 0
+    ) -> 'CompactInventory':
+        """Создать компактный инвентарь из предметов.
+
+        Args:
+            items (Iterable[Union[:class:`steam_trader.InventoryItem`, :obj:`dict`]]): Предметы.
+
+        Returns:
+            :class:`steam_trader.CompactInventory`: Инвентарь клиента.
+        """
+
+        inventory = cls(success, 0, gameid, last_update)
+        inventory.extend(items)
+        if count is None:
+            count = len(inventory)
+        inventory.count = count
+        return inventory
+
+    def extend(self, items: Iterable[Union['InventoryItem', dict]]) -> None:
+        """Добавить предметы.
+
+        Args:
+            items (Iterable[Union[:class:`steam_trader.InventoryItem`, :obj:`dict`]]): Предметы или их поля.
+        """
+
+        columns = self._columns
+        for item in items:
+            if not isinstance(item, dict):
+                item = {name: getattr(item, name) for name in COLUMNS}
+            for name, typecode in COLUMNS.items():
+                columns[name].append(_pack(typecode, item.get(name)))
+
+    @property
+    def items(self) -> 'CompactInventory':
+        """Последовательность строк инвентаря. Для совместимости с :class:`steam_trader.Inventory`."""
+
+        return self
+
+    def __len__(self) -> int:
+        return len(self._columns['itemid'])
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return self.select(range(len(self))[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Индекс вне диапазона инвентаря.')
+        return InventoryRow(self, index)
+
+    def __iter__(self) -> Iterator[InventoryRow]:
+        return (InventoryRow(self, i) for i in range(len(self)))
+
+    def __repr__(self) -> str:
+        return (
+            f'CompactInventory(success={self.success!r}, count={self.count!r}, gameid={self.gameid!r}, '
+            f'last_update={self.last_update!r}, items={len(self)})'
+        )
+
+    def column(self, name: str) -> array:
+        """Получить колонку без копирования.
+
+        Args:
+            name (:obj:`str`): Название поля. См :data:`COLUMNS`.
+
+        Returns:
+            :class:`array.array`: Колонка. Пустые значения хранятся как -2**63 или NaN.
+
+        Raises:
+            ValueError: Неизвестное поле.
+        """
+
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise ValueError(f'Недопустимое значение name :: {name}') from None
+
+    def mask(
+            self,
+            *,
+            status: Optional[Sequence[int]] = None,
+            type: Optional[int] = None,
+            gid: Optional[int] = None,
+            min_price: Optional[float] = None,
+            max_price: Optional[float] = None
+    ) -> list[bool]:
+        """Рассчитать, какие строки подходят под условия, не создавая строк.
+
+        Args:
+            status (Sequence[:obj:`int`], optional): Допустимые статусы.
+            type (:obj:`int`, optional): Тип предмета. 0 - продажа, 1 - покупка.
+            gid (:obj:`int`, optional): ID группы предметов.
+            min_price (:obj:`float`, optional): Минимальная цена включительно.
+            max_price (:obj:`float`, optional): Максимальная цена включительно.
+
+        Returns:
+            list[:obj:`bool`]: Флаги строк.
+        """
+
+        columns = self._columns
+        mask = [True] * len(self)
+        if status is not None:
+            status = set(status)
+            mask = [m and s in status for m, s in zip(mask, columns['status'])]
+        if type is not None:
+            mask = [m and t == type for m, t in zip(mask, columns['type'])]
+        if gid is not None:
+            mask = [m and g == gid for m, g in zip(mask, columns['gid'])]
+        if min_price is not None:
+            mask = [m and p >= min_price for m, p in zip(mask, columns['price'])]  # NaN не проходит сравнение
+        if max_price is not None:
+            mask = [m and p <= max_price for m, p in zip(mask, columns['price'])]
+        return mask
+
+    def filter(self, **kwargs) -> 'CompactInventory':
+        """Выбрать строки, подходящие под условия. Аргументы совпадают с :meth:`mask`.
+
+        Returns:
+            :class:`steam_trader.CompactInventory`: Новый инвентарь с выбранными строками.
+        """
+
+        return self.select(itertools.compress(range(len(self)), self.mask(**kwargs)))
+
+    def select(self, indices: Iterable[int]) -> 'CompactInventory':
+        """Выбрать строки по индексам.
+
+        Args:
+            indices (Iterable[:obj:`int`]): Индексы строк.
+
+        Returns:
+            :class:`steam_trader.CompactInventory`: Новый инвентарь с выбранными строками.
+        """
+
+        indices = list(indices)
+        columns = {
+            name: array(COLUMNS[name], [column[i] for i in indices]) for name, column in self._columns.items()
+        }
+        return CompactInventory(self.success, self.count, self.gameid, self.last_update, columns)
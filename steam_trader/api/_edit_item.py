@@ -24,15 +24,12 @@ class EditPriceResult(TraderClientObject):
             Указывается, если 'fast_execute' = true.
         percent (:obj:`float`, optional): Размер комиссии/скидки в процентах, за которую был продан/куплен предмет.
             Указывается, если 'fast_execute' = true.
-        client (Union[:class:`steam_trader.Client`, :class:`steam_trader.ClientAsync`, :obj:`None`]):
-            Клиент Steam Trader.
     """
 
     success: bool
     type: int
     position: int
     fast_execute: bool
-    client: Union['Client', 'ClientAsync', None]
     new_id: Optional[int] = None
     price: Optional[float] = None
     percent: Optional[float] = None
@@ -63,7 +60,7 @@ class EditPriceResult(TraderClientObject):
 
         data = super(EditPriceResult, cls).de_json(data)
 
-        return cls(client=client, **data)
+        return cls(**data)
 
 @dataclass(slots=True)
 class DeleteItemResult(TraderClientObject):
@@ -76,8 +73,6 @@ class DeleteItemResult(TraderClientObject):
         has_p2p_ex (:obj:`bool`): Есть ли доступный P2P обмен.
         total_fines (:obj:`int`): Общее количество штрафных баллов.
         fine_date (:obj:`int`, optional): Дата снятия штрафных баллов. Если None - штрафных баллов нет.
-        client (Union[:class:`steam_trader.Client`, :class:`steam_trader.ClientAsync`, :obj:`None`]):
-            Клиент Steam Trader.
     """
 
     success: bool
@@ -86,7 +81,6 @@ class DeleteItemResult(TraderClientObject):
     has_p2p_ex: bool
     total_fines: int
     fine_date: Optional[int]
-    client: Union['Client', 'ClientAsync', None]
 
     @classmethod
     def de_json(
@@ -110,7 +104,7 @@ class DeleteItemResult(TraderClientObject):
 
         data = super(DeleteItemResult, cls).de_json(data)
 
-        return cls(client=client, **data)
+        return cls(**data)
 
 @dataclass(slots=True)
 class GetDownOrdersResult(TraderClientObject):
@@ -120,14 +114,11 @@ class GetDownOrdersResult(TraderClientObject):
         success (:obj:`bool`): Результат запроса.
         count (:obj:`int`): Количество удалённых предложений.
         ids (Sequence[:obj:`int`]): Список из ID удалённых предложений.
-        client (Union[:class:`steam_trader.Client`, :class:`steam_trader.ClientAsync`, :obj:`None`]):
-            Клиент Steam Trader.
     """
 
     success: bool
     count: int
     ids: Sequence[int]
-    client: Union['Client', 'ClientAsync', None]
 
     @classmethod
     def de_json(
@@ -151,4 +142,4 @@ class GetDownOrdersResult(TraderClientObject):
 
         data = super(GetDownOrdersResult, cls).de_json(data)
 
-        return cls(client=client, **data)
+        return cls(**data)
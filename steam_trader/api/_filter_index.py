@@ -0,0 +1,327 @@
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Optional, Union
+
+from steam_trader.constants import FILTERS_BY_APPID
+from steam_trader.exceptions import UnsupportedAppID
+from ._misc import Filter, Filters
+
+
+def _iter_bits(bitset: int) -> Iterator[int]:
+    """Перебрать номера установленных битов числа по возрастанию."""
+
+    # Проход по строковому представлению линеен от длины числа, в отличие от многократного x & -x.
+    reversed_bits = bin(bitset)[:1:-1]
+    i = reversed_bits.find('1')
+    while i != -1:
+        yield i
+        i = reversed_bits.find('1', i + 1)
+
+
+class FilterEncoder:
+    """Класс, представляющий плотное битовое представление фильтров одной игры.
+
+    Каждой паре (категория, ID фильтра) присваивается свой бит, поэтому фильтры предмета хранятся одним числом,
+    а проверка соответствия сводится к побитовым операциям. Категории соответствуют полям
+    :class:`steam_trader.Filters`. Изначально биты присваиваются ID из steam_trader.constants,
+    неизвестные ID получают новые биты при первом появлении. Уже присвоенные биты никогда не меняются.
+
+    Args:
+        gameid (:obj:`int`): AppID приложения в Steam.
+        categories (Mapping[:obj:`str`, Sequence[:obj:`int`]], optional): Категории и ID фильтров.
+            По умолчанию берутся из steam_trader.constants.FILTERS_BY_APPID.
+
+    Attributes:
+        gameid (:obj:`int`): AppID приложения в Steam.
+
+    Raises:
+        UnsupportedAppID: Для игры нет известных фильтров и категории не указаны.
+    """
+
+    __slots__ = [
+        'gameid',
+        '_bits',
+        '_category_masks'
+    ]
+
+    def __init__(self, gameid: int, categories: Optional[Mapping[str, Sequence[int]]] = None) -> None:
+        if categories is None:
+            try:
+                categories = FILTERS_BY_APPID[gameid]
+            except KeyError:
+                raise UnsupportedAppID(f'Игра с AppID {gameid}, в данный момент не поддерживается.')
+
+        self.gameid = gameid
+        self._bits: dict[tuple[str, int], int] = {}
+        self._category_masks: dict[str, int] = {}
+
+        for category, ids in categories.items():
+            self._category_masks.setdefault(category, 0)
+            for _id in ids:
+                self.bit(category, _id)
+
+    def __len__(self) -> int:
+        return len(self._bits)
+
+    @property
+    def categories(self) -> Sequence[str]:
+        """Известные категории фильтров."""
+
+        return tuple(self._category_masks)
+
+    def bit(self, category: str, filter_id: int) -> int:
+        """Получить номер бита фильтра. Неизвестному фильтру присваивается новый бит.
+
+        Args:
+            category (:obj:`str`): Категория фильтра (название поля в :class:`steam_trader.Filters`).
+            filter_id (:obj:`int`): ID фильтра.
+
+        Returns:
+            :obj:`int`: Номер бита.
+        """
+
+        key = (category, filter_id)
+        try:
+            return self._bits[key]
+        except KeyError:
+            bit = len(self._bits)
+            self._bits[key] = bit
+            self._category_masks[category] = self._category_masks.get(category, 0) | (1 << bit)
+            return bit
+
+    def category_mask(self, category: str) -> int:
+        """Получить маску всех известных фильтров категории.
+
+        Args:
+            category (:obj:`str`): Категория фильтра.
+
+        Returns:
+            :obj:`int`: Маска категории. 0, если категория неизвестна.
+        """
+
+        return self._category_masks.get(category, 0)
+
+    def encode(self, filters: Union['Filters', Mapping[str, Iterable[int]], None]) -> int:
+        """Преобразовать фильтры в битовую маску.
+
+        Args:
+            filters (Union[:class:`steam_trader.Filters`, Mapping[:obj:`str`, Iterable[:obj:`int`]], :obj:`None`]):
+                Фильтры предмета или словарь с парами категория/ID фильтров.
+
+        Returns:
+            :obj:`int`: Битовая маска фильтров.
+        """
+
+        mask = 0
+        for category, ids in self._iter_categories(filters):
+            for _id in ids:
+                mask |= 1 << self.bit(category, _id)
+        return mask
+
+    def encode_query(self, filters: Union['Filters', Mapping[str, Iterable[int]], None]) -> tuple[int, ...]:
+        """Преобразовать фильтры в запрос для :meth:`matches`.
+
+        Внутри одной категории достаточно совпадения любого фильтра, между категориями должны совпасть все.
+        Пустые категории не учитываются.
+
+        Args:
+            filters (Union[:class:`steam_trader.Filters`, Mapping[:obj:`str`, Iterable[:obj:`int`]], :obj:`None`]):
+                Требуемые фильтры.
+
+        Returns:
+            tuple[:obj:`int`, ...]: Маски категорий запроса.
+        """
+
+        query = []
+        for category, ids in self._iter_categories(filters):
+            mask = 0
+            for _id in ids:
+                mask |= 1 << self.bit(category, _id)
+            if mask:
+                query.append(mask)
+        return tuple(query)
+
+    def decode(self, mask: int) -> 'Filters':
+        """Преобразовать битовую маску обратно в фильтры. Заполняется только поле id.
+
+        Args:
+            mask (:obj:`int`): Битовая маска фильтров.
+
+        Returns:
+            :class:`steam_trader.Filters`: Фильтры.
+        """
+
+        by_bit = {bit: key for key, bit in self._bits.items()}
+        data: dict[str, list[Filter]] = {}
+        for bit in _iter_bits(mask):
+            category, _id = by_bit[bit]
+            data.setdefault(category, []).append(Filter(id=_id))
+        return Filters(**data)
+
+    @staticmethod
+    def matches(mask: int, query: Sequence[int]) -> bool:
+        """Проверить, подходит ли маска предмета под запрос.
+
+        Args:
+            mask (:obj:`int`): Битовая маска фильтров предмета.
+            query (Sequence[:obj:`int`]): Запрос, полученный через :meth:`encode_query`.
+
+        Returns:
+            :obj:`bool`: Истина, если предмет подходит.
+        """
+
+        for category_mask in query:
+            if not mask & category_mask:
+                return False
+        return True
+
+    @staticmethod
+    def _iter_categories(
+            filters: Union['Filters', Mapping[str, Iterable[int]], None]
+    ) -> Iterator[tuple[str, Iterable[int]]]:
+
+        if filters is None:
+            return
+        if isinstance(filters, Mapping):
+            yield from filters.items()
+            return
+        for category in Filters.__slots__:
+            _filters = getattr(filters, category)
+            if _filters:
+                yield category, (_filter.id for _filter in _filters if _filter.id is not None)
+
+
+class FilterIndex:
+    """Класс, представляющий индекс каталога по фильтрам.
+
+    Для каждого бита фильтра хранится битовое множество строк каталога, в которых он встречается,
+    поэтому выборка вроде "все странные украшения для Солдата" выполняется объединением и пересечением чисел,
+    без обхода всех предметов.
+
+    Args:
+        encoder (:class:`steam_trader.FilterEncoder`): Кодировщик фильтров игры.
+
+    Attributes:
+        encoder (:class:`steam_trader.FilterEncoder`): Кодировщик фильтров игры.
+    """
+
+    __slots__ = [
+        'encoder',
+        '_rows',
+        '_gids',
+        '_masks',
+        '_postings',
+        '_alive'
+    ]
+
+    def __init__(self, encoder: 'FilterEncoder') -> None:
+        self.encoder = encoder
+        self._rows: dict[int, int] = {}
+        self._gids: list[int] = []
+        self._masks: list[int] = []
+        self._postings: dict[int, int] = {}
+        self._alive = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, gid: int) -> bool:
+        return gid in self._rows
+
+    def add(self, gid: int, filters: Union['Filters', Mapping[str, Iterable[int]], int, None]) -> None:
+        """Добавить или обновить предмет в индексе.
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+            filters (Union[:class:`steam_trader.Filters`, Mapping[:obj:`str`, Iterable[:obj:`int`]], :obj:`int`,
+                :obj:`None`]): Фильтры предмета или уже посчитанная битовая маска.
+        """
+
+        mask = filters if isinstance(filters, int) else self.encoder.encode(filters)
+
+        row = self._rows.get(gid)
+        if row is None:
+            row = len(self._gids)
+            self._rows[gid] = row
+            self._gids.append(gid)
+            self._masks.append(0)
+            self._alive |= 1 << row
+
+        row_bit = 1 << row
+        old_mask = self._masks[row]
+        for bit in _iter_bits(old_mask & ~mask):
+            self._postings[bit] &= ~row_bit
+        for bit in _iter_bits(mask & ~old_mask):
+            self._postings[bit] = self._postings.get(bit, 0) | row_bit
+        self._masks[row] = mask
+
+    def remove(self, gid: int) -> None:
+        """Удалить предмет из индекса. Строка предмета не переиспользуется.
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+
+        Raises:
+            KeyError: Предмета нет в индексе.
+        """
+
+        row = self._rows.pop(gid)
+        row_bit = 1 << row
+        for bit in _iter_bits(self._masks[row]):
+            self._postings[bit] &= ~row_bit
+        self._masks[row] = 0
+        self._alive &= ~row_bit
+
+    def mask_of(self, gid: int) -> int:
+        """Получить битовую маску фильтров предмета.
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+
+        Returns:
+            :obj:`int`: Битовая маска фильтров.
+
+        Raises:
+            KeyError: Предмета нет в индексе.
+        """
+
+        return self._masks[self._rows[gid]]
+
+    def gids_with(self, category: str, filter_id: int) -> set[int]:
+        """Получить все предметы с определённым фильтром.
+
+        Args:
+            category (:obj:`str`): Категория фильтра.
+            filter_id (:obj:`int`): ID фильтра.
+
+        Returns:
+            set[:obj:`int`]: Множество GID.
+        """
+
+        return self._to_gids(self._postings.get(self.encoder.bit(category, filter_id), 0))
+
+    def select(self, filters: Union['Filters', Mapping[str, Iterable[int]], None]) -> set[int]:
+        """Выбрать предметы, подходящие под фильтры.
+
+        Внутри одной категории достаточно совпадения любого фильтра, между категориями должны совпасть все.
+
+        Args:
+            filters (Union[:class:`steam_trader.Filters`, Mapping[:obj:`str`, Iterable[:obj:`int`]], :obj:`None`]):
+                Требуемые фильтры. Если пусто, возвращаются все предметы.
+
+        Returns:
+            set[:obj:`int`]: Множество GID.
+        """
+
+        rows = self._alive
+        for category_mask in self.encoder.encode_query(filters):
+            category_rows = 0
+            for bit in _iter_bits(category_mask):
+                category_rows |= self._postings.get(bit, 0)
+            rows &= category_rows
+            if not rows:
+                break
+        return self._to_gids(rows)
+
+    def _to_gids(self, rows: int) -> set[int]:
+        gids = self._gids
+        return {gids[row] for row in _iter_bits(rows)}
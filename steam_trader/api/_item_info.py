@@ -22,8 +22,6 @@ class MinPrices(TraderClientObject):
         steam_price (:obj:`float`, optional): Минимальная цена в Steam. Может быть пустым.
         count_sell_offers (:obj:`int`): Количество предложений о продаже.
         count_buy_offers (:obj:`int`): Количество предложений о покупке.
-        client (Union[:class:`steam_trader.Client`, :class:`steam_trader.ClientAsync`, :obj:`None`]):
-            Клиент Steam Trader.
     """
 
     success: bool
@@ -32,7 +30,6 @@ class MinPrices(TraderClientObject):
     steam_price: Optional[float]
     count_sell_offers: int
     count_buy_offers: int
-    client: Union['Client', 'ClientAsync', None]
 
     @classmethod
     def de_json(
@@ -56,7 +53,7 @@ class MinPrices(TraderClientObject):
 
         data = super(MinPrices, cls).de_json(data)
 
-        return cls(client=client, **data)
+        return cls(**data)
 
 @dataclass(slots=True)
 class ItemInfo(TraderClientObject):
@@ -84,8 +81,6 @@ class ItemInfo(TraderClientObject):
         buy_offers (Sequnce[`steam_trader.BuyOffer`]): Последовательность с предложениями о покупке.
             От большего к меньшему.
         sell_history (Sequence[`steam_trader.SellHistoryItem`]): Последовательность истории продаж.
-        client (Union[:class:`steam_trader.Client`, :class:`steam_trader.ClientAsync`, :obj:`None`]):
-            Клиент Steam Trader.
     """
 
     success: bool
@@ -107,7 +102,6 @@ class ItemInfo(TraderClientObject):
     sell_offers: Sequence['SellOffer']
     buy_offers: Sequence['BuyOffer']
     sell_history: Sequence['SellHistoryItem']
-    client: Union['Client', 'ClientAsync', None]
 
     @classmethod
     def de_json(
@@ -129,20 +123,14 @@ class ItemInfo(TraderClientObject):
                 case 2:
                     raise UnknownItem('Неизвестный предмет.')
 
-        data['filters'] = Filters.de_json(data['filters'])
+        data = super(ItemInfo, cls).de_json(data, values={
+            'filters': Filters.de_json(data['filters']),
+            'sell_offers': [SellOffer.de_json(offer) for offer in data['sell_offers']],
+            'buy_offers': [BuyOffer.de_json(offer) for offer in data['buy_offers']],
+            'sell_history': [SellHistoryItem.de_json(item) for item in data['sell_history']]
+        })
 
-        for i, offer in enumerate(data['sell_offers']):
-            data['sell_offers'][i] = SellOffer.de_json(offer)
-
-        for i, offer in enumerate(data['buy_offers']):
-            data['buy_offers'][i] = BuyOffer.de_json(offer)
-
-        for i, item in enumerate(data['sell_history']):
-            data['sell_history'][i] = SellHistoryItem.de_json(item)
-
-        data = super(ItemInfo, cls).de_json(data)
-
-        return cls(client=client, **data)
+        return cls(**data)
 
 @dataclass(slots=True)
 class OrderBook(TraderClientObject):
@@ -156,8 +144,6 @@ class OrderBook(TraderClientObject):
             Каждый элемент в списке является массивом, где первый элемент - это цена, а второй - количество заявок.
         total_sell (:obj:`int`): Количество всех заявок на продажу.
         total_buy (:obj:`int`): Количество всех заявок на покупку.
-        client (Union[:class:`steam_trader.Client`, :class:`steam_trader.ClientAsync`, :obj:`None`]):
-            Клиент Steam Trader.
     """
 
     success: bool
@@ -165,7 +151,6 @@ class OrderBook(TraderClientObject):
     buy: Sequence[Sequence[int, int]]
     total_sell: int
     total_buy: int
-    client: Union['Client', 'ClientAsync', None]
 
     @classmethod
     def de_json(
@@ -187,4 +172,4 @@ class OrderBook(TraderClientObject):
 
         data = super(OrderBook, cls).de_json(data)
 
-        return cls(client=client, **data)
+        return cls(**data)
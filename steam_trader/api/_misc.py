@@ -190,56 +190,20 @@ class Filters(TraderClientObject):
             :class:`steam_trader.Filters`: Фильтры.
         """
 
-        try:
-            # TF2
-            data.update({  # Затмевает встроенное имя class
-                'used_by': data['class']
-            })
-
-            del data['class']
-
-            for i, _filter in enumerate(data['quality']):
-                data['quality'][i] = Filter.de_json(data['quality'][i])
-
-            for i, _filter in enumerate(data['type']):
-                data['type'][i] = Filter.de_json(data['type'][i])
-
-            for i, _filter in enumerate(data['used_by']):
-                data['used_by'][i] = Filter.de_json(data['used_by'][i])
-
-            for i, _filter in enumerate(data['craft']):
-                data['craft'][i] = Filter.de_json(data['craft'][i])
-
-        except KeyError:
-            try:
-                # SteamGift
-                for i, _filter in enumerate(data['region']):
-                    data['region'][i] = Filter.de_json(data['region'][i])
-
-                for i, _filter in enumerate(data['genre']):
-                    data['genre'][i] = Filter.de_json(data['genre'][i])
-
-                for i, _filter in enumerate(data['mode']):
-                    data['mode'][i] = Filter.de_json(data['mode'][i])
-
-                for i, _filter in enumerate(data['trade']):
-                    data['trade'][i] = Filter.de_json(data['trade'][i])
-
-            except KeyError:
-                # DOTA2
-                for i, _filter in enumerate(data['rarity']):
-                    data['rarity'][i] = Filter.de_json(data['rarity'][i])
-
-                for i, _filter in enumerate(data['quality']):
-                    data['quality'][i] = Filter.de_json(data['quality'][i])
-
-                for i, _filter in enumerate(data['type']):
-                    data['type'][i] = Filter.de_json(data['type'][i])
-
-                for i, _filter in enumerate(data['hero']):
-                    data['hero'][i] = Filter.de_json(data['hero'][i])
-
-        data = super(Filters, cls).de_json(data)
+        if 'class' in data:
+            keys = ('quality', 'type', 'class', 'craft')  # TF2
+        elif 'region' in data:
+            keys = ('region', 'genre', 'mode', 'trade')  # SteamGift
+        else:
+            keys = ('rarity', 'quality', 'type', 'hero')  # DOTA2
+
+        values = {
+            # Затмевает встроенное имя class
+            'used_by' if key == 'class' else key: [Filter.de_json(_filter) for _filter in data[key]]
+            for key in keys
+        }
+
+        data = super(Filters, cls).de_json(data, values=values, ignore=('class',))
 
         return cls(**data)
 
@@ -63,15 +63,14 @@ class P2PSendObject(TraderClientObject):
             client: Union['Client', 'ClientAsync', None] = None
     ) -> 'P2PSendObject':
 
-        data.update({  # перенос с camleCase на snake_case
-            'trade_link': data['tradeLink'],
-            'trade_offer': data['tradeOffer']
-        })
-        del data['tradeLink'], data['tradeOffer']
-
-        data['trade_offer'] = P2PTradeOffer.de_json(data['trade_offer'])
-
-        data = super(P2PSendObject, cls).de_json(data)
+        data = super(P2PSendObject, cls).de_json(
+            data,
+            values={  # перенос с camleCase на snake_case
+                'trade_link': data['tradeLink'],
+                'trade_offer': P2PTradeOffer.de_json(data['tradeOffer'])
+            },
+            ignore=('tradeLink', 'tradeOffer')
+        )
 
         return cls(**data)
 
@@ -98,16 +97,15 @@ class P2PReceiveObject(TraderClientObject):
             client: Union['Client', 'ClientAsync', None] = None
     ) -> 'P2PReceiveObject':
 
-        data.update({  # перенос с camleCase на snake_case
-            'offerid': data['offerId'],
-            'partner_steamid': data['partnerSteamId']
-        })
-        del data['offerId'], data['partnerSteamId']
-
-        for i, item in enumerate(data['items']):
-            data['items'][i] = ExchangeItem.de_json(item)
-
-        data = super(P2PReceiveObject, cls).de_json(data)
+        data = super(P2PReceiveObject, cls).de_json(
+            data,
+            values={  # перенос с camleCase на snake_case
+                'offerid': data['offerId'],
+                'partner_steamid': data['partnerSteamId'],
+                'items': [ExchangeItem.de_json(item) for item in data['items']]
+            },
+            ignore=('offerId', 'partnerSteamId')
+        )
 
         return cls(**data)
 
@@ -132,12 +130,13 @@ class P2PConfirmObject(TraderClientObject):
             client: Union['Client', 'ClientAsync', None] = None
     ) -> 'P2PConfirmObject':
 
-        data.update({  # перенос с camleCase на snake_case
-            'offerid': data['offerId'],
-            'partner_steamid': data['partnerSteamId']
-        })
-        del data['offerId'], data['partnerSteamId']
-
-        data = super(P2PConfirmObject, cls).de_json(data)
+        data = super(P2PConfirmObject, cls).de_json(
+            data,
+            values={  # перенос с camleCase на snake_case
+                'offerid': data['offerId'],
+                'partner_steamid': data['partnerSteamId']
+            },
+            ignore=('offerId', 'partnerSteamId')
+        )
 
         return cls(**data)
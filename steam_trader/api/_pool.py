@@ -0,0 +1,180 @@
+import time
+from contextlib import AsyncExitStack
+from collections import deque
+from collections.abc import Sequence
+from typing import Optional, LiteralString
+
+import httpx
+
+from ._client_async import ClientAsync
+from ._scheduler import RequestScheduler
+from ._item_info import MinPrices, ItemInfo, OrderBook
+
+
+class ClientPool:
+    """Класс, представляющий пул асинхронных клиентов нескольких аккаунтов.
+
+    Каждый токен получает свой :class:`steam_trader.api.ClientAsync` с отдельными соединениями и своим
+    :class:`steam_trader.api.RequestScheduler`. Запросы рыночных данных, которые не зависят от аккаунта,
+    отправляются через клиент с наибольшим запасом лимита. Запросы к аккаунту выполняются через клиент
+    владельца, полученный по токену: ``pool[token].get_inventory(440)``.
+
+    Args:
+        tokens (Sequence[:obj:`str`]): Api-токены аккаунтов.
+        rate (:obj:`float`): Количество запросов в секунду для одного токена. По умолчанию 5.
+        burst (:obj:`int`, optional): Максимальное количество запросов одного токена подряд.
+        window (:obj:`float`): Период в секундах, за который считается пропускная способность. По умолчанию 60.
+        **kwargs: Будут переданы каждому клиенту. Например proxy или timeout.
+
+    Attributes:
+        clients (dict[:obj:`str`, :class:`steam_trader.api.ClientAsync`]): Клиенты по токенам.
+        window (:obj:`float`): Период в секундах, за который считается пропускная способность.
+        requests (dict[:obj:`str`, :obj:`int`]): Количество выполненных запросов по токенам.
+
+    Raises:
+        ValueError: Не указан ни один токен.
+    """
+
+    __slots__ = [
+        'clients',
+        'window',
+        'requests',
+        '_history',
+        '_order',
+        '_started',
+        '_stack'
+    ]
+
+    def __init__(
+            self,
+            tokens: Sequence[str],
+            *,
+            rate: float = 5,
+            burst: Optional[int] = None,
+            window: float = 60,
+            **kwargs
+    ) -> None:
+        if not tokens:
+            raise ValueError('Не указан ни один токен.')
+
+        self.window = window
+        self.requests: dict[str, int] = {}
+        self._history: deque[tuple[float, str]] = deque()
+        self._order: deque[str] = deque(tokens)
+        self._started = time.monotonic()
+        self._stack: Optional[AsyncExitStack] = None
+        self.clients: dict[str, ClientAsync] = {}
+
+        event_hooks = kwargs.pop('event_hooks', {})
+        for token in tokens:
+            self.requests[token] = 0
+            hooks = event_hooks | {'response': [self._counter(token), *event_hooks.get('response', [])]}
+            self.clients[token] = ClientAsync(
+                token,
+                scheduler=RequestScheduler(rate, burst),
+                event_hooks=hooks,
+                **kwargs
+            )
+
+    async def __aenter__(self) -> 'ClientPool':
+        async with AsyncExitStack() as stack:  # Если один клиент не открылся, уже открытые будут закрыты
+            for client in self.clients.values():
+                await stack.enter_async_context(client)
+            self._stack = stack.pop_all()
+        self._started = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._stack is not None:
+            stack, self._stack = self._stack, None
+            await stack.__aexit__(exc_type, exc_val, exc_tb)
+
+    def __getitem__(self, token: str) -> 'ClientAsync':
+        return self.clients[token]
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def route(self) -> 'ClientAsync':
+        """Выбрать клиент с наибольшим запасом лимита. При равенстве клиенты выбираются по кругу.
+
+        Returns:
+            :class:`steam_trader.api.ClientAsync`: Клиент.
+        """
+
+        token = max(self._order, key=lambda t: self.clients[t].scheduler.available())
+        self._order.remove(token)
+        self._order.append(token)
+        return self.clients[token]
+
+    def throughput(self, token: Optional[str] = None) -> float:
+        """Пропускная способность за последние window секунд. Если пул работает меньше window секунд,
+        количество запросов делится на время работы.
+
+        Args:
+            token (:obj:`str`, optional): Токен аккаунта. Если не указан, считается общая пропускная способность.
+
+        Returns:
+            :obj:`float`: Количество запросов в секунду.
+        """
+
+        now = time.monotonic()
+        self._prune(now)
+        period = min(self.window, now - self._started)
+        if period <= 0:
+            return 0.0
+        if token is None:
+            return len(self._history) / period
+        return sum(t == token for _, t in self._history) / period
+
+    async def get_min_prices(self, gid: int, currency: int = 1) -> 'MinPrices':
+        """Получить минимальные/максимальные цены предмета через любой аккаунт.
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+            currency (:obj:`int`): Валюта. Значение 1 - рубль.
+
+        Returns:
+            :class:`steam_trader.MinPrices`: Минимальные/максимальные цены предмета.
+        """
+
+        return await self.route().get_min_prices(gid, currency)
+
+    async def get_item_info(self, gid: int) -> 'ItemInfo':
+        """Получить информацию о группе предметов через любой аккаунт.
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+
+        Returns:
+            :class:`steam_trader.ItemInfo`: Информация о группе предметов.
+        """
+
+        return await self.route().get_item_info(gid)
+
+    async def get_order_book(self, gid: int, *, mode: LiteralString = 'all', limit: Optional[int] = None) -> 'OrderBook':
+        """Получить заявки о покупке/продаже предмета через любой аккаунт.
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+            mode (:obj:`str`): Режим отображения. 'all', 'sell' или 'buy'.
+            limit (:obj:`int`, optional): Количество заявок.
+
+        Returns:
+            :class:`steam_trader.OrderBook`: Заявки о покупке/продаже предмета.
+        """
+
+        return await self.route().get_order_book(gid, mode=mode, limit=limit)
+
+    def _counter(self, token: str):
+        async def on_response(response: httpx.Response) -> None:
+            now = time.monotonic()
+            self.requests[token] += 1
+            self._history.append((now, token))
+            self._prune(now)
+
+        return on_response
+
+    def _prune(self, now: float) -> None:
+        while self._history and self._history[0][0] < now - self.window:
+            self._history.popleft()
@@ -22,8 +22,6 @@ class SellResult(TraderClientObject):
             Указывается, если 'fast_execute' = True
          commission (:obj:`float`, optional): Размер комиссии в процентах, за которую был продан предмет.
             Указывается, если 'fast_execute' = True
-         client (Union[:class:`steam_trader.Client`, :class:`steam_trader.ClientAsync`, :obj:`None`]):
-            Клиент Steam Trader.
      """
 
     success: bool
@@ -31,7 +29,6 @@ class SellResult(TraderClientObject):
     position: int
     fast_execute: bool
     nc: str
-    client: Union['Client', 'ClientAsync', None]
     price: Optional[float] = None
     commission: Optional[float] = None
 
@@ -65,4 +62,4 @@ class SellResult(TraderClientObject):
 
         data = super(SellResult, cls).de_json(data)
 
-        return cls(client=client, **data)
+        return cls(**data)
@@ -0,0 +1,238 @@
+import asyncio
+import contextlib
+import contextvars
+from collections import deque
+from collections.abc import Iterator, Mapping
+from typing import Optional
+
+import httpx
+
+from steam_trader._rate_limit import AsyncRateLimiter
+
+PRIORITY_TRADE = 0
+"""Торговые запросы: покупка, продажа, изменение цены, снятие с продажи и обмены."""
+PRIORITY_ACCOUNT = 1
+"""Запросы к аккаунту: баланс, инвентарь, заявки, история операций."""
+PRIORITY_DATA = 2
+"""Сбор данных: минимальные цены, информация о предмете, стакан заявок."""
+
+ENDPOINT_PRIORITIES: dict[str, int] = {
+    'sale': PRIORITY_TRADE,
+    'buy': PRIORITY_TRADE,
+    'createbuyorder': PRIORITY_TRADE,
+    'multibuy': PRIORITY_TRADE,
+    'editprice': PRIORITY_TRADE,
+    'deleteitem': PRIORITY_TRADE,
+    'getdownorders': PRIORITY_TRADE,
+    'exchange': PRIORITY_TRADE,
+    'exchangep2p': PRIORITY_TRADE,
+    'getminprices': PRIORITY_DATA,
+    'iteminfo': PRIORITY_DATA,
+    'orderbook': PRIORITY_DATA
+}
+"""Классы приоритета методов API. Остальные методы относятся к PRIORITY_ACCOUNT."""
+
+_priority_override: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar('_priority_override', default=None)
+
+
+class RequestScheduler:
+    """Класс, представляющий планировщик запросов с общим ограничением частоты.
+
+    Запросы делятся на классы приоритета. Классы из ``strict`` обслуживаются строго в первую очередь,
+    поэтому торговые запросы не ждут, пока закончится сбор данных. Остальные классы делят оставшуюся
+    пропускную способность по алгоритму взвешенной справедливой очереди (WFQ) пропорционально своим весам.
+    Внутри класса запросы выполняются в порядке поступления.
+
+    Один планировщик можно передать нескольким клиентам с одним api-токеном, тогда они будут делить общий лимит.
+
+    Args:
+        rate (:obj:`float`): Количество запросов в секунду.
+        burst (:obj:`int`, optional): Максимальное количество запросов, которые можно отправить подряд.
+            По умолчанию равно 1.
+        weights (Mapping[:obj:`int`, :obj:`float`], optional): Веса классов приоритета.
+            По умолчанию PRIORITY_ACCOUNT получает вдвое больше запросов, чем PRIORITY_DATA.
+        strict (Sequence[:obj:`int`], optional): Классы, которые обслуживаются вне очереди.
+            По умолчанию только PRIORITY_TRADE.
+
+    Attributes:
+        weights (dict[:obj:`int`, :obj:`float`]): Веса классов приоритета.
+        strict (tuple[:obj:`int`, ...]): Классы, которые обслуживаются вне очереди, в порядке важности.
+
+    Raises:
+        ValueError: Указано неположительное значение rate, burst или веса.
+    """
+
+    __slots__ = [
+        'weights',
+        'strict',
+        '_limiter',
+        '_queues',
+        '_finish',
+        '_virtual_time',
+        '_dispatcher'
+    ]
+
+    def __init__(
+            self,
+            rate: float,
+            burst: Optional[int] = None,
+            *,
+            weights: Optional[Mapping[int, float]] = None,
+            strict: Optional[tuple[int, ...]] = None
+    ) -> None:
+        if weights is None:
+            weights = {PRIORITY_ACCOUNT: 2.0, PRIORITY_DATA: 1.0}
+        for priority, weight in weights.items():
+            if weight <= 0:
+                raise ValueError(f'Недопустимый вес класса {priority} :: {weight}')
+        if strict is None:
+            strict = (PRIORITY_TRADE,)
+
+        self.weights = dict(weights)
+        self.strict = tuple(sorted(strict))
+        self._limiter = AsyncRateLimiter(rate, burst)
+        self._queues: dict[int, deque[asyncio.Future]] = {}
+        self._finish: dict[int, float] = {}
+        self._virtual_time = 0.0
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    @property
+    def rate(self) -> float:
+        """Количество запросов в секунду."""
+
+        return self._limiter.rate
+
+    def pending(self, priority: Optional[int] = None) -> int:
+        """Количество запросов, ожидающих отправки.
+
+        Args:
+            priority (:obj:`int`, optional): Класс приоритета. Если не указан, считаются все классы.
+
+        Returns:
+            :obj:`int`: Количество ожидающих запросов.
+        """
+
+        if priority is not None:
+            return sum(not fut.done() for fut in self._queues.get(priority, ()))
+        return sum(not fut.done() for queue in self._queues.values() for fut in queue)
+
+    def available(self) -> float:
+        """Запас лимита: количество запросов, которые можно отправить сейчас, за вычетом ожидающих.
+
+        Returns:
+            :obj:`float`: Запас лимита. Отрицательный, если запросы ждут своей очереди.
+        """
+
+        return self._limiter.available() - self.pending()
+
+    async def acquire(self, priority: int = PRIORITY_ACCOUNT) -> None:
+        """Дождаться своей очереди на отправку запроса.
+
+        Args:
+            priority (:obj:`int`): Класс приоритета запроса.
+        """
+
+        if not self.pending() and self._limiter.available() >= 1:
+            self._limiter.delay()
+            return
+
+        fut = asyncio.get_running_loop().create_future()
+        queue = self._queues.setdefault(priority, deque())
+        if priority not in self.strict and not any(not f.done() for f in queue):
+            # Класс, простаивавший долгое время, не должен получать накопленное преимущество.
+            self._finish[priority] = max(self._finish.get(priority, 0.0), self._virtual_time)
+        queue.append(fut)
+
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        await fut
+
+    def penalize(self, seconds: float) -> None:
+        """Приостановить отправку запросов, например после ответа 429.
+
+        Args:
+            seconds (:obj:`float`): На сколько секунд приостановить отправку.
+        """
+
+        self._limiter.penalize(seconds)
+
+    @contextlib.contextmanager
+    def priority(self, priority: int) -> Iterator[None]:
+        """Временно назначить класс приоритета всем запросам текущей задачи.
+
+        Args:
+            priority (:obj:`int`): Класс приоритета.
+        """
+
+        token = _priority_override.set(priority)
+        try:
+            yield
+        finally:
+            _priority_override.reset(token)
+
+    @staticmethod
+    def classify(request: httpx.Request) -> int:
+        """Определить класс приоритета запроса.
+
+        Args:
+            request (:class:`httpx.Request`): Запрос.
+
+        Returns:
+            :obj:`int`: Класс приоритета.
+        """
+
+        priority = _priority_override.get()
+        if priority is not None:
+            return priority
+        endpoint = request.url.path.strip('/').rsplit('/', 1)[-1]
+        return ENDPOINT_PRIORITIES.get(endpoint, PRIORITY_ACCOUNT)
+
+    async def on_request(self, request: httpx.Request) -> None:
+        """Обработчик события request для httpx клиента."""
+
+        await self.acquire(self.classify(request))
+
+    async def on_response(self, response: httpx.Response) -> None:
+        """Обработчик события response для httpx клиента."""
+
+        if response.status_code == 429:
+            retry_after = response.headers.get('retry-after', '')
+            self.penalize(float(retry_after) if retry_after.isdigit() else 1 / self.rate)
+
+    async def _dispatch(self) -> None:
+        while self.pending():
+            tokens = self._limiter.available()
+            if tokens < 1:
+                await asyncio.sleep((1 - tokens) / self._limiter.rate)
+                continue
+
+            fut = self._next()
+            if fut is None:
+                break
+            self._limiter.delay()
+            fut.set_result(None)
+
+    def _next(self) -> Optional[asyncio.Future]:
+        for queue in self._queues.values():
+            while queue and queue[0].done():
+                queue.popleft()
+
+        for priority in self.strict:
+            queue = self._queues.get(priority)
+            if queue:
+                return queue.popleft()
+
+        best = None
+        best_finish = 0.0
+        for priority, queue in self._queues.items():
+            if not queue or priority in self.strict:
+                continue
+            finish = self._finish.get(priority, self._virtual_time) + 1 / self.weights.get(priority, 1.0)
+            if best is None or finish < best_finish:
+                best, best_finish = priority, finish
+
+        if best is None:
+            return None
+        self._finish[best] = best_finish
+        self._virtual_time = max(self._virtual_time, best_finish - 1 / self.weights.get(best, 1.0))
+        return self._queues[best].popleft()
@@ -20,14 +20,11 @@ class ItemsForExchange(TraderClientObject):
         items (Sequence[`steam_trader.ItemForExchange`]): Последовательность предметов для обмена с ботом.
         descriptions (dict[:obj:`int`, :class:`steam_trader.TradeDescription`]): Описания предметов
             для обмена с ботом. Ключ - itemid предмета.
-        client (Union[:class:`steam_trader.Client`, :class:`steam_trader.ClientAsync`, :obj:`None`]):
-            Клиент Steam Trader.
     """
 
     success: bool
     items: Sequence['ItemForExchange']
     descriptions: dict[int, 'TradeDescription']
-    client: Union['Client', 'ClientAsync', None]
 
     @classmethod
     def de_json(
@@ -49,16 +46,15 @@ class ItemsForExchange(TraderClientObject):
                 case 2:
                     raise exceptions.NoTradeItems('Нет предметов для обмена.')
 
-        for i, item in enumerate(data['items']):
-            data['items'][i] = ItemForExchange.de_json(item)
-
-        # Конвертируем ключ в число
-        data['descriptions'] = {
-            int(_id): TradeDescription.de_json(_dict) for _id, _dict in data['descriptions'].items()
-        }
-        data = super(ItemsForExchange, cls).de_json(data)
+        data = super(ItemsForExchange, cls).de_json(data, values={
+            'items': [ItemForExchange.de_json(item) for item in data['items']],
+            # Конвертируем ключ в число
+            'descriptions': {
+                int(_id): TradeDescription.de_json(_dict) for _id, _dict in data['descriptions'].items()
+            }
+        })
 
-        return cls(client=client, **data)
+        return cls(**data)
 
 @dataclass(slots=True)
 class ExchangeResult(TraderClientObject):
@@ -71,8 +67,6 @@ class ExchangeResult(TraderClientObject):
         bot_steamid (:obj:`int`): SteamID бота, который отправил обмен.
         bot_nick (:obj:`str`): Ник бота.
         items (Sequence[:class:`steam_trader.ExchangeItem`]): Cписок предметов для обмена с ботом.
-        client (Union[:class:`steam_trader.Client`, :class:`steam_trader.ClientAsync`, :obj:`None`]):
-            Клиент Steam Trader.
     """
 
     success: bool
@@ -81,7 +75,6 @@ class ExchangeResult(TraderClientObject):
     bot_steamid: int
     bot_nick: str
     items: Sequence['ExchangeItem']
-    client: Union['Client', 'ClientAsync', None]
 
     @classmethod
     def de_json(
@@ -121,19 +114,18 @@ class ExchangeResult(TraderClientObject):
                 case 11:
                     raise exceptions.AuthenticatorError('Мобильный аутентификатор не подключён, или с момента его подключения ещё не прошло 7 дней.')
 
-        data.update({  # перенос с camleCase на snake_case
-            'offer_id': data['offerId'],
-            'bot_steamid': data['botSteamId'],
-            'bot_nick': data['botNick']
-        })
-        del data['offerId'], data['botSteamId'], data['botNick']
-
-        for i, item in enumerate(data['items']):
-            data['items'][i] = ExchangeItem.de_json(item)
-
-        data = super(ExchangeResult, cls).de_json(data)
+        data = super(ExchangeResult, cls).de_json(
+            data,
+            values={  # перенос с camleCase на snake_case
+                'offer_id': data['offerId'],
+                'bot_steamid': data['botSteamId'],
+                'bot_nick': data['botNick'],
+                'items': [ExchangeItem.de_json(item) for item in data['items']]
+            },
+            ignore=('offerId', 'botSteamId', 'botNick')
+        )
 
-        return cls(client=client, **data)
+        return cls(**data)
 
 @dataclass(slots=True)
 class ExchangeP2PResult(TraderClientObject):
@@ -147,8 +139,6 @@ class ExchangeP2PResult(TraderClientObject):
         confirm (Sequence[:class:`steam_trader.ConfirmObject`]): Массив с данными для подтверждения
             обмена в мобильном аутентификаторе.
         cancel (Sequence[:obj:`str`]): Массив из ID обменов, которые нужно отменить.
-        client (Union[:class:`steam_trader.Client`, :class:`steam_trader.ClientAsync`, :obj:`None`]):
-            Клиент Steam Trader.
     """
 
     success: bool
@@ -156,7 +146,6 @@ class ExchangeP2PResult(TraderClientObject):
     receive: Sequence['P2PReceiveObject']
     confirm: Sequence['P2PConfirmObject']
     cancel: Sequence[str]
-    client: Union['Client', 'ClientAsync', None]
 
     @classmethod
     def de_json(
@@ -188,15 +177,10 @@ class ExchangeP2PResult(TraderClientObject):
                 case 7:
                     raise exceptions.AuthenticatorError('Мобильный аутентификатор не подключён, или с момента его подключения ещё не прошло 7 дней.')
 
-        for i, item in enumerate(data['send']):
-            data['send'][i] = P2PSendObject.de_json(item)
-
-        for i, item in enumerate(data['receive']):
-            data['receive'][i] = P2PReceiveObject.de_json(item)
-
-        for i, item in enumerate(data['confirm']):
-            data['confirm'][i] = P2PConfirmObject.de_json(item)
-
-        data = super(ExchangeP2PResult, cls).de_json(data)
+        data = super(ExchangeP2PResult, cls).de_json(data, values={
+            'send': [P2PSendObject.de_json(item) for item in data['send']],
+            'receive': [P2PReceiveObject.de_json(item) for item in data['receive']],
+            'confirm': [P2PConfirmObject.de_json(item) for item in data['confirm']]
+        })
 
-        return cls(client=client, **data)
+        return cls(**data)
@@ -4,15 +4,107 @@ Licensed under the BSD 3-Clause License - Copyright (c) 2024-present, Lemon4ksan
 See LICENSE
 """
 
-from ._client_ext import ExtClient
-from ._client_async_ext import ExtClientAsync
+from typing import TYPE_CHECKING
 
-from ._misc import PriceRange
-from ._misc import TradeMode
+from steam_trader._lazy import lazy_imports
+
+if TYPE_CHECKING:
+    from ._client_ext import ExtClient
+    from ._client_async_ext import ExtClientAsync
+
+    from ._misc import PriceRange
+    from ._misc import TradeMode
+    from ._misc import SellTask
+    from ._misc import SellAttempt
+
+    from ._repricer import Repricer
+    from ._repricer import RepricerAsync
+    from ._repricer import RepriceDecision
+    from ._repricer import UndercutStrategy
+
+    from ._ledger import OperationsLedger
+
+    from ._snapshot import SnapshotWriter
+    from ._snapshot import SNAPSHOT_COLUMNS
+
+    from ._price_store import PriceStore
+    from ._price_store import PriceSample
+    from ._price_store import PRICE_RECORD
+
+    from ._backtest import Backtest
+    from ._backtest import BacktestClient
+    from ._backtest import BacktestReport
+    from ._backtest import MarketReplay
+    from ._backtest import SimulatedTrade
+
+    from ._fees import FeeModel
+    from ._fees import Fees
+    from ._fees import BookFees
+
+    from ._trade_processor import TradeProcessor
+    from ._trade_processor import TradeProcessorAsync
+    from ._trade_processor import TradeOffer
+    from ._trade_processor import TradeStats
 
 __all__ = [
     'ExtClient',
     'ExtClientAsync',
     'PriceRange',
-    'TradeMode'
+    'TradeMode',
+    'SellTask',
+    'SellAttempt',
+    'Repricer',
+    'RepricerAsync',
+    'RepriceDecision',
+    'UndercutStrategy',
+    'OperationsLedger',
+    'SnapshotWriter',
+    'SNAPSHOT_COLUMNS',
+    'PriceStore',
+    'PriceSample',
+    'PRICE_RECORD',
+    'Backtest',
+    'BacktestClient',
+    'BacktestReport',
+    'MarketReplay',
+    'SimulatedTrade',
+    'FeeModel',
+    'Fees',
+    'BookFees',
+    'TradeProcessor',
+    'TradeProcessorAsync',
+    'TradeOffer',
+    'TradeStats'
 ]
+
+# Подмодули импортируются при первом обращении, чтобы не загружать httpx, bs4 и lxml без необходимости
+__getattr__, __dir__ = lazy_imports(globals(), {
+    'ExtClient': '._client_ext',
+    'ExtClientAsync': '._client_async_ext',
+    'PriceRange': '._misc',
+    'TradeMode': '._misc',
+    'SellTask': '._misc',
+    'SellAttempt': '._misc',
+    'Repricer': '._repricer',
+    'RepricerAsync': '._repricer',
+    'RepriceDecision': '._repricer',
+    'UndercutStrategy': '._repricer',
+    'OperationsLedger': '._ledger',
+    'SnapshotWriter': '._snapshot',
+    'SNAPSHOT_COLUMNS': '._snapshot',
+    'PriceStore': '._price_store',
+    'PriceSample': '._price_store',
+    'PRICE_RECORD': '._price_store',
+    'Backtest': '._backtest',
+    'BacktestClient': '._backtest',
+    'BacktestReport': '._backtest',
+    'MarketReplay': '._backtest',
+    'SimulatedTrade': '._backtest',
+    'FeeModel': '._fees',
+    'Fees': '._fees',
+    'BookFees': '._fees',
+    'TradeProcessor': '._trade_processor',
+    'TradeProcessorAsync': '._trade_processor',
+    'TradeOffer': '._trade_processor',
+    'TradeStats': '._trade_processor'
+})
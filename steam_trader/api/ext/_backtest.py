@@ -0,0 +1,608 @@
+import bisect
+import itertools
+from collections import namedtuple
+from collections.abc import Callable, Iterable, Mapping
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Union
+
+from steam_trader.api import (
+    BuyOrderResult,
+    BuyResult,
+    DeleteItemResult,
+    EditPriceResult,
+    Inventory,
+    InventoryItem,
+    MinPrices,
+    OrderBook,
+    SellHistoryItem,
+    SellResult
+)
+from steam_trader.exceptions import IncorrectPrice, NoLongerExists, NotEnoughMoney, UnknownItem
+
+if TYPE_CHECKING:
+    from ._price_store import PriceStore
+
+SimulatedTrade = namedtuple('SimulatedTrade', ['timestamp', 'gid', 'side', 'price'])
+"""Сделка в симуляции. side равен 'buy' или 'sell', price - сумма сделки с учётом комиссии."""
+
+BacktestReport = namedtuple(
+    'BacktestReport',
+    ['start', 'end', 'steps', 'trades', 'balance', 'holdings_value', 'pnl']
+)
+
+
+class MarketReplay:
+    """Класс, представляющий записанную историю рынка для симуляции.
+
+    Хранит стаканы заявок, минимальные цены и продажи по группам предметов, отсортированные по времени.
+    Состояние рынка на любой момент находится бинарным поиском. Если стакан заявок не был записан,
+    он строится из минимальных цен.
+    """
+
+    __slots__ = [
+        '_books',
+        '_prices',
+        '_sales'
+    ]
+
+    def __init__(self) -> None:
+        self._books: dict[int, tuple[list[int], list[OrderBook]]] = {}
+        self._prices: dict[int, tuple[list[int], list[MinPrices]]] = {}
+        self._sales: dict[int, tuple[list[int], list[float]]] = {}
+
+    def add_order_book(self, gid: int, timestamp: int, book: 'OrderBook') -> None:
+        """Добавить стакан заявок.
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+            timestamp (:obj:`int`): Время записи.
+            book (:class:`steam_trader.OrderBook`): Стакан заявок.
+        """
+
+        _insert(self._books.setdefault(gid, ([], [])), timestamp, book)
+
+    def add_min_prices(self, gid: int, timestamp: int, prices: 'MinPrices') -> None:
+        """Добавить минимальные цены.
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+            timestamp (:obj:`int`): Время записи.
+            prices (:class:`steam_trader.MinPrices`): Минимальные цены.
+        """
+
+        _insert(self._prices.setdefault(gid, ([], [])), timestamp, prices)
+
+    def add_sales(self, gid: int, sales: Iterable['SellHistoryItem']) -> None:
+        """Добавить продажи. Уже добавленные продажи пропускаются.
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+            sales (Iterable[:class:`steam_trader.SellHistoryItem`]): Продажи, например из ItemInfo.sell_history.
+        """
+
+        times, prices = self._sales.setdefault(gid, ([], []))
+        known = set(zip(times, prices))
+        for sale in sales:
+            if (sale.date, sale.price) not in known:
+                known.add((sale.date, sale.price))
+                _insert((times, prices), sale.date, sale.price)
+
+    def add_price_store(self, store: 'PriceStore', gids: Optional[Iterable[int]] = None) -> None:
+        """Добавить минимальные цены из хранилища истории цен.
+
+        Args:
+            store (:class:`steam_trader.ext.PriceStore`): Хранилище истории цен.
+            gids (Iterable[:obj:`int`], optional): ID групп предметов. По умолчанию все группы хранилища.
+        """
+
+        for gid in (store.gids() if gids is None else gids):
+            for sample in store.samples(gid):
+                self.add_min_prices(gid, sample.timestamp, MinPrices(
+                    success=True,
+                    market_price=sample.market_price,
+                    buy_price=sample.buy_price,
+                    steam_price=sample.steam_price,
+                    count_sell_offers=sample.count_sell_offers,
+                    count_buy_offers=sample.count_buy_offers
+                ))
+
+    def gids(self) -> set[int]:
+        """Получить ID групп предметов, для которых есть записи.
+
+        Returns:
+            set[:obj:`int`]: ID групп предметов.
+        """
+
+        return set(self._books) | set(self._prices) | set(self._sales)
+
+    def time_range(self) -> tuple[int, int]:
+        """Получить время первой и последней записи.
+
+        Returns:
+            tuple[:obj:`int`, :obj:`int`]: Время первой и последней записи.
+
+        Raises:
+            ValueError: Нет записей.
+        """
+
+        times = [series[0] for data in (self._books, self._prices, self._sales) for series in data.values() if series[0]]
+        if not times:
+            raise ValueError('Нет записей для симуляции.')
+        return min(t[0] for t in times), max(t[-1] for t in times)
+
+    def order_book(self, gid: int, timestamp: int) -> 'OrderBook':
+        """Получить последний стакан заявок на момент времени.
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+            timestamp (:obj:`int`): Момент времени.
+
+        Returns:
+            :class:`steam_trader.OrderBook`: Стакан заявок. Пустой, если записей нет.
+        """
+
+        book = _latest(self._books.get(gid), timestamp)
+        if book is not None:
+            return book
+        prices = _latest(self._prices.get(gid), timestamp)
+        if prices is None:
+            return OrderBook(success=True, sell=[], buy=[], total_sell=0, total_buy=0)
+        sell = [[prices.market_price, prices.count_sell_offers]] if prices.market_price is not None else []
+        buy = [[prices.buy_price, prices.count_buy_offers]] if prices.buy_price is not None else []
+        return OrderBook(
+            success=True,
+            sell=sell,
+            buy=buy,
+            total_sell=prices.count_sell_offers,
+            total_buy=prices.count_buy_offers
+        )
+
+    def min_prices(self, gid: int, timestamp: int) -> 'MinPrices':
+        """Получить последние минимальные цены на момент времени.
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+            timestamp (:obj:`int`): Момент времени.
+
+        Returns:
+            :class:`steam_trader.MinPrices`: Минимальные цены. Строятся из стакана заявок, если не были записаны.
+        """
+
+        prices = _latest(self._prices.get(gid), timestamp)
+        if prices is not None:
+            return prices
+        book = self.order_book(gid, timestamp)
+        return MinPrices(
+            success=True,
+            market_price=book.sell[0][0] if book.sell else None,
+            buy_price=book.buy[0][0] if book.buy else None,
+            steam_price=None,
+            count_sell_offers=book.total_sell,
+            count_buy_offers=book.total_buy
+        )
+
+    def sales(self, gid: int, since: int, until: int) -> list[float]:
+        """Получить цены продаж за период (since, until].
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+            since (:obj:`int`): Начало периода, не включительно.
+            until (:obj:`int`): Конец периода включительно.
+
+        Returns:
+            list[:obj:`float`]: Цены продаж в порядке времени.
+        """
+
+        if gid not in self._sales:
+            return []
+        times, prices = self._sales[gid]
+        return prices[bisect.bisect_right(times, since):bisect.bisect_right(times, until)]
+
+
+class BacktestClient:
+    """Класс, представляющий симуляцию клиента Steam Trader.
+
+    Поддерживает методы клиента, которые используют торговые стратегии, поэтому стратегию и
+    :class:`steam_trader.ext.Repricer` можно запускать на записанной истории без изменений.
+    Время задаётся симуляцией, запросы выполняются мгновенно.
+
+    Модель исполнения:
+        Предложение о продаже исполняется записанной продажей, цена которой не ниже цены предложения,
+        или сразу, если цена не выше лучшей заявки на покупку. Заявка на покупку исполняется, когда
+        лучшее предложение о продаже или записанная продажа не выше цены заявки. Одна записанная продажа
+        исполняет не более одного предложения. Количество на уровнях записанного стакана расходуется
+        покупками и исполнениями в пределах одного шага, поэтому за шаг нельзя купить или продать больше,
+        чем было в стакане.
+
+    Args:
+        replay (:class:`MarketReplay`): Записанная история рынка.
+        balance (:obj:`float`): Начальный баланс. По умолчанию 0.
+        inventory (Mapping[:obj:`int`, :obj:`int`], optional): Количество предметов каждой группы в инвентаре.
+        commission (:obj:`float`): Доля комиссии с продажи. По умолчанию 0.
+        gameid (:obj:`int`): AppID игры предметов. По умолчанию 440.
+
+    Attributes:
+        replay (:class:`MarketReplay`): Записанная история рынка.
+        now (:obj:`int`): Текущее время симуляции.
+        commission (:obj:`float`): Доля комиссии с продажи.
+        gameid (:obj:`int`): AppID игры предметов.
+        trades (list[:NamedTuple:`SimulatedTrade(timestamp, gid, side, price)`]): Совершённые сделки.
+    """
+
+    __slots__ = [
+        'replay',
+        'now',
+        'commission',
+        'gameid',
+        'trades',
+        '_balance',
+        '_items',
+        '_ids',
+        '_consumed',
+        '_consumed_at'
+    ]
+
+    def __init__(
+            self,
+            replay: 'MarketReplay',
+            *,
+            balance: float = 0,
+            inventory: Optional[Mapping[int, int]] = None,
+            commission: float = 0,
+            gameid: int = 440
+    ) -> None:
+        self.replay = replay
+        self.now = 0
+        self.commission = commission
+        self.gameid = gameid
+        self.trades: list[SimulatedTrade] = []
+        self._balance = float(balance)
+        self._items: dict[int, InventoryItem] = {}
+        self._ids = itertools.count(1)
+        self._consumed: dict[tuple[int, int], int] = {}  # (gid, тип стакана) -> израсходовано за шаг
+        self._consumed_at = 0
+
+        for gid, count in (inventory or {}).items():
+            for _ in range(count):
+                self._add_item(gid)
+
+    @property
+    def balance(self) -> float:
+        """Баланс клиента."""
+
+        return round(self._balance, 2)
+
+    def get_order_book(self, gid: int, *, mode: str = 'all', limit: Optional[int] = None) -> 'OrderBook':
+        """Получить стакан заявок на текущий момент вместе с собственными предложениями."""
+
+        replay_sell, replay_buy = self._replay_book(gid)
+        sell = _merge_levels(replay_sell, self._prices(gid, 0), reverse=False)
+        buy = _merge_levels(replay_buy, self._prices(gid, 1), reverse=True)
+        if limit is not None:
+            sell, buy = sell[:limit], buy[:limit]
+        if mode == 'sell':
+            buy = []
+        elif mode == 'buy':
+            sell = []
+        return OrderBook(
+            success=True,
+            sell=sell,
+            buy=buy,
+            total_sell=sum(count for _, count in sell),
+            total_buy=sum(count for _, count in buy)
+        )
+
+    def get_min_prices(self, gid: int, currency: int = 1) -> 'MinPrices':
+        """Получить минимальные/максимальные цены предмета на текущий момент."""
+
+        return self.replay.min_prices(gid, self.now)
+
+    def get_inventory(self, gameid: int, *, status: Optional[Sequence[int]] = None) -> 'Inventory':
+        """Получить инвентарь. По умолчанию возвращает предметы, не выставленные на продажу."""
+
+        statuses = {-2} if status is None else set(status)
+        items = [
+            item for item in self._items.values()
+            if item.status in statuses or (4 in statuses and item.status == 0 and item.type == 1)
+        ]
+        return Inventory(success=True, count=len(items), gameid=gameid, last_update=self.now, items=items)
+
+    def sell(self, itemid: int, assetid: int, price: float) -> 'SellResult':
+        """Выставить предмет из инвентаря на продажу."""
+
+        item = self._items.get(itemid)
+        if item is None or item.status != -2:
+            raise UnknownItem('Предмет не был найден.')
+        item.id, item.price, item.type, item.status = next(self._ids), price, 0, 0
+        fast_execute = self._try_fill_listing(item)
+        return SellResult(success=True, id=item.id, position=0, fast_execute=fast_execute, nc='', price=price)
+
+    def edit_price(self, _id: int, price: float) -> 'EditPriceResult':
+        """Изменить цену предложения о продаже или заявки на покупку."""
+
+        item = self._listing(_id)
+        if price <= 0:
+            raise IncorrectPrice('Неправильная цена заявки.')
+        if item.type == 1:
+            self._reserve(price - item.price)
+        item.price = price
+        fast_execute = self._try_fill_listing(item)
+        return EditPriceResult(
+            success=True, type=item.type, position=0, fast_execute=fast_execute, price=price
+        )
+
+    def delete_item(self, _id: int) -> 'DeleteItemResult':
+        """Снять предмет с продажи или отменить заявку на покупку."""
+
+        item = self._listing(_id)
+        if item.type == 1:
+            self._balance += item.price
+            del self._items[item.itemid]
+        else:
+            item.id, item.price, item.type, item.status = None, None, None, -2
+        return DeleteItemResult(
+            success=True, has_ex=False, has_bot_ex=False, has_p2p_ex=False, total_fines=0, fine_date=None
+        )
+
+    def buy(self, _id: Union[int, str], _type: int, price: float, currency: int = 1) -> 'BuyResult':
+        """Купить предмет группы _id по цене лучшего предложения о продаже.
+
+        Поддерживается только покупка по gid (_type=1): ссылок nc и ID предложений в записанной истории нет.
+
+        Raises:
+            ValueError: Указано значение _type, отличное от 1.
+            NoLongerExists: Цена не совпадает с лучшим оставшимся предложением.
+        """
+
+        if _type != 1:
+            raise ValueError(f'Недопустимое значение _type :: {_type}')
+
+        gid = int(_id)
+        sell, _ = self._replay_book(gid)
+        if not sell or sell[0][0] != price:
+            raise NoLongerExists('Предложение больше недействительно.')
+        self._reserve(price)
+        self._consume(gid, 0)
+        item = self._add_item(gid)
+        self.trades.append(SimulatedTrade(self.now, item.gid, 'buy', price))
+        rest = _drop_front(sell, 1)
+        new_price = rest[0][0] if rest else 0
+        return BuyResult(
+            success=True,
+            id=next(self._ids),
+            gid=item.gid,
+            itemid=item.itemid,
+            price=price,
+            new_price=new_price,
+            discount=0
+        )
+
+    def create_buy_order(self, gid: int, price: float, *, count: int = 1) -> 'BuyOrderResult':
+        """Создать заявки на покупку. Средства резервируются сразу."""
+
+        if price <= 0:
+            raise IncorrectPrice('Неправильная цена заявки.')
+        self._reserve(price * count)
+        executed = 0
+        for _ in range(count):
+            order = self._add_item(gid)
+            order.id, order.price, order.type, order.status = next(self._ids), price, 1, 0
+            executed += self._try_fill_listing(order)
+        return BuyOrderResult(success=True, executed=executed, placed=count - executed)
+
+    def advance(self, timestamp: int) -> None:
+        """Перевести время симуляции и исполнить заявки по записанным продажам и стаканам.
+
+        Args:
+            timestamp (:obj:`int`): Новое время симуляции.
+        """
+
+        previous, self.now = self.now, timestamp
+        listings: dict[int, list[InventoryItem]] = {}
+        for item in self._items.values():
+            if item.status == 0:
+                listings.setdefault(item.gid, []).append(item)
+
+        for gid, items in listings.items():
+            sales = self.replay.sales(gid, previous, timestamp)
+            sell = sorted((i for i in items if i.type == 0), key=lambda i: i.price)
+            buy = sorted((i for i in items if i.type == 1), key=lambda i: -i.price)
+            for sale_price in sales:
+                if sell and sell[0].price <= sale_price:
+                    self._fill(sell.pop(0))
+                elif buy and buy[0].price >= sale_price:
+                    self._fill(buy.pop(0))
+            for item in sell + buy:
+                self._try_fill_listing(item)
+
+    def holdings_value(self) -> float:
+        """Оценить предметы и заявки по текущим ценам рынка.
+
+        Предметы оцениваются по лучшей заявке на покупку, то есть по цене немедленной продажи,
+        а при её отсутствии по минимальной цене продажи. Зарезервированные заявками средства
+        учитываются по цене заявки.
+
+        Returns:
+            :obj:`float`: Стоимость.
+        """
+
+        value = 0.0
+        for item in self._items.values():
+            if item.type == 1:
+                value += item.price
+                continue
+            prices = self.replay.min_prices(item.gid, self.now)
+            value += (prices.buy_price or prices.market_price or 0) * (1 - self.commission)
+        return round(value, 2)
+
+    def _prices(self, gid: int, _type: int) -> list[float]:
+        return [i.price for i in self._items.values() if i.gid == gid and i.status == 0 and i.type == _type]
+
+    def _listing(self, _id: int) -> 'InventoryItem':
+        for item in self._items.values():
+            if item.id == _id and item.status == 0:
+                return item
+        raise UnknownItem('Предмет не был найден.')
+
+    def _reserve(self, amount: float) -> None:
+        if amount > self._balance + 1e-9:
+            raise NotEnoughMoney('Недостаточно средств.')
+        self._balance -= amount
+
+    def _add_item(self, gid: int) -> 'InventoryItem':
+        itemid = next(self._ids)
+        item = InventoryItem(
+            id=None, assetid=itemid, gid=gid, itemid=itemid, price=None, currency=None, timer=None, type=None,
+            status=-2, position=None, nc=None, percent=None, steam_item=True, nm=False
+        )
+        self._items[itemid] = item
+        return item
+
+    def _try_fill_listing(self, item: 'InventoryItem') -> bool:
+        sell, buy = self._replay_book(item.gid)
+        if item.type == 0 and buy and item.price <= buy[0][0]:
+            item.price = buy[0][0]
+            self._consume(item.gid, 1)
+        elif item.type == 1 and sell and item.price >= sell[0][0]:
+            self._consume(item.gid, 0)
+        else:
+            return False
+        self._fill(item)
+        return True
+
+    def _replay_book(self, gid: int) -> tuple[list[list], list[list]]:
+        if self._consumed_at != self.now:
+            self._consumed.clear()
+            self._consumed_at = self.now
+        book = self.replay.order_book(gid, self.now)
+        return (
+            _drop_front(book.sell, self._consumed.get((gid, 0), 0)),
+            _drop_front(book.buy, self._consumed.get((gid, 1), 0))
+        )
+
+    def _consume(self, gid: int, side: int) -> None:
+        self._consumed[gid, side] = self._consumed.get((gid, side), 0) + 1
+
+    def _fill(self, item: 'InventoryItem') -> None:
+        if item.type == 0:
+            amount = round(item.price * (1 - self.commission), 2)
+            self._balance += amount
+            del self._items[item.itemid]
+            self.trades.append(SimulatedTrade(self.now, item.gid, 'sell', amount))
+        else:
+            self.trades.append(SimulatedTrade(self.now, item.gid, 'buy', item.price))
+            item.id, item.price, item.type, item.status = None, None, None, -2
+
+
+class Backtest:
+    """Класс, представляющий прогон стратегии на записанной истории рынка.
+
+    Время симуляции идёт шагами по interval секунд. На каждом шаге сначала исполняются заявки,
+    затем вызывается бот, которому передаётся :class:`BacktestClient`. Ожиданий нет, поэтому
+    месяцы истории обрабатываются за секунды.
+
+    Args:
+        replay (:class:`MarketReplay`): Записанная история рынка.
+        bot (Callable[[:class:`BacktestClient`], Any]): Функция одного шага бота, например
+            ``lambda client: Repricer(client, strategy).reprice(440)``.
+        interval (:obj:`int`): Шаг симуляции в секундах. По умолчанию 60.
+        start (:obj:`int`, optional): Начало симуляции. По умолчанию время первой записи.
+        end (:obj:`int`, optional): Конец симуляции. По умолчанию время последней записи.
+        **kwargs: Аргументы :class:`BacktestClient`: balance, inventory, commission, gameid.
+
+    Raises:
+        ValueError: interval меньше 1.
+    """
+
+    __slots__ = [
+        'replay',
+        'bot',
+        'interval',
+        'start',
+        'end',
+        'client'
+    ]
+
+    def __init__(
+            self,
+            replay: 'MarketReplay',
+            bot: Callable[['BacktestClient'], Any],
+            *,
+            interval: int = 60,
+            start: Optional[int] = None,
+            end: Optional[int] = None,
+            **kwargs
+    ) -> None:
+        if interval < 1:
+            raise ValueError(f'Недопустимое значение interval :: {interval}')
+
+        first, last = replay.time_range() if start is None or end is None else (start, end)
+        self.replay = replay
+        self.bot = bot
+        self.interval = interval
+        self.start = first if start is None else start
+        self.end = last if end is None else end
+        self.client = BacktestClient(replay, **kwargs)
+
+    def run(self) -> BacktestReport:
+        """Запустить симуляцию.
+
+        Returns:
+            :NamedTuple:`BacktestReport(start, end, steps, trades, balance, holdings_value, pnl)`: Результат.
+                pnl - изменение суммы баланса и стоимости предметов за время симуляции.
+        """
+
+        client = self.client
+        client.now = self.start
+        initial = client.balance + client.holdings_value()
+        client.now = self.start - 1  # Чтобы продажи в момент начала тоже учитывались
+
+        steps = 0
+        for timestamp in range(self.start, self.end + 1, self.interval):
+            client.advance(timestamp)
+            self.bot(client)
+            steps += 1
+
+        holdings_value = client.holdings_value()
+        return BacktestReport(
+            self.start,
+            self.end,
+            steps,
+            client.trades,
+            client.balance,
+            holdings_value,
+            round(client.balance + holdings_value - initial, 2)
+        )
+
+
+def _insert(series: tuple[list, list], timestamp: int, value: Any) -> None:
+    times, values = series
+    index = bisect.bisect_right(times, timestamp)
+    times.insert(index, timestamp)
+    values.insert(index, value)
+
+
+def _latest(series: Optional[tuple[list, list]], timestamp: int) -> Any:
+    if series is None:
+        return None
+    index = bisect.bisect_right(series[0], timestamp)
+    return series[1][index - 1] if index else None
+
+
+def _drop_front(levels: Sequence[Sequence], count: int) -> list[list]:
+    rest = []
+    for price, level_count in levels:
+        if count >= level_count:
+            count -= level_count
+            continue
+        rest.append([price, level_count - count])
+        count = 0
+    return rest
+
+
+def _merge_levels(levels: Sequence[Sequence], prices: Iterable[float], reverse: bool) -> list[list]:
+    merged: dict[float, int] = {}
+    for price, count in levels:
+        merged[price] = merged.get(price, 0) + count
+    for price in prices:
+        merged[price] = merged.get(price, 0) + 1
+    return [[price, merged[price]] for price in sorted(merged, reverse=reverse)]
@@ -1,16 +1,23 @@
 import asyncio
 import logging
 import functools
-from typing import Optional, Sequence, TypeVar, Callable, Any, LiteralString
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from typing import Optional, Sequence, TypeVar, Callable, Any, LiteralString, Union
 
-from ._misc import TradeMode, PriceRange
+from ._misc import TradeMode, PriceRange, SellTask, SellAttempt, NON_FATAL_SELL_ERRORS
 
+from steam_trader._rate_limit import AsyncRateLimiter
 from steam_trader.constants import SUPPORTED_APPIDS
-from steam_trader.exceptions import UnsupportedAppID, UnknownItem
+from steam_trader.exceptions import UnsupportedAppID, UnknownItem, TooManyRequests
 from steam_trader.api import (
     ClientAsync,
+    RequestScheduler,
     Filters,
+    FilterEncoder,
     Inventory,
+    CompactInventory,
+    OperationsHistoryItem,
     SellResult
 )
 
@@ -44,8 +51,11 @@ class ExtClientAsync(ClientAsync):
 
     Новые методы:
         multi_sell - Аналог multi_buy. В отличие от него, возвращает последовательность из результатов продаж, а не один объект.
+        sell_many - Выставить на продажу множество предметов с ограничением одновременных запросов
+            и результатом по каждому предмету.
         set_trade_mode - Позволяет задать режим торговли. Данного метода нет в документации.
         get_price_range - Получить размах цен в истории покупок. Проверяет только последние 100 покупок.
+        iter_operations_history - Перебрать всю историю операций, заранее загружая следующие страницы.
 
     Raises:
         BadRequestError: Неправильный запрос.
@@ -60,9 +70,10 @@ class ExtClientAsync(ClientAsync):
             proxy: Optional[str] = None,
             base_url: Optional[str] = None,
             headers: Optional[dict] = None,
+            scheduler: Optional['RequestScheduler'] = None,
             **kwargs
     ) -> None:
-        super().__init__(api_token, proxy=proxy, base_url=base_url, headers=headers, **kwargs)
+        super().__init__(api_token, proxy=proxy, base_url=base_url, headers=headers, scheduler=scheduler, **kwargs)
 
     @log
     async def get_inventory(
@@ -70,12 +81,13 @@ class ExtClientAsync(ClientAsync):
             gameid: int,
             *,
             filters: Optional['Filters'] = None,
-            status: Optional[Sequence[int]] = None
-    ) -> 'Inventory':
+            status: Optional[Sequence[int]] = None,
+            compact: bool = False
+    ) -> Union['Inventory', 'CompactInventory']:
         """Получить инвентарь клиента, включая заявки на покупку и купленные предметы.
 
         EXT:
-            Добавляен аргумент filters для отсеивания предметов.
+            Добавляен аргумент filters для отсеивания предметов. Поддерживается compact.
 
         По умолчанию возвращает список предметов из инвентаря Steam, которые НЕ выставлены на продажу.
 
@@ -93,9 +105,12 @@ class ExtClientAsync(ClientAsync):
                 4 - Заявка на покупку
 
                 Если не указавать, вернётся список предметов из инвентаря Steam, которые НЕ выставлены на продажу.
+            compact (:obj:`bool`): Вернуть инвентарь в компактном виде :class:`steam_trader.CompactInventory`.
+                Фильтр применяется к компактному инвентарю без создания объектов предметов. По умолчанию False.
 
         Returns:
-            :class:`steam_trader.Inventory`: Инвентарь клиента, включая заявки на покупку и купленные предметы.
+            Union[:class:`steam_trader.Inventory`, :class:`steam_trader.CompactInventory`]: Инвентарь клиента,
+                включая заявки на покупку и купленные предметы.
 
         Raises:
             UnsupportedAppID: Указан недействительный gameid.
@@ -119,110 +134,157 @@ class ExtClientAsync(ClientAsync):
             params=params,
             headers=self.headers
         )
-        inventory = Inventory.de_json(result.json(), status, self)
+        if compact:
+            inventory = CompactInventory.de_json(result.json(), status)
+            gids = inventory.column('gid')
+        else:
+            inventory = Inventory.de_json(result.json(), status, self)
+            gids = [item.gid for item in inventory.items]
 
         if filters is not None:
-            tasks = [self.get_item_info(item.gid) for item in inventory.items]
-            responses = await asyncio.gather(*tasks)
-
-            new_items = []
-
-            for i, item in enumerate(inventory.items):
-                item_filters = responses[i].filters
-                if filters.quality is not None:
-                    required_filters_list = [_filter.id for _filter in filters.quality]
-                    item_filters_list = [_filter.id for _filter in item_filters.quality]
-                    if not any([required_filter in item_filters_list for required_filter in required_filters_list]):
-                        continue
-                if filters.type is not None:
-                    required_filters_list = [_filter.id for _filter in filters.type]
-                    item_filters_list = [_filter.id for _filter in item_filters.type]
-                    if not any([required_filter in item_filters_list for required_filter in required_filters_list]):
-                        continue
-                if filters.used_by is not None:
-                    required_filters_list = [_filter.id for _filter in filters.used_by]
-                    item_filters_list = [_filter.id for _filter in item_filters.used_by]
-                    if not any([required_filter in item_filters_list for required_filter in required_filters_list]):
-                        continue
-                if filters.craft is not None:
-                    required_filters_list = [_filter.id for _filter in filters.craft]
-                    item_filters_list = [_filter.id for _filter in item_filters.craft]
-                    if not any([required_filter in item_filters_list for required_filter in required_filters_list]):
-                        continue
-                if filters.region is not None:
-                    required_filters_list = [_filter.id for _filter in filters.region]
-                    item_filters_list = [_filter.id for _filter in item_filters.region]
-                    if not any([required_filter in item_filters_list for required_filter in required_filters_list]):
-                        continue
-                if filters.genre is not None:
-                    required_filters_list = [_filter.id for _filter in filters.genre]
-                    item_filters_list = [_filter.id for _filter in item_filters.genre]
-                    if not any([required_filter in item_filters_list for required_filter in required_filters_list]):
-                        continue
-                if filters.mode is not None:
-                    required_filters_list = [_filter.id for _filter in filters.mode]
-                    item_filters_list = [_filter.id for _filter in item_filters.mode]
-                    if not any([required_filter in item_filters_list for required_filter in required_filters_list]):
-                        continue
-                if filters.trade is not None:
-                    required_filters_list = [_filter.id for _filter in filters.trade]
-                    item_filters_list = [_filter.id for _filter in item_filters.trade]
-                    if not any([required_filter in item_filters_list for required_filter in required_filters_list]):
-                        continue
-                if filters.rarity is not None:
-                    required_filters_list = [_filter.id for _filter in filters.rarity]
-                    item_filters_list = [_filter.id for _filter in item_filters.rarity]
-                    if not any([required_filter in item_filters_list for required_filter in required_filters_list]):
-                        continue
-                if filters.hero is not None:
-                    required_filters_list = [_filter.id for _filter in filters.hero]
-                    item_filters_list = [_filter.id for _filter in item_filters.hero]
-                    if not any([required_filter in item_filters_list for required_filter in required_filters_list]):
-                        continue
+            encoder = FilterEncoder(gameid)
+            query = encoder.encode_query(filters)
 
-                new_items.append(item)
+            unique_gids = list(set(gids))
+            tasks = [self.get_item_info(gid) for gid in unique_gids]
+            responses = await asyncio.gather(*tasks)
+            masks = {gid: encoder.encode(response.filters) for gid, response in zip(unique_gids, responses)}
 
-            inventory.items = new_items
+            if compact:
+                inventory = inventory.select(i for i, gid in enumerate(gids) if encoder.matches(masks[gid], query))
+            else:
+                inventory.items = [item for item in inventory.items if encoder.matches(masks[item.gid], query)]
 
         return inventory
 
     @log
-    async def multi_sell(self, gameid: int, gid: int, price: float, count: int) -> Sequence['SellResult']:
+    async def multi_sell(
+            self,
+            gameid: int,
+            gid: int,
+            price: float,
+            count: int,
+            *,
+            max_concurrency: int = 4,
+            rate: Optional[float] = None
+    ) -> Sequence['SellResult']:
         """Продать множество вещей из инвенторя с одним gid.
 
+        Предметы, которые не удалось выставить из-за ошибок, относящихся к одному предмету
+        (например, ItemAlreadySold), пропускаются с предупреждением в логах.
+
         Args:
             gameid (:obj:`int`): ID инвентаря из которого будет произходить продажа.
             gid (:obj:`int`): ID группы предметов.
             price (:obj:`int`): Цена для выставления на продажу.
             count (:obj:`int`): Количество предметов для продажи. Если число больше чем предметов в инвенторе,
                 будут проданы те, что имеются.
+            max_concurrency (:obj:`int`): Максимальное количество одновременных запросов. По умолчанию 4.
+            rate (:obj:`float`, optional): Максимальное количество продаж в секунду. По умолчанию не ограничено.
 
         Returns:
             Sequence[:class:`steam_trader.SellResult`]: Последовательноасть с результатами продаж.
 
         Raises:
-            OfferCreationFail: При создании заявки произошла неизвестная ошибка.
-            UnknownItem: Неизвестный предмет.
             NoTradeLink: Отсутствует сслыка для обмена.
-            IncorrectPrice: Неправильная цена заявки.
-            ItemAlreadySold: Предмет уже продан или отстутствует.
             AuthenticatorError: Мобильный аутентификатор не подключён
                 или с момента его подключения ещё не прошло 7 дней.
+
+        Changes:
+            0.5.0: Ошибки отдельных предметов больше не прерывают продажу, количество одновременных запросов
+                ограничено. Добавлены аргументы max_concurrency и rate.
         """
 
         inventory = await self.get_inventory(gameid)
-        tasks = []
+        tasks = [SellTask(item.itemid, item.assetid, price) for item in inventory.items if item.gid == gid][:count]
 
-        for item in inventory.items:
-            if count == 0:
-                break
-            if item.gid == gid:
-                tasks.append(self.sell(item.itemid, item.assetid, price))
-                count -= 1
+        attempts = {}
+        async for attempt in self.sell_many(tasks, max_concurrency=max_concurrency, rate=rate):
+            attempts[attempt.itemid] = attempt
+            if not attempt.success:
+                logging.warning(f'Не удалось выставить предмет {attempt.itemid} :: {attempt.error}')
 
-        results = await asyncio.gather(*tasks)
+        # Возвращаем результаты в порядке инвентаря, а не в порядке завершения
+        return [attempts[task.itemid].result for task in tasks if attempts[task.itemid].success]
 
-        return results
+    async def sell_many(
+            self,
+            tasks: Iterable[Union['SellTask', tuple[int, int, float]]],
+            *,
+            max_concurrency: int = 4,
+            rate: Optional[float] = None,
+            retries: int = 3
+    ) -> AsyncIterator['SellAttempt']:
+        """Выставить на продажу множество предметов, возвращая результат каждого по мере выполнения.
+
+        Одновременно выполняется не более max_concurrency запросов. Ошибки, относящиеся к одному предмету
+        (ItemAlreadySold, IncorrectPrice, UnknownItem и т.д.), не прерывают продажу и возвращаются в поле error.
+        При TooManyRequests запрос повторяется с увеличением паузы.
+
+        Args:
+            tasks (Iterable[:NamedTuple:`SellTask(itemid: int, assetid: int, price: float)`]):
+                Предметы для продажи.
+            max_concurrency (:obj:`int`): Максимальное количество одновременных запросов. По умолчанию 4.
+            rate (:obj:`float`, optional): Максимальное количество продаж в секунду. По умолчанию не ограничено.
+            retries (:obj:`int`): Количество повторов при TooManyRequests. По умолчанию 3.
+
+        Yields:
+            :class:`steam_trader.ext.SellAttempt`: Результат попытки продажи в порядке завершения.
+
+        Raises:
+            NoTradeLink: Отсутствует сслыка для обмена.
+            AuthenticatorError: Мобильный аутентификатор не подключён
+                или с момента его подключения ещё не прошло 7 дней.
+            ValueError: Недопустимое значение max_concurrency.
+        """
+
+        if max_concurrency < 1:
+            raise ValueError(f'Недопустимое значение max_concurrency :: {max_concurrency}')
+
+        limiter = AsyncRateLimiter(rate) if rate is not None else None
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(itemid: int, assetid: int, price: float) -> 'SellAttempt':
+            async with semaphore:
+                return await self._sell_attempt(itemid, assetid, price, limiter, retries)
+
+        futures = [asyncio.ensure_future(bounded(*task)) for task in tasks]
+        try:
+            for future in asyncio.as_completed(futures):
+                yield await future
+        finally:
+            for future in futures:  # При фатальной ошибке или досрочном выходе отменяем оставшиеся продажи
+                future.cancel()
+
+    async def _sell_attempt(
+            self,
+            itemid: int,
+            assetid: int,
+            price: float,
+            limiter: Optional['AsyncRateLimiter'],
+            retries: int
+    ) -> 'SellAttempt':
+
+        error = None
+        for attempt in range(retries + 1):
+            if limiter is not None:
+                await limiter.acquire()
+            try:
+                return SellAttempt(itemid, assetid, price, result=await self.sell(itemid, assetid, price))
+            except TooManyRequests as e:
+                error = e
+                if attempt == retries:
+                    break
+                backoff = 2 ** attempt
+                logging.warning(f'Слишком много запросов, повтор через {backoff} с.')
+                if limiter is not None:
+                    limiter.penalize(backoff)
+                else:
+                    await asyncio.sleep(backoff)
+            except NON_FATAL_SELL_ERRORS as e:
+                return SellAttempt(itemid, assetid, price, error=e)
+
+        return SellAttempt(itemid, assetid, price, error=error)
 
     @log
     async def set_trade_mode(self, state: int) -> 'TradeMode':
@@ -297,3 +359,92 @@ class ExtClientAsync(ClientAsync):
         if lowest is None or highest is None:
             raise UnknownItem('Отсутствуют предложения о продаже/покупке или отсутствует история продаж.')
         return PriceRange(float(lowest), float(highest))
+
+    async def iter_operations_history(
+            self,
+            *,
+            operation_type: Union[int, Sequence[int], None] = None,
+            prefetch: int = 4,
+            until_id: Optional[int] = None
+    ) -> AsyncIterator['OperationsHistoryItem']:
+        """Перебрать всю историю операций, заранее загружая следующие страницы.
+
+        Пока обрабатывается текущая страница, следующие prefetch страниц загружаются одновременно.
+        Операции, сместившиеся на следующую страницу из-за новых операций, повторно не возвращаются.
+
+        Args:
+            operation_type (Union[:obj:`int`, Sequence[:obj:`int`], :obj:`None`]): Тип или типы операций.
+                Если указано несколько типов, их истории объединяются в порядке убывания даты.
+                По умолчанию все типы.
+            prefetch (:obj:`int`): Количество страниц, загружаемых заранее. По умолчанию 4.
+            until_id (:obj:`int`, optional): ID последней известной операции. Перебор останавливается на ней,
+                сама операция и более старые не возвращаются.
+
+        Yields:
+            :class:`steam_trader.OperationsHistoryItem`: Операции от новых к старым.
+
+        Raises:
+            ValueError: Недопустимое значение prefetch.
+        """
+
+        if prefetch < 1:
+            raise ValueError(f'Недопустимое значение prefetch :: {prefetch}')
+
+        if operation_type is None or isinstance(operation_type, int):
+            async for item in self._iter_operations_stream(operation_type, prefetch, until_id):
+                yield item
+            return
+
+        streams = [self._iter_operations_stream(_type, prefetch, until_id) for _type in operation_type]
+        heads = {}
+        try:
+            for i, stream in enumerate(streams):
+                item = await anext(stream, None)
+                if item is not None:
+                    heads[i] = item
+
+            while heads:
+                i = max(heads, key=lambda k: (heads[k].date, heads[k].id))
+                yield heads[i]
+                item = await anext(streams[i], None)
+                if item is None:
+                    del heads[i]
+                else:
+                    heads[i] = item
+        finally:
+            for stream in streams:
+                await stream.aclose()
+
+    async def _iter_operations_stream(
+            self,
+            operation_type: Optional[int],
+            prefetch: int,
+            until_id: Optional[int]
+    ) -> AsyncIterator['OperationsHistoryItem']:
+
+        pages = deque(
+            asyncio.ensure_future(self.get_operations_history(operation_type=operation_type, page=page))
+            for page in range(prefetch)
+        )
+        next_page = prefetch
+        seen = set()
+        try:
+            while pages:
+                history = await pages.popleft()
+                if not history.data:
+                    break
+                pages.append(asyncio.ensure_future(
+                    self.get_operations_history(operation_type=operation_type, page=next_page)
+                ))
+                next_page += 1
+
+                for item in history.data:
+                    if until_id is not None and item.id <= until_id:
+                        return
+                    if item.id in seen:
+                        continue
+                    seen.add(item.id)
+                    yield item
+        finally:
+            for page in pages:  # Страницы после последней или после until_id не нужны
+                page.cancel()
@@ -1,16 +1,23 @@
+import time
+import heapq
 import httpx
 import logging
 import functools
-from typing import Optional, Sequence, TypeVar, Callable, Any, LiteralString
+from collections.abc import Iterable, Iterator
+from typing import Optional, Sequence, TypeVar, Callable, Any, LiteralString, Union
 
-from ._misc import TradeMode, PriceRange
+from ._misc import TradeMode, PriceRange, SellTask, SellAttempt, NON_FATAL_SELL_ERRORS
 
+from steam_trader._rate_limit import RateLimiter
 from steam_trader.constants import SUPPORTED_APPIDS
-from steam_trader.exceptions import UnsupportedAppID, UnknownItem
+from steam_trader.exceptions import UnsupportedAppID, UnknownItem, TooManyRequests
 from steam_trader.api import (
     Client,
     Filters,
+    FilterEncoder,
     Inventory,
+    CompactInventory,
+    OperationsHistoryItem,
     SellResult
 )
 
@@ -61,7 +68,9 @@ class ExtClient(Client):
 
     Новые методы:
         multi_sell - Аналог multi_buy. В отличие от него, возвращает последовательноасть из результатов продаж, а не один объект.
+        sell_many - Выставить на продажу множество предметов с ограничением частоты и результатом по каждому предмету.
         set_trade_mode - Позволяет задать режим торговли. Данного метода нет в документации.
+        iter_operations_history - Перебрать всю историю операций постранично.
 
     Raises:
         BadRequestError: Неправильный запрос.
@@ -86,12 +95,13 @@ class ExtClient(Client):
             gameid: int,
             *,
             filters: Optional['Filters'] = None,
-            status: Optional[Sequence[int]] = None
-    ) -> 'Inventory':
+            status: Optional[Sequence[int]] = None,
+            compact: bool = False
+    ) -> Union['Inventory', 'CompactInventory']:
         """Получить инвентарь клиента, включая заявки на покупку и купленные предметы.
 
         EXT:
-            Добавляен аргумент filters для отсеивания предметов.
+            Добавляен аргумент filters для отсеивания предметов. Поддерживается compact.
 
         По умолчанию возвращает список предметов из инвентаря Steam, которые НЕ выставлены на продажу.
 
@@ -109,9 +119,12 @@ class ExtClient(Client):
                 4 - Заявка на покупку
 
                 Если не указавать, вернётся список предметов из инвентаря Steam, которые НЕ выставлены на продажу.
+            compact (:obj:`bool`): Вернуть инвентарь в компактном виде :class:`steam_trader.CompactInventory`.
+                Фильтр применяется к компактному инвентарю без создания объектов предметов. По умолчанию False.
 
         Returns:
-            :class:`steam_trader.Inventory`: Инвентарь клиента, включая заявки на покупку и купленные предметы.
+            Union[:class:`steam_trader.Inventory`, :class:`steam_trader.CompactInventory`]: Инвентарь клиента,
+                включая заявки на покупку и купленные предметы.
 
         Raises:
             UnsupportedAppID: Указан недействительный gameid.
@@ -135,107 +148,141 @@ class ExtClient(Client):
             params=params,
             headers=self.headers
         ).json()
-        inventory = Inventory.de_json(result, status, self)
+        if compact:
+            inventory = CompactInventory.de_json(result, status)
+            gids = inventory.column('gid')
+        else:
+            inventory = Inventory.de_json(result, status, self)
+            gids = [item.gid for item in inventory.items]
 
         if filters is not None:
             logging.warning('Вы используете синхронный клиент. Запрос с фильтрами может занять до 2 минут. Если хотите ускорить время, используйте асинхронную версию.')
-            new_items = []
-
-            for item in inventory.items:
-                item_filters = self.get_item_info(item.gid).filters
-                if filters.quality is not None:
-                    required_filters_list = [_filter.id for _filter in filters.quality]
-                    item_filters_list = [_filter.id for _filter in item_filters.quality]
-                    if not any([required_filter in item_filters_list for required_filter in required_filters_list]):
-                        continue
-                if filters.type is not None:
-                    required_filters_list = [_filter.id for _filter in filters.type]
-                    item_filters_list = [_filter.id for _filter in item_filters.type]
-                    if not any([required_filter in item_filters_list for required_filter in required_filters_list]):
-                        continue
-                if filters.used_by is not None:
-                    required_filters_list = [_filter.id for _filter in filters.used_by]
-                    item_filters_list = [_filter.id for _filter in item_filters.used_by]
-                    if not any([required_filter in item_filters_list for required_filter in required_filters_list]):
-                        continue
-                if filters.craft is not None:
-                    required_filters_list = [_filter.id for _filter in filters.craft]
-                    item_filters_list = [_filter.id for _filter in item_filters.craft]
-                    if not any([required_filter in item_filters_list for required_filter in required_filters_list]):
-                        continue
-                if filters.region is not None:
-                    required_filters_list = [_filter.id for _filter in filters.region]
-                    item_filters_list = [_filter.id for _filter in item_filters.region]
-                    if not any([required_filter in item_filters_list for required_filter in required_filters_list]):
-                        continue
-                if filters.genre is not None:
-                    required_filters_list = [_filter.id for _filter in filters.genre]
-                    item_filters_list = [_filter.id for _filter in item_filters.genre]
-                    if not any([required_filter in item_filters_list for required_filter in required_filters_list]):
-                        continue
-                if filters.mode is not None:
-                    required_filters_list = [_filter.id for _filter in filters.mode]
-                    item_filters_list = [_filter.id for _filter in item_filters.mode]
-                    if not any([required_filter in item_filters_list for required_filter in required_filters_list]):
-                        continue
-                if filters.trade is not None:
-                    required_filters_list = [_filter.id for _filter in filters.trade]
-                    item_filters_list = [_filter.id for _filter in item_filters.trade]
-                    if not any([required_filter in item_filters_list for required_filter in required_filters_list]):
-                        continue
-                if filters.rarity is not None:
-                    required_filters_list = [_filter.id for _filter in filters.rarity]
-                    item_filters_list = [_filter.id for _filter in item_filters.rarity]
-                    if not any([required_filter in item_filters_list for required_filter in required_filters_list]):
-                        continue
-                if filters.hero is not None:
-                    required_filters_list = [_filter.id for _filter in filters.hero]
-                    item_filters_list = [_filter.id for _filter in item_filters.hero]
-                    if not any([required_filter in item_filters_list for required_filter in required_filters_list]):
-                        continue
-
-                new_items.append(item)
-
-            inventory.items = new_items
+            encoder = FilterEncoder(gameid)
+            query = encoder.encode_query(filters)
+
+            masks = {}
+            matches = []
+            for gid in gids:
+                if gid not in masks:  # Информацию о каждой группе запрашиваем один раз
+                    masks[gid] = encoder.encode(self.get_item_info(gid).filters)
+                matches.append(encoder.matches(masks[gid], query))
+
+            if compact:
+                inventory = inventory.select(i for i, match in enumerate(matches) if match)
+            else:
+                inventory.items = [item for item, match in zip(inventory.items, matches) if match]
 
         return inventory
 
     @log
-    def multi_sell(self, gameid: int, gid: int, price: float, count: int) -> Sequence['SellResult']:
+    def multi_sell(
+            self,
+            gameid: int,
+            gid: int,
+            price: float,
+            count: int,
+            *,
+            rate: Optional[float] = None
+    ) -> Sequence['SellResult']:
         """Продать множество вещей из инвенторя с одним gid.
 
+        Предметы, которые не удалось выставить из-за ошибок, относящихся к одному предмету
+        (например, ItemAlreadySold), пропускаются с предупреждением в логах.
+
         Args:
             gameid (:obj:`int`): AppID приложения в Steam.
             gid (:obj:`int`): ID группы предметов.
             price (:obj:`float`): Цена для выставления на продажу.
             count (:obj:`int`): Количество предметов для продажи. Если число больше чем предметов в инвенторе,
                 будут проданы те, что имеются.
+            rate (:obj:`float`, optional): Максимальное количество продаж в секунду. По умолчанию не ограничено.
 
         Returns:
             Sequence[:class:`steam_trader.SellResult`]: Последовательноасть с результатами продаж.
 
         Raises:
-            OfferCreationFail: При создании заявки произошла неизвестная ошибка.
-            UnknownItem: Неизвестный предмет.
             NoTradeLink: Отсутствует сслыка для обмена.
-            IncorrectPrice: Неправильная цена заявки.
-            ItemAlreadySold: Предмет уже продан или отстутствует.
             AuthenticatorError: Мобильный аутентификатор не подключён
                 или с момента его подключения ещё не прошло 7 дней.
+
+        Changes:
+            0.5.0: Ошибки отдельных предметов больше не прерывают продажу. Добавлен аргумент rate.
         """
 
         inventory = self.get_inventory(gameid)
-        results = []
+        tasks = [SellTask(item.itemid, item.assetid, price) for item in inventory.items if item.gid == gid][:count]
 
-        for item in inventory.items:
-            if count == 0:
-                break
-            if item.gid == gid:
-                results.append(self.sell(item.itemid, item.assetid, price))
-                count -= 1
+        results = []
+        for attempt in self.sell_many(tasks, rate=rate):
+            if attempt.success:
+                results.append(attempt.result)
+            else:
+                logging.warning(f'Не удалось выставить предмет {attempt.itemid} :: {attempt.error}')
 
         return results
 
+    def sell_many(
+            self,
+            tasks: Iterable[Union['SellTask', tuple[int, int, float]]],
+            *,
+            rate: Optional[float] = None,
+            retries: int = 3
+    ) -> Iterator['SellAttempt']:
+        """Выставить на продажу множество предметов, возвращая результат каждого по мере выполнения.
+
+        Ошибки, относящиеся к одному предмету (ItemAlreadySold, IncorrectPrice, UnknownItem и т.д.),
+        не прерывают продажу и возвращаются в поле error. При TooManyRequests запрос повторяется с увеличением паузы.
+
+        Args:
+            tasks (Iterable[:NamedTuple:`SellTask(itemid: int, assetid: int, price: float)`]):
+                Предметы для продажи.
+            rate (:obj:`float`, optional): Максимальное количество продаж в секунду. По умолчанию не ограничено.
+            retries (:obj:`int`): Количество повторов при TooManyRequests. По умолчанию 3.
+
+        Yields:
+            :class:`steam_trader.ext.SellAttempt`: Результат попытки продажи.
+
+        Raises:
+            NoTradeLink: Отсутствует сслыка для обмена.
+            AuthenticatorError: Мобильный аутентификатор не подключён
+                или с момента его подключения ещё не прошло 7 дней.
+        """
+
+        limiter = RateLimiter(rate) if rate is not None else None
+
+        for itemid, assetid, price in tasks:
+            yield self._sell_attempt(itemid, assetid, price, limiter, retries)
+
+    def _sell_attempt(
+            self,
+            itemid: int,
+            assetid: int,
+            price: float,
+            limiter: Optional['RateLimiter'],
+            retries: int
+    ) -> 'SellAttempt':
+
+        error = None
+        for attempt in range(retries + 1):
+            if limiter is not None:
+                limiter.acquire()
+            try:
+                return SellAttempt(itemid, assetid, price, result=self.sell(itemid, assetid, price))
+            except TooManyRequests as e:
+                error = e
+                if attempt == retries:
+                    break
+                backoff = 2 ** attempt
+                logging.warning(f'Слишком много запросов, повтор через {backoff} с.')
+                if limiter is not None:
+                    limiter.penalize(backoff)
+                else:
+                    time.sleep(backoff)
+            except NON_FATAL_SELL_ERRORS as e:
+                return SellAttempt(itemid, assetid, price, error=e)
+
+        return SellAttempt(itemid, assetid, price, error=error)
+
     @log
     def set_trade_mode(self, state: int) -> 'TradeMode':
         """Задать режим торговли.
@@ -310,3 +357,55 @@ class ExtClient(Client):
         if lowest is None or highest is None:
             raise UnknownItem('Отсутствуют предложения о продаже/покупке или отсутствует история продаж.')
         return PriceRange(float(lowest), float(highest))
+
+    def iter_operations_history(
+            self,
+            *,
+            operation_type: Union[int, Sequence[int], None] = None,
+            until_id: Optional[int] = None
+    ) -> Iterator['OperationsHistoryItem']:
+        """Перебрать всю историю операций постранично.
+
+        Операции, сместившиеся на следующую страницу из-за новых операций, повторно не возвращаются.
+
+        Args:
+            operation_type (Union[:obj:`int`, Sequence[:obj:`int`], :obj:`None`]): Тип или типы операций.
+                Если указано несколько типов, их истории объединяются в порядке убывания даты.
+                По умолчанию все типы.
+            until_id (:obj:`int`, optional): ID последней известной операции. Перебор останавливается на ней,
+                сама операция и более старые не возвращаются.
+
+        Yields:
+            :class:`steam_trader.OperationsHistoryItem`: Операции от новых к старым.
+        """
+
+        if operation_type is None or isinstance(operation_type, int):
+            yield from self._iter_operations_stream(operation_type, until_id)
+            return
+
+        yield from heapq.merge(
+            *(self._iter_operations_stream(_type, until_id) for _type in operation_type),
+            key=lambda item: (item.date, item.id),
+            reverse=True
+        )
+
+    def _iter_operations_stream(
+            self,
+            operation_type: Optional[int],
+            until_id: Optional[int]
+    ) -> Iterator['OperationsHistoryItem']:
+
+        seen = set()
+        page = 0
+        while True:
+            history = self.get_operations_history(operation_type=operation_type, page=page)
+            if not history.data:
+                return
+            for item in history.data:
+                if until_id is not None and item.id <= until_id:
+                    return
+                if item.id in seen:
+                    continue
+                seen.add(item.id)
+                yield item
+            page += 1
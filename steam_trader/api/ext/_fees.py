@@ -0,0 +1,200 @@
+import math
+import time
+import asyncio
+from array import array
+from collections import namedtuple
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Optional, Union, Any
+
+from steam_trader.exceptions import UnsupportedAppID
+
+if TYPE_CHECKING:
+    from steam_trader.api import Client, ClientAsync, Discounts, Inventory, CompactInventory, OrderBook
+
+Fees = namedtuple('Fees', ['commission', 'discount'])
+
+BookFees = namedtuple('BookFees', ['costs', 'proceeds'])
+
+Prices = Union[Iterable[Optional[float]], array, Any]
+
+
+def _scale(prices: Prices, factor: float) -> Union[array, Any]:
+    if hasattr(prices, '__array_ufunc__'):  # numpy.ndarray умножается целиком, без цикла в python
+        return prices * factor
+    return array('d', (math.nan if price is None else price * factor for price in prices))
+
+
+class FeeModel:
+    """Класс, представляющий модель комиссий и скидок сайта.
+
+    Комиссии и скидки берутся из :class:`steam_trader.Discounts` и хранятся локально, поэтому расчёт выручки
+    не требует запросов. Если указан синхронный клиент, данные обновляются при первом обращении после
+    истечения ttl. Для асинхронного клиента обновление выполняет :meth:`run` или :meth:`refresh_async`,
+    до первого обновления методы расчёта вызывают RuntimeError.
+
+    Методы расчёта принимают последовательность цен, :class:`array.array` или ``numpy.ndarray`` и возвращают
+    :class:`array.array` типа 'd' или ``numpy.ndarray`` соответственно. Пустые цены превращаются в NaN.
+    Округление до копеек не выполняется.
+
+    Args:
+        client (Union[:class:`steam_trader.Client`, :class:`steam_trader.ClientAsync`], optional): Клиент
+            для получения комиссий.
+        ttl (:obj:`float`): Время в секундах, через которое данные нужно обновить. По умолчанию 3600.
+        discounts (:class:`steam_trader.Discounts`, optional): Уже полученные комиссии/скидки.
+
+    Attributes:
+        client (Union[:class:`steam_trader.Client`, :class:`steam_trader.ClientAsync`], optional): Клиент
+            для получения комиссий.
+        ttl (:obj:`float`): Время в секундах, через которое данные нужно обновить.
+    """
+
+    __slots__ = [
+        'client',
+        'ttl',
+        '_fees',
+        '_updated'
+    ]
+
+    def __init__(
+            self,
+            client: Union['Client', 'ClientAsync', None] = None,
+            *,
+            ttl: float = 3600,
+            discounts: Optional['Discounts'] = None
+    ) -> None:
+        self.client = client
+        self.ttl = ttl
+        self._fees: dict[int, Fees] = {}
+        self._updated: Optional[float] = None
+        if discounts is not None:
+            self.update(discounts)
+
+    @property
+    def stale(self) -> bool:
+        """Истина, если данные не загружены или устарели."""
+
+        return self._updated is None or time.monotonic() - self._updated >= self.ttl
+
+    def update(self, discounts: 'Discounts') -> None:
+        """Обновить комиссии и скидки.
+
+        Args:
+            discounts (:class:`steam_trader.Discounts`): Комиссии/скидки на игры.
+        """
+
+        self._fees = {
+            appid: Fees(discount.commission / 100, discount.discount / 100) for appid, discount in discounts.data.items()
+        }
+        self._updated = time.monotonic()
+
+    def refresh(self) -> None:
+        """Запросить комиссии и скидки через синхронный клиент."""
+
+        self.update(self.client.get_discounts())
+
+    async def refresh_async(self) -> None:
+        """Запросить комиссии и скидки через асинхронный клиент."""
+
+        self.update(await self.client.get_discounts())
+
+    async def run(self) -> None:
+        """Обновлять комиссии и скидки через асинхронный клиент каждые ttl секунд. Работает до отмены задачи."""
+
+        while True:
+            await self.refresh_async()
+            await asyncio.sleep(self.ttl)
+
+    def fees(self, gameid: int) -> 'Fees':
+        """Получить комиссию и скидку игры.
+
+        Args:
+            gameid (:obj:`int`): AppID игры.
+
+        Returns:
+            :class:`Fees`: Комиссия на продажу и скидка на покупку в долях.
+
+        Raises:
+            UnsupportedAppID: Нет данных о комиссии для этой игры.
+            RuntimeError: Комиссии ещё не загружены. Для асинхронного клиента сначала вызовите
+                :meth:`refresh_async` или запустите :meth:`run`.
+        """
+
+        if self.stale and self.client is not None and not asyncio.iscoroutinefunction(self.client.get_discounts):
+            self.refresh()
+        if self._updated is None:
+            raise RuntimeError('Комиссии не загружены. Вызовите refresh_async или run, либо передайте discounts.')
+        try:
+            return self._fees[gameid]
+        except KeyError:
+            raise UnsupportedAppID('Указан недействительный AppID.') from None
+
+    def net_proceeds(self, gameid: int, prices: Prices) -> Union[array, Any]:
+        """Рассчитать выручку с продажи за вычетом комиссии.
+
+        Args:
+            gameid (:obj:`int`): AppID игры.
+            prices (Iterable[:obj:`float`]): Цены продажи.
+
+        Returns:
+            :class:`array.array`: Выручка для каждой цены.
+        """
+
+        return _scale(prices, 1 - self.fees(gameid).commission)
+
+    def purchase_cost(self, gameid: int, prices: Prices) -> Union[array, Any]:
+        """Рассчитать стоимость покупки с учётом скидки.
+
+        Args:
+            gameid (:obj:`int`): AppID игры.
+            prices (Iterable[:obj:`float`]): Цены предложений о продаже.
+
+        Returns:
+            :class:`array.array`: Стоимость для каждой цены.
+        """
+
+        return _scale(prices, 1 - self.fees(gameid).discount)
+
+    def break_even(self, gameid: int, costs: Prices) -> Union[array, Any]:
+        """Рассчитать минимальную цену продажи, при которой выручка покрывает затраты.
+
+        Args:
+            gameid (:obj:`int`): AppID игры.
+            costs (Iterable[:obj:`float`]): Затраты на покупку предметов.
+
+        Returns:
+            :class:`array.array`: Цена безубыточности для каждого предмета.
+        """
+
+        return _scale(costs, 1 / (1 - self.fees(gameid).commission))
+
+    def inventory_proceeds(self, inventory: Union['Inventory', 'CompactInventory']) -> Union[array, Any]:
+        """Рассчитать выручку с продажи всех предметов инвентаря по их текущим ценам.
+
+        Args:
+            inventory (Union[:class:`steam_trader.Inventory`, :class:`steam_trader.CompactInventory`]): Инвентарь.
+
+        Returns:
+            :class:`array.array`: Выручка для каждого предмета. NaN для предметов без цены.
+        """
+
+        if hasattr(inventory, 'column'):
+            prices = inventory.column('price')
+        else:
+            prices = (item.price for item in inventory.items)
+        return self.net_proceeds(inventory.gameid, prices)
+
+    def order_book(self, gameid: int, book: 'OrderBook') -> 'BookFees':
+        """Рассчитать стоимость покупки по предложениям о продаже и выручку с продажи по заявкам на покупку.
+
+        Args:
+            gameid (:obj:`int`): AppID игры.
+            book (:class:`steam_trader.OrderBook`): Заявки о покупке/продаже предмета.
+
+        Returns:
+            :class:`BookFees`: Стоимость и выручка для каждого уровня стакана.
+        """
+
+        return BookFees(
+            self.purchase_cost(gameid, (price for price, _ in book.sell)),
+            self.net_proceeds(gameid, (price for price, _ in book.buy))
+        )
@@ -0,0 +1,194 @@
+import os
+import sqlite3
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Optional, Union
+
+from steam_trader.api import OperationsHistoryItem
+
+if TYPE_CHECKING:
+    from ._client_ext import ExtClient
+    from ._client_async_ext import ExtClientAsync
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS operations (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    type INTEGER NOT NULL,
+    amount REAL NOT NULL,
+    currency INTEGER NOT NULL,
+    date INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS operations_type_date ON operations (type, date);
+CREATE INDEX IF NOT EXISTS operations_date ON operations (date);
+CREATE INDEX IF NOT EXISTS operations_amount ON operations (amount);
+"""
+
+_COLUMNS = 'id, name, type, amount, currency, date'
+
+
+class OperationsLedger:
+    """Класс, представляющий локальный журнал операций.
+
+    Операции хранятся в базе SQLite и не повторяются. При синхронизации загружаются только операции новее
+    последней сохранённой, поэтому отчёты и сверка баланса не требуют повторной загрузки всей истории.
+
+    Args:
+        path (Union[:obj:`str`, :obj:`os.PathLike`]): Путь к файлу базы. По умолчанию база хранится в памяти.
+
+    Attributes:
+        path (Union[:obj:`str`, :obj:`os.PathLike`]): Путь к файлу базы.
+    """
+
+    __slots__ = [
+        'path',
+        '_connection'
+    ]
+
+    def __init__(self, path: Union[str, os.PathLike] = ':memory:') -> None:
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> 'OperationsLedger':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute('SELECT COUNT(*) FROM operations').fetchone()[0]
+
+    def close(self) -> None:
+        """Закрыть базу."""
+
+        self._connection.close()
+
+    @property
+    def last_id(self) -> Optional[int]:
+        """ID последней сохранённой операции. None, если журнал пуст."""
+
+        return self._connection.execute('SELECT MAX(id) FROM operations').fetchone()[0]
+
+    def add(self, items: Iterable['OperationsHistoryItem']) -> int:
+        """Добавить операции в журнал. Уже сохранённые операции пропускаются.
+
+        Args:
+            items (Iterable[:class:`steam_trader.OperationsHistoryItem`]): Операции.
+
+        Returns:
+            :obj:`int`: Количество добавленных операций.
+        """
+
+        with self._connection:
+            cursor = self._connection.executemany(
+                f'INSERT OR IGNORE INTO operations ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)',
+                ((item.id, item.name, item.type, item.amount, item.currency, item.date) for item in items)
+            )
+        return cursor.rowcount
+
+    def sync(self, client: 'ExtClient') -> int:
+        """Загрузить операции новее последней сохранённой.
+
+        Операции сохраняются одной транзакцией после полной загрузки, поэтому прерванная синхронизация
+        не оставляет пропусков в журнале.
+
+        Args:
+            client (:class:`steam_trader.ext.ExtClient`): Клиент Steam Trader.
+
+        Returns:
+            :obj:`int`: Количество добавленных операций.
+        """
+
+        return self.add(list(client.iter_operations_history(until_id=self.last_id)))
+
+    async def sync_async(self, client: 'ExtClientAsync', *, prefetch: int = 4) -> int:
+        """Загрузить операции новее последней сохранённой с помощью асинхронного клиента.
+
+        Args:
+            client (:class:`steam_trader.ext.ExtClientAsync`): Клиент Steam Trader.
+            prefetch (:obj:`int`): Количество страниц, загружаемых заранее. По умолчанию 4.
+
+        Returns:
+            :obj:`int`: Количество добавленных операций.
+        """
+
+        items = [item async for item in client.iter_operations_history(prefetch=prefetch, until_id=self.last_id)]
+        return self.add(items)
+
+    def query(
+            self,
+            *,
+            operation_type: Union[int, Sequence[int], None] = None,
+            since: Optional[int] = None,
+            until: Optional[int] = None,
+            min_amount: Optional[float] = None,
+            max_amount: Optional[float] = None,
+            limit: Optional[int] = None
+    ) -> list['OperationsHistoryItem']:
+        """Выбрать операции из журнала.
+
+        Args:
+            operation_type (Union[:obj:`int`, Sequence[:obj:`int`], :obj:`None`]): Тип или типы операций.
+            since (:obj:`int`, optional): Timestamp, начиная с которого выбираются операции.
+            until (:obj:`int`, optional): Timestamp, до которого (не включительно) выбираются операции.
+            min_amount (:obj:`float`, optional): Минимальная сумма операции.
+            max_amount (:obj:`float`, optional): Максимальная сумма операции.
+            limit (:obj:`int`, optional): Максимальное количество операций.
+
+        Returns:
+            list[:class:`steam_trader.OperationsHistoryItem`]: Операции от новых к старым.
+        """
+
+        where, params = self._where(operation_type, since, until, min_amount, max_amount)
+        sql = f'SELECT {_COLUMNS} FROM operations{where} ORDER BY date DESC, id DESC'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        return [
+            OperationsHistoryItem(id=row[0], name=row[1], type=row[2], amount=row[3], currency=row[4], date=row[5])
+            for row in self._connection.execute(sql, params)
+        ]
+
+    def total(
+            self,
+            *,
+            operation_type: Union[int, Sequence[int], None] = None,
+            since: Optional[int] = None,
+            until: Optional[int] = None,
+            min_amount: Optional[float] = None,
+            max_amount: Optional[float] = None
+    ) -> float:
+        """Посчитать сумму операций. Аргументы аналогичны :meth:`query`.
+
+        Returns:
+            :obj:`float`: Сумма операций.
+        """
+
+        where, params = self._where(operation_type, since, until, min_amount, max_amount)
+        return self._connection.execute(f'SELECT TOTAL(amount) FROM operations{where}', params).fetchone()[0]
+
+    @staticmethod
+    def _where(
+            operation_type: Union[int, Sequence[int], None],
+            since: Optional[int],
+            until: Optional[int],
+            min_amount: Optional[float],
+            max_amount: Optional[float]
+    ) -> tuple[str, list]:
+
+        conditions = []
+        params = []
+        if operation_type is not None:
+            types = [operation_type] if isinstance(operation_type, int) else list(operation_type)
+            conditions.append(f'type IN ({", ".join("?" * len(types))})')
+            params.extend(types)
+        for condition, value in (
+                ('date >= ?', since),
+                ('date < ?', until),
+                ('amount >= ?', min_amount),
+                ('amount <= ?', max_amount)
+        ):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+        return (' WHERE ' + ' AND '.join(conditions) if conditions else ''), params
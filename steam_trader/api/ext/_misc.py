@@ -1,7 +1,7 @@
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Optional, Union
 
-from steam_trader.api import TraderClientObject
+from steam_trader.api import TraderClientObject, SellResult
 from steam_trader import exceptions
 
 if TYPE_CHECKING:
@@ -10,6 +10,16 @@ if TYPE_CHECKING:
 
 from collections import namedtuple
 PriceRange = namedtuple('PriceRange', ['lowest', 'highest'])
+SellTask = namedtuple('SellTask', ['itemid', 'assetid', 'price'])
+
+# Ошибки, относящиеся к одному предмету. После них можно продолжать выставлять остальные.
+NON_FATAL_SELL_ERRORS = (
+    exceptions.ItemAlreadySold,
+    exceptions.IncorrectPrice,
+    exceptions.UnknownItem,
+    exceptions.NoLongerExists,
+    exceptions.InternalError
+)
 
 
 @dataclass(slots=True)
@@ -20,14 +30,11 @@ class TradeMode(TraderClientObject):
         success (:obj:`bool`): Результат запроса.
         state (:obj:`bool`): Режим обычной торговли.
         p2p (:obj:`bool`): Режим p2p торговли.
-        client (Union[:class:`steam_trader.ExtClient`, :class:`steam_trader.ExtClientAsync`, :obj:`None`]):
-                Клиент Steam Trader.
     """
 
     success: bool
     state: bool
     p2p: bool
-    client: Union['ExtClient', 'ExtClientAsync', None]
 
     @classmethod
     def de_json(
@@ -47,5 +54,30 @@ class TradeMode(TraderClientObject):
 
         data = super(TradeMode, cls).de_json(data)
 
-        return cls(client=client, **data)
+        return cls(**data)
+
+
+
+@dataclass(slots=True)
+class SellAttempt:
+    """Класс, представляющий результат попытки выставить предмет на продажу.
+
+    Attributes:
+        itemid (:obj:`int`): Уникальный ID предмета.
+        assetid (:obj:`int`): AssetID предмета в Steam.
+        price (:obj:`float`): Цена, за которую предмет выставлялся на продажу.
+        result (:class:`steam_trader.SellResult`, optional): Результат продажи. None, если продажа не удалась.
+        error (:obj:`Exception`, optional): Ошибка, из-за которой продажа не удалась.
+    """
+
+    itemid: int
+    assetid: int
+    price: float
+    result: Optional['SellResult'] = None
+    error: Optional[Exception] = None
+
+    @property
+    def success(self) -> bool:
+        """Был ли предмет выставлен на продажу."""
 
+        return self.result is not None
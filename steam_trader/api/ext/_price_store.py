@@ -0,0 +1,263 @@
+import os
+import math
+import mmap
+import time
+import struct
+from collections import OrderedDict, namedtuple
+from typing import TYPE_CHECKING, Optional, Union
+
+if TYPE_CHECKING:
+    from steam_trader.api import MinPrices
+
+PRICE_RECORD = struct.Struct('<qdddii')
+"""Формат записи: timestamp, market_price, buy_price, steam_price, count_sell_offers, count_buy_offers.
+Отсутствующие цены хранятся как NaN. Совместим с ``numpy.dtype('<i8,<f8,<f8,<f8,<i4,<i4')``."""
+
+PriceSample = namedtuple(
+    'PriceSample',
+    ['timestamp', 'market_price', 'buy_price', 'steam_price', 'count_sell_offers', 'count_buy_offers']
+)
+
+
+class PriceStore:
+    """Класс, представляющий хранилище истории цен предметов.
+
+    Для каждой группы предметов создаётся файл из записей фиксированного размера, которые только дописываются
+    в порядке времени. Чтение выполняется через отображение файла в память и бинарный поиск по времени, поэтому
+    выборка диапазона не требует разбора и копирования данных. Запись и чтение можно выполнять из разных процессов.
+
+    Каждое отображение держит открытый файловый дескриптор, поэтому одновременно открыто не больше max_open
+    отображений, давно не использованные закрываются. Запись не открывает отображений.
+
+    Поддерживает контекстный менеджер.
+
+    Args:
+        path (Union[:obj:`str`, :obj:`os.PathLike`]): Путь к папке хранилища. Создаётся, если не существует.
+        max_open (:obj:`int`): Наибольшее количество одновременно открытых отображений. По умолчанию 64.
+
+    Attributes:
+        path (Union[:obj:`str`, :obj:`os.PathLike`]): Путь к папке хранилища.
+        max_open (:obj:`int`): Наибольшее количество одновременно открытых отображений.
+
+    Raises:
+        ValueError: Недопустимое значение max_open.
+    """
+
+    __slots__ = [
+        'path',
+        'max_open',
+        '_maps',
+        '_last'
+    ]
+
+    def __init__(self, path: Union[str, os.PathLike], *, max_open: int = 64) -> None:
+        if max_open < 1:
+            raise ValueError(f'Недопустимое значение max_open :: {max_open}')
+
+        self.path = path
+        self.max_open = max_open
+        self._maps: OrderedDict[int, mmap.mmap] = OrderedDict()
+        self._last: dict[int, int] = {}
+        os.makedirs(path, exist_ok=True)
+
+    def __enter__(self) -> 'PriceStore':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def gids(self) -> list[int]:
+        """Получить ID групп предметов, для которых есть записи.
+
+        Returns:
+            list[:obj:`int`]: ID групп предметов.
+        """
+
+        return sorted(int(name[:-4]) for name in os.listdir(self.path) if name.endswith('.bin'))
+
+    def append(self, gid: int, prices: 'MinPrices', timestamp: Optional[int] = None) -> None:
+        """Добавить запись цен.
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+            prices (:class:`steam_trader.api.MinPrices`): Цены предмета.
+            timestamp (:obj:`int`, optional): Время записи. По умолчанию текущее время.
+
+        Raises:
+            ValueError: Время записи меньше времени последней записи.
+        """
+
+        self.append_raw(
+            gid,
+            int(time.time()) if timestamp is None else timestamp,
+            prices.market_price,
+            prices.buy_price,
+            prices.steam_price,
+            prices.count_sell_offers,
+            prices.count_buy_offers
+        )
+
+    def append_raw(
+            self,
+            gid: int,
+            timestamp: int,
+            market_price: Optional[float],
+            buy_price: Optional[float],
+            steam_price: Optional[float],
+            count_sell_offers: int,
+            count_buy_offers: int
+    ) -> None:
+        """Добавить запись цен из отдельных значений.
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+            timestamp (:obj:`int`): Время записи.
+            market_price (:obj:`float`, optional): Минимальная цена продажи.
+            buy_price (:obj:`float`, optional): Максимальная цена покупки.
+            steam_price (:obj:`float`, optional): Минимальная цена в Steam.
+            count_sell_offers (:obj:`int`): Количество предложений о продаже.
+            count_buy_offers (:obj:`int`): Количество предложений о покупке.
+
+        Raises:
+            ValueError: Время записи меньше времени последней записи.
+        """
+
+        last = self._last_timestamp(gid)
+        if last is not None and timestamp < last:
+            raise ValueError(f'Недопустимое значение timestamp :: {timestamp}')
+
+        record = PRICE_RECORD.pack(
+            timestamp,
+            math.nan if market_price is None else market_price,
+            math.nan if buy_price is None else buy_price,
+            math.nan if steam_price is None else steam_price,
+            count_sell_offers,
+            count_buy_offers
+        )
+        fd = os.open(self._file(gid), os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, 'O_BINARY', 0))
+        try:
+            os.write(fd, record)
+        finally:
+            os.close(fd)
+        self._last[gid] = timestamp
+
+    def view(self, gid: int, since: Optional[int] = None, until: Optional[int] = None) -> memoryview:
+        """Получить записи за период без копирования.
+
+        Результат можно передать в ``numpy.frombuffer`` или разобрать через ``PRICE_RECORD.iter_unpack``.
+        Представление действительно до закрытия хранилища.
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+            since (:obj:`int`, optional): Начало периода включительно.
+            until (:obj:`int`, optional): Конец периода включительно.
+
+        Returns:
+            :obj:`memoryview`: Последовательные записи в формате :data:`PRICE_RECORD`.
+        """
+
+        buffer = self._map(gid)
+        if buffer is None:
+            return memoryview(b'')
+        count = len(buffer) // PRICE_RECORD.size
+        start = 0 if since is None else self._bisect(buffer, count, since, False)
+        end = count if until is None else self._bisect(buffer, count, until, True)
+        return memoryview(buffer)[start * PRICE_RECORD.size:max(start, end) * PRICE_RECORD.size]
+
+    def samples(self, gid: int, since: Optional[int] = None, until: Optional[int] = None) -> list[PriceSample]:
+        """Получить записи за период.
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+            since (:obj:`int`, optional): Начало периода включительно.
+            until (:obj:`int`, optional): Конец периода включительно.
+
+        Returns:
+            list[:NamedTuple:`PriceSample(timestamp, market_price, buy_price, steam_price, count_sell_offers,
+                count_buy_offers)`]: Записи от старых к новым. Отсутствующие цены равны None.
+        """
+
+        view = self.view(gid, since, until)
+        try:
+            return [
+                PriceSample(
+                    timestamp,
+                    None if math.isnan(market_price) else market_price,
+                    None if math.isnan(buy_price) else buy_price,
+                    None if math.isnan(steam_price) else steam_price,
+                    count_sell_offers,
+                    count_buy_offers
+                )
+                for timestamp, market_price, buy_price, steam_price, count_sell_offers, count_buy_offers
+                in PRICE_RECORD.iter_unpack(view)
+            ]
+        finally:
+            view.release()
+
+    def close(self) -> None:
+        """Закрыть отображения файлов."""
+
+        for buffer in self._maps.values():
+            self._close_map(buffer)
+        self._maps.clear()
+
+    def _file(self, gid: int) -> str:
+        return os.path.join(self.path, f'{gid}.bin')
+
+    def _map(self, gid: int) -> Optional[mmap.mmap]:
+        path = self._file(gid)
+        try:
+            size = os.path.getsize(path)
+        except FileNotFoundError:
+            return None
+        size -= size % PRICE_RECORD.size  # Запись может быть дописана в этот момент другим процессом
+        if not size:
+            return None
+
+        buffer = self._maps.get(gid)
+        if buffer is not None and len(buffer) == size:
+            self._maps.move_to_end(gid)
+            return buffer
+        with open(path, 'rb') as file:
+            new_buffer = mmap.mmap(file.fileno(), size, access=mmap.ACCESS_READ)
+        self._maps[gid] = new_buffer
+        self._maps.move_to_end(gid)
+        if buffer is not None:
+            self._close_map(buffer)
+        while len(self._maps) > self.max_open:
+            self._close_map(self._maps.popitem(last=False)[1])
+        return new_buffer
+
+    def _last_timestamp(self, gid: int) -> Optional[int]:
+        if gid not in self._last:
+            # Читаем только последнюю запись, без отображения файла
+            try:
+                with open(self._file(gid), 'rb') as file:
+                    size = file.seek(0, os.SEEK_END)
+                    size -= size % PRICE_RECORD.size
+                    if not size:
+                        return None
+                    file.seek(size - PRICE_RECORD.size)
+                    self._last[gid] = PRICE_RECORD.unpack(file.read(PRICE_RECORD.size))[0]
+            except FileNotFoundError:
+                return None
+        return self._last[gid]
+
+    @staticmethod
+    def _close_map(buffer: mmap.mmap) -> None:
+        try:
+            buffer.close()
+        except BufferError:  # Представление ещё используется, отображение закроется сборщиком мусора
+            pass
+
+    @staticmethod
+    def _bisect(buffer: mmap.mmap, count: int, timestamp: int, right: bool) -> int:
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            value = PRICE_RECORD.unpack_from(buffer, middle * PRICE_RECORD.size)[0]
+            if value < timestamp or (right and value == timestamp):
+                low = middle + 1
+            else:
+                high = middle
+        return low
@@ -0,0 +1,306 @@
+import asyncio
+import logging
+import dataclasses
+from collections import Counter, namedtuple
+from collections.abc import Callable, Iterable, Sequence
+from typing import Optional
+
+from ._misc import NON_FATAL_SELL_ERRORS
+
+from steam_trader._rate_limit import RateLimiter, AsyncRateLimiter
+from steam_trader.api import Client, ClientAsync, InventoryItem, OrderBook
+
+
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+RepriceDecision = namedtuple('RepriceDecision', ['itemid', 'gid', 'old_price', 'new_price'])
+
+Strategy = Callable[['InventoryItem', 'OrderBook'], Optional[float]]
+"""Стратегия получает предмет и стакан заявок без собственных предложений и возвращает новую цену
+или None, если цену менять не нужно."""
+
+
+class UndercutStrategy:
+    """Класс, представляющий стратегию "быть первым в очереди".
+
+    Цена выставляется на шаг ниже самого дешёвого чужого предложения. Если мы уже первые, цена
+    поднимается до уровня на шаг ниже следующего предложения. Цена не опускается ниже лучшей заявки
+    на покупку, так как в этом случае выгоднее продать по заявке.
+
+    Args:
+        step (:obj:`float`): Шаг цены. По умолчанию 0.01.
+        min_price (:obj:`float`, optional): Минимальная цена. Ниже неё цена не опускается.
+        max_price (:obj:`float`, optional): Цена для предметов без конкурентов. Если не указана, цена
+            таких предметов не меняется.
+
+    Attributes:
+        step (:obj:`float`): Шаг цены.
+        min_price (:obj:`float`, optional): Минимальная цена.
+        max_price (:obj:`float`, optional): Цена для предметов без конкурентов.
+    """
+
+    __slots__ = [
+        'step',
+        'min_price',
+        'max_price'
+    ]
+
+    def __init__(self, step: float = 0.01, min_price: Optional[float] = None, max_price: Optional[float] = None) -> None:
+        self.step = step
+        self.min_price = min_price
+        self.max_price = max_price
+
+    def __call__(self, item: 'InventoryItem', book: 'OrderBook') -> Optional[float]:
+        if not book.sell:
+            return self.max_price
+
+        new_price = round(book.sell[0][0] - self.step, 2)
+        if self.max_price is not None:
+            new_price = min(new_price, self.max_price)
+        if self.min_price is not None and new_price < self.min_price:
+            return None
+        if book.buy and new_price <= book.buy[0][0]:
+            return None
+        return new_price
+
+
+def exclude_own(book: 'OrderBook', listings: Iterable['InventoryItem']) -> 'OrderBook':
+    """Убрать собственные предложения из стакана заявок.
+
+    Args:
+        book (:class:`steam_trader.OrderBook`): Стакан заявок.
+        listings (Iterable[:class:`steam_trader.InventoryItem`]): Собственные предложения о продаже.
+
+    Returns:
+        :class:`steam_trader.OrderBook`: Новый стакан заявок.
+    """
+
+    own = Counter(item.price for item in listings)
+    sell = []
+    removed = 0
+    for price, count in book.sell:
+        left = count - own.pop(price, 0)
+        removed += count - max(left, 0)
+        if left > 0:
+            sell.append([price, left])
+    return dataclasses.replace(book, sell=sell, total_sell=book.total_sell - removed)
+
+
+def _group_listings(listings: Iterable['InventoryItem']) -> dict[int, list['InventoryItem']]:
+    groups: dict[int, list[InventoryItem]] = {}
+    for item in listings:
+        if item.id is None or item.price is None:
+            continue
+        groups.setdefault(item.gid, []).append(item)
+    return groups
+
+
+def _decide(strategy: Strategy, items: Sequence['InventoryItem'], book: 'OrderBook') -> list[RepriceDecision]:
+    book = exclude_own(book, items)
+    decisions = []
+    for item in items:
+        new_price = strategy(item, book)
+        if new_price is None:
+            continue
+        new_price = round(new_price, 2)
+        if new_price != item.price:
+            decisions.append(RepriceDecision(item.id, item.gid, item.price, new_price))
+    return decisions
+
+
+class Repricer:
+    """Класс, представляющий движок массового изменения цен.
+
+    Предложения группируются по gid, поэтому стакан заявок запрашивается один раз на группу,
+    а количество запросов зависит от количества разных предметов, а не предложений.
+    Изменения, которые не меняют цену, не отправляются.
+
+    Args:
+        client (:class:`steam_trader.Client`): Клиент Steam Trader.
+        strategy (Callable[[:class:`steam_trader.InventoryItem`, :class:`steam_trader.OrderBook`], :obj:`float`]):
+            Стратегия расчёта цены. По умолчанию :class:`UndercutStrategy`.
+        rate (:obj:`float`, optional): Ограничение количества запросов в секунду.
+
+    Attributes:
+        client (:class:`steam_trader.Client`): Клиент Steam Trader.
+        strategy (Callable[[:class:`steam_trader.InventoryItem`, :class:`steam_trader.OrderBook`], :obj:`float`]):
+            Стратегия расчёта цены.
+    """
+
+    __slots__ = [
+        'client',
+        'strategy',
+        '_limiter'
+    ]
+
+    def __init__(self, client: 'Client', strategy: Optional[Strategy] = None, *, rate: Optional[float] = None) -> None:
+        if strategy is None:
+            strategy = UndercutStrategy()
+
+        self.client = client
+        self.strategy = strategy
+        self._limiter = RateLimiter(rate) if rate is not None else None
+
+    def plan(self, listings: Iterable['InventoryItem']) -> list[RepriceDecision]:
+        """Рассчитать новые цены без их изменения.
+
+        Args:
+            listings (Iterable[:class:`steam_trader.InventoryItem`]): Предложения о продаже.
+
+        Returns:
+            list[:class:`RepriceDecision`]: Изменения цен.
+        """
+
+        decisions = []
+        for gid, items in _group_listings(listings).items():
+            if self._limiter is not None:
+                self._limiter.acquire()
+            decisions.extend(_decide(self.strategy, items, self.client.get_order_book(gid)))
+        return decisions
+
+    def apply(self, decisions: Iterable[RepriceDecision]) -> list[RepriceDecision]:
+        """Применить изменения цен. Ошибки, относящиеся к одному предмету, пропускаются.
+
+        Args:
+            decisions (Iterable[:class:`RepriceDecision`]): Изменения цен.
+
+        Returns:
+            list[:class:`RepriceDecision`]: Применённые изменения.
+        """
+
+        applied = []
+        for decision in decisions:
+            if self._limiter is not None:
+                self._limiter.acquire()
+            try:
+                self.client.edit_price(decision.itemid, decision.new_price)
+            except NON_FATAL_SELL_ERRORS as e:
+                logging.warning(f'Не удалось изменить цену предмета {decision.itemid}: {e}')
+                continue
+            applied.append(decision)
+        return applied
+
+    def reprice(self, gameid: int) -> list[RepriceDecision]:
+        """Пересчитать цены всех предметов игры, выставленных на продажу.
+
+        Args:
+            gameid (:obj:`int`): AppID приложения в Steam.
+
+        Returns:
+            list[:class:`RepriceDecision`]: Применённые изменения.
+        """
+
+        listings = [item for item in self.client.get_inventory(gameid, status=[0]).items if item.type == 0]
+        return self.apply(self.plan(listings))
+
+
+class RepricerAsync:
+    """Класс, представляющий асинхронный движок массового изменения цен.
+
+    Предложения группируются по gid, поэтому стакан заявок запрашивается один раз на группу,
+    а количество запросов зависит от количества разных предметов, а не предложений.
+    Изменения, которые не меняют цену, не отправляются. Запросы выполняются параллельно.
+
+    Args:
+        client (:class:`steam_trader.ClientAsync`): Клиент Steam Trader.
+        strategy (Callable[[:class:`steam_trader.InventoryItem`, :class:`steam_trader.OrderBook`], :obj:`float`]):
+            Стратегия расчёта цены. По умолчанию :class:`UndercutStrategy`.
+        max_concurrency (:obj:`int`): Максимальное количество одновременных запросов. По умолчанию 4.
+        rate (:obj:`float`, optional): Ограничение количества запросов в секунду.
+
+    Attributes:
+        client (:class:`steam_trader.ClientAsync`): Клиент Steam Trader.
+        strategy (Callable[[:class:`steam_trader.InventoryItem`, :class:`steam_trader.OrderBook`], :obj:`float`]):
+            Стратегия расчёта цены.
+        max_concurrency (:obj:`int`): Максимальное количество одновременных запросов.
+
+    Raises:
+        ValueError: max_concurrency меньше 1.
+    """
+
+    __slots__ = [
+        'client',
+        'strategy',
+        'max_concurrency',
+        '_limiter'
+    ]
+
+    def __init__(
+            self,
+            client: 'ClientAsync',
+            strategy: Optional[Strategy] = None,
+            *,
+            max_concurrency: int = 4,
+            rate: Optional[float] = None
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError(f'Недопустимое значение max_concurrency :: {max_concurrency}')
+        if strategy is None:
+            strategy = UndercutStrategy()
+
+        self.client = client
+        self.strategy = strategy
+        self.max_concurrency = max_concurrency
+        self._limiter = AsyncRateLimiter(rate) if rate is not None else None
+
+    async def plan(self, listings: Iterable['InventoryItem']) -> list[RepriceDecision]:
+        """Рассчитать новые цены без их изменения.
+
+        Args:
+            listings (Iterable[:class:`steam_trader.InventoryItem`]): Предложения о продаже.
+
+        Returns:
+            list[:class:`RepriceDecision`]: Изменения цен.
+        """
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def plan_group(gid: int, items: list['InventoryItem']) -> list[RepriceDecision]:
+            async with semaphore:
+                if self._limiter is not None:
+                    await self._limiter.acquire()
+                book = await self.client.get_order_book(gid)
+            return _decide(self.strategy, items, book)
+
+        groups = await asyncio.gather(*(plan_group(gid, items) for gid, items in _group_listings(listings).items()))
+        return [decision for group in groups for decision in group]
+
+    async def apply(self, decisions: Iterable[RepriceDecision]) -> list[RepriceDecision]:
+        """Применить изменения цен. Ошибки, относящиеся к одному предмету, пропускаются.
+
+        Args:
+            decisions (Iterable[:class:`RepriceDecision`]): Изменения цен.
+
+        Returns:
+            list[:class:`RepriceDecision`]: Применённые изменения в исходном порядке.
+        """
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def apply_one(decision: RepriceDecision) -> Optional[RepriceDecision]:
+            async with semaphore:
+                if self._limiter is not None:
+                    await self._limiter.acquire()
+                try:
+                    await self.client.edit_price(decision.itemid, decision.new_price)
+                except NON_FATAL_SELL_ERRORS as e:
+                    logging.warning(f'Не удалось изменить цену предмета {decision.itemid}: {e}')
+                    return None
+            return decision
+
+        results = await asyncio.gather(*(apply_one(decision) for decision in decisions))
+        return [decision for decision in results if decision is not None]
+
+    async def reprice(self, gameid: int) -> list[RepriceDecision]:
+        """Пересчитать цены всех предметов игры, выставленных на продажу.
+
+        Args:
+            gameid (:obj:`int`): AppID приложения в Steam.
+
+        Returns:
+            list[:class:`RepriceDecision`]: Применённые изменения.
+        """
+
+        inventory = await self.client.get_inventory(gameid, status=[0])
+        listings = [item for item in inventory.items if item.type == 0]
+        return await self.apply(await self.plan(listings))
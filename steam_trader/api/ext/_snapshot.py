@@ -0,0 +1,186 @@
+import os
+import csv
+import time
+from typing import TYPE_CHECKING, Optional, Union
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+if TYPE_CHECKING:
+    from steam_trader.api import ItemInfo, MinPrices
+    from steam_trader.web import MainPageItem
+
+SNAPSHOT_COLUMNS = (
+    'timestamp',
+    'gid',
+    'name',
+    'hash_name',
+    'count',
+    'market_price',
+    'buy_price',
+    'steam_price',
+    'count_sell_offers',
+    'count_buy_offers'
+)
+
+_FORMATS = ('parquet', 'arrow', 'csv')
+
+
+class SnapshotWriter:
+    """Класс, представляющий запись снимка рынка в колоночный файл.
+
+    Строки накапливаются по колонкам и сбрасываются в файл частями по chunk_size строк, поэтому
+    потребление памяти не зависит от размера рынка. Все строки снимка получают одну метку времени,
+    по которой снимки разных дней можно сравнивать между собой.
+
+    Форматы parquet и arrow требуют установленного pyarrow. Если формат не указан, используется parquet
+    при наличии pyarrow и csv в противном случае. Поддерживает контекстный менеджер.
+
+    Args:
+        path (Union[:obj:`str`, :obj:`os.PathLike`]): Путь к файлу снимка.
+        format (:obj:`str`, optional): Формат файла. 'parquet', 'arrow' или 'csv'.
+        timestamp (:obj:`int`, optional): Метка времени снимка. По умолчанию текущее время.
+        chunk_size (:obj:`int`): Количество строк в одной части файла. По умолчанию 4096.
+
+    Attributes:
+        path (Union[:obj:`str`, :obj:`os.PathLike`]): Путь к файлу снимка.
+        format (:obj:`str`): Формат файла.
+        timestamp (:obj:`int`): Метка времени снимка.
+        chunk_size (:obj:`int`): Количество строк в одной части файла.
+        rows (:obj:`int`): Количество записанных строк.
+
+    Raises:
+        ValueError: Неизвестный формат.
+        ImportError: Для выбранного формата требуется pyarrow.
+    """
+
+    __slots__ = [
+        'path',
+        'format',
+        'timestamp',
+        'chunk_size',
+        'rows',
+        '_columns',
+        '_writer',
+        '_file'
+    ]
+
+    def __init__(
+            self,
+            path: Union[str, os.PathLike],
+            format: Optional[str] = None,
+            *,
+            timestamp: Optional[int] = None,
+            chunk_size: int = 4096
+    ) -> None:
+        if format is None:
+            format = 'parquet' if pyarrow is not None else 'csv'
+        if format not in _FORMATS:
+            raise ValueError(f'Недопустимое значение format :: {format}')
+        if format != 'csv' and pyarrow is None:
+            raise ImportError(f'Для записи в формате {format} требуется pyarrow.')
+
+        self.path = path
+        self.format = format
+        self.timestamp = int(time.time()) if timestamp is None else timestamp
+        self.chunk_size = chunk_size
+        self.rows = 0
+        self._columns: dict[str, list] = {column: [] for column in SNAPSHOT_COLUMNS}
+        self._writer = None
+        self._file = None
+
+    def __enter__(self) -> 'SnapshotWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def write(self, item: 'MainPageItem', prices: Union['ItemInfo', 'MinPrices', None] = None) -> None:
+        """Добавить предмет в снимок.
+
+        Args:
+            item (:class:`steam_trader.web.MainPageItem`): Предмет с главной страницы.
+            prices (Union[:class:`steam_trader.api.ItemInfo`, :class:`steam_trader.api.MinPrices`], optional):
+                Цены предмета. Если не указаны, колонки цен остаются пустыми.
+        """
+
+        columns = self._columns
+        columns['timestamp'].append(self.timestamp)
+        columns['gid'].append(item.gid)
+        columns['name'].append(item.name)
+        columns['hash_name'].append(item.hash_name)
+        columns['count'].append(item.count)
+
+        if prices is None:
+            market_price = buy_price = steam_price = count_sell_offers = count_buy_offers = None
+        elif hasattr(prices, 'count_sell_offers'):
+            market_price, buy_price, steam_price = prices.market_price, prices.buy_price, prices.steam_price
+            count_sell_offers, count_buy_offers = prices.count_sell_offers, prices.count_buy_offers
+        else:
+            market_price, buy_price, steam_price = prices.market_price, prices.buy_price, prices.steam_price
+            count_sell_offers, count_buy_offers = len(prices.sell_offers), len(prices.buy_offers)
+
+        columns['market_price'].append(market_price)
+        columns['buy_price'].append(buy_price)
+        columns['steam_price'].append(steam_price)
+        columns['count_sell_offers'].append(count_sell_offers)
+        columns['count_buy_offers'].append(count_buy_offers)
+
+        self.rows += 1
+        if len(columns['gid']) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Записать накопленные строки в файл."""
+
+        columns = self._columns
+        if not columns['gid']:
+            return
+
+        if self.format == 'csv':
+            if self._writer is None:
+                self._file = open(self.path, 'w', encoding='utf-8', newline='')
+                self._writer = csv.writer(self._file)
+                self._writer.writerow(SNAPSHOT_COLUMNS)
+            self._writer.writerows(zip(*(columns[column] for column in SNAPSHOT_COLUMNS)))
+        else:
+            table = pyarrow.table(columns, schema=_schema())
+            if self._writer is None:
+                if self.format == 'parquet':
+                    self._writer = pyarrow.parquet.ParquetWriter(self.path, table.schema)
+                else:
+                    self._writer = pyarrow.ipc.new_file(self.path, table.schema)
+            self._writer.write_table(table)
+
+        for values in columns.values():
+            values.clear()
+
+    def close(self) -> None:
+        """Записать оставшиеся строки и закрыть файл."""
+
+        self.flush()
+        if self._writer is not None and self.format != 'csv':
+            self._writer.close()
+        if self._file is not None:
+            self._file.close()
+        self._writer = None
+        self._file = None
+
+
+def _schema() -> 'pyarrow.Schema':
+    return pyarrow.schema([
+        ('timestamp', pyarrow.int64()),
+        ('gid', pyarrow.int64()),
+        ('name', pyarrow.string()),
+        ('hash_name', pyarrow.string()),
+        ('count', pyarrow.int32()),
+        ('market_price', pyarrow.float64()),
+        ('buy_price', pyarrow.float64()),
+        ('steam_price', pyarrow.float64()),
+        ('count_sell_offers', pyarrow.int32()),
+        ('count_buy_offers', pyarrow.int32())
+    ])
@@ -0,0 +1,408 @@
+import time
+import asyncio
+import logging
+from collections import deque, namedtuple
+from collections.abc import Iterator, AsyncIterator, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional, Union
+
+from steam_trader import exceptions
+
+if TYPE_CHECKING:
+    from steam_trader.api import Client, ClientAsync, ItemForExchange, ExchangeResult, ExchangeP2PResult
+
+TradeStats = namedtuple('TradeStats', ['exchanges', 'offers', 'items', 'errors', 'pending', 'throughput', 'latency'])
+
+# Временные ошибки. После них запрос повторяется в следующем цикле с минимальным интервалом.
+RETRYABLE_TRADE_ERRORS = (
+    exceptions.TradeCreationFail,
+    exceptions.InternalError,
+    exceptions.TooManyRequests,
+    exceptions.TimedOutError
+)
+
+
+@dataclass(slots=True)
+class TradeOffer:
+    """Класс, представляющий отслеживаемый обмен.
+
+    Attributes:
+        offerid (:obj:`str`): ID обмена в Steam. Для обменов, которые нужно создать самому, - ссылка для обмена.
+        kind (:obj:`str`): Тип обмена. 'bot' - обмен с ботом, 'p2p' - p2p обмен.
+        state (:obj:`str`): Состояние обмена. 'sent' - бот отправил обмен, 'send' - нужно отправить обмен,
+            'receive' - нужно принять обмен, 'confirm' - нужно подтвердить обмен, 'cancel' - нужно отменить обмен.
+        created (:obj:`float`): Время (time.monotonic), когда обмен был получен.
+        updated (:obj:`float`): Время (time.monotonic) последнего изменения состояния.
+        code (:obj:`str`, optional): Код проверки обмена.
+        items (Sequence[:class:`steam_trader.ExchangeItem`]): Предметы в обмене, если они известны.
+    """
+
+    offerid: str
+    kind: str
+    state: str
+    created: float
+    updated: float
+    code: Optional[str] = None
+    items: Sequence = field(default_factory=tuple)
+
+
+class TradeProcessor:
+    """Класс, представляющий обработчик обменов с ботом и p2p обменов.
+
+    Каждый цикл запрашивает предметы для обмена и, если они есть, вызывает :meth:`steam_trader.Client.exchange`
+    и/или :meth:`steam_trader.Client.exchange_p2p` один раз для всех предметов сразу. Если предметов нет,
+    интервал опроса увеличивается, если есть - уменьшается. Интервал никогда не превышает половины
+    минимального таймера ожидающих предметов, чтобы не пропустить окно передачи и не получить штраф.
+
+    Если включён ``websocket``, перед каждым циклом вызывается :meth:`steam_trader.Client.trigger_alt_web_socket`.
+    Любое сообщение считается сигналом о новых предметах и сбрасывает интервал до минимального.
+
+    Временные ошибки (:data:`RETRYABLE_TRADE_ERRORS`) при получении предметов и обмене записываются в журнал
+    и не прерывают обработку. Результаты обменов хранятся в памяти как :class:`TradeOffer`
+    и удаляются через ``keep`` секунд.
+
+    Args:
+        client (:class:`steam_trader.Client`): Клиент Steam Trader.
+        bot (:obj:`bool`): Обрабатывать обмены с ботом. По умолчанию True.
+        p2p (:obj:`bool`): Обрабатывать p2p обмены. По умолчанию True.
+        websocket (:obj:`bool`): Использовать AltWebSocket для обнаружения новых предметов. По умолчанию False.
+        min_interval (:obj:`float`): Минимальный интервал опроса в секундах. По умолчанию 5.
+        max_interval (:obj:`float`): Максимальный интервал опроса в секундах. По умолчанию 60.
+        window (:obj:`float`): Окно в секундах для расчёта пропускной способности и задержки. По умолчанию 3600.
+        keep (:obj:`float`): Время в секундах, в течение которого хранятся обмены. По умолчанию 10800.
+
+    Attributes:
+        client (:class:`steam_trader.Client`): Клиент Steam Trader.
+        bot (:obj:`bool`): Обрабатывать обмены с ботом.
+        p2p (:obj:`bool`): Обрабатывать p2p обмены.
+        websocket (:obj:`bool`): Использовать AltWebSocket для обнаружения новых предметов.
+        min_interval (:obj:`float`): Минимальный интервал опроса в секундах.
+        max_interval (:obj:`float`): Максимальный интервал опроса в секундах.
+        interval (:obj:`float`): Текущий интервал опроса в секундах.
+        window (:obj:`float`): Окно в секундах для расчёта пропускной способности и задержки.
+        keep (:obj:`float`): Время в секундах, в течение которого хранятся обмены.
+        offers (dict[:obj:`str`, :class:`TradeOffer`]): Отслеживаемые обмены. Ключ - ID обмена.
+
+    Raises:
+        ValueError: Не выбран ни один тип обменов или указан недопустимый интервал.
+    """
+
+    __slots__ = [
+        'client',
+        'bot',
+        'p2p',
+        'websocket',
+        'min_interval',
+        'max_interval',
+        'interval',
+        'window',
+        'keep',
+        'offers',
+        '_pending',
+        '_events',
+        '_exchanges',
+        '_items',
+        '_errors',
+        '_running'
+    ]
+
+    def __init__(
+            self,
+            client: Union['Client', 'ClientAsync'],
+            *,
+            bot: bool = True,
+            p2p: bool = True,
+            websocket: bool = False,
+            min_interval: float = 5,
+            max_interval: float = 60,
+            window: float = 3600,
+            keep: float = 10800
+    ) -> None:
+        if not bot and not p2p:
+            raise ValueError('Недопустимое значение bot/p2p :: оба False')
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError(f'Недопустимое значение интервала :: {min_interval}, {max_interval}')
+
+        self.client = client
+        self.bot = bot
+        self.p2p = p2p
+        self.websocket = websocket
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.window = window
+        self.keep = keep
+        self.offers: dict[str, TradeOffer] = {}
+        self._pending: dict[str, dict[int, float]] = {'bot': {}, 'p2p': {}}
+        self._events: deque[tuple[float, int, float]] = deque()  # (время, кол-во предметов, суммарная задержка)
+        self._exchanges = 0
+        self._items = 0
+        self._errors = 0
+        self._running = False
+
+    def poll(self) -> list[TradeOffer]:
+        """Выполнить один цикл обработки обменов.
+
+        Returns:
+            list[:class:`TradeOffer`]: Новые или изменившиеся обмены.
+        """
+
+        if self.websocket:
+            self._signal(self.client.trigger_alt_web_socket())
+
+        offers = []
+        timers = []
+        retry = False
+        if self.bot:
+            items = self._fetch('bot', self.client.get_items_for_exchange)
+            retry |= items is None
+            timers.extend(self._see('bot', items))
+            if items:
+                offers.extend(self._exchange('bot', self.client.exchange))
+        if self.p2p:
+            items = self._fetch('p2p', self.client.get_items_for_exchange_p2p)
+            retry |= items is None
+            timers.extend(self._see('p2p', items))
+            if items:
+                offers.extend(self._exchange('p2p', self.client.exchange_p2p))
+
+        self._adjust(timers, retry)
+        self._prune()
+        return offers
+
+    def follow(self) -> Iterator[TradeOffer]:
+        """Бесконечно обрабатывать обмены. Работает до вызова :meth:`stop`.
+
+        Yields:
+            :class:`TradeOffer`: Новые или изменившиеся обмены.
+        """
+
+        self._running = True
+        while self._running:
+            yield from self.poll()
+            time.sleep(self.interval)
+
+    def run(self) -> None:
+        """Бесконечно обрабатывать обмены без возврата результатов. Работает до вызова :meth:`stop`."""
+
+        for _ in self.follow():
+            pass
+
+    def stop(self) -> None:
+        """Остановить обработку после текущего цикла."""
+
+        self._running = False
+
+    def stats(self) -> TradeStats:
+        """Получить метрики обработки.
+
+        Returns:
+            :NamedTuple:`TradeStats(exchanges, offers, items, errors, pending, throughput, latency)`:
+                Количество вызовов обмена, отслеживаемых обменов, обработанных предметов, ошибок и ожидающих
+                предметов, количество обработанных предметов в минуту и средняя задержка в секундах от обнаружения
+                предмета до создания обмена за последние ``window`` секунд. Задержка равна None,
+                если за это время не было обменов.
+        """
+
+        now = time.monotonic()
+        while self._events and now - self._events[0][0] > self.window:
+            self._events.popleft()
+
+        items = sum(count for _, count, _ in self._events)
+        delay = sum(total for _, _, total in self._events)
+        return TradeStats(
+            self._exchanges,
+            len(self.offers),
+            self._items,
+            self._errors,
+            sum(len(pending) for pending in self._pending.values()),
+            items / (self.window / 60),
+            delay / items if items else None
+        )
+
+    def _fetch(self, kind: str, method) -> Optional[Sequence['ItemForExchange']]:
+        try:
+            return method().items
+        except exceptions.NoTradeItems:
+            return []
+        except RETRYABLE_TRADE_ERRORS as e:
+            logging.warning(f'Не удалось получить предметы для обмена ({kind}): {e}')
+            self._errors += 1
+            return None
+
+    def _see(self, kind: str, items: Optional[Sequence['ItemForExchange']]) -> list[int]:
+        if items is None:  # Запрос не удался, ожидающие предметы не меняются
+            return []
+        now = time.monotonic()
+        pending = self._pending[kind]
+        current = {item.id for item in items}
+        for itemid in [itemid for itemid in pending if itemid not in current]:
+            del pending[itemid]  # Предмет пропал без обмена, например покупку отменили
+        for item in items:
+            pending.setdefault(item.id, now)
+        return [item.timer for item in items]
+
+    def _exchange(self, kind: str, method) -> list[TradeOffer]:
+        try:
+            result = method()
+        except exceptions.NoTradeItems:
+            return []
+        except RETRYABLE_TRADE_ERRORS as e:
+            logging.warning(f'Не удалось выполнить обмен ({kind}): {e}')
+            self._errors += 1
+            self.interval = self.min_interval
+            return []
+        return self._record(kind, result)
+
+    def _record(self, kind: str, result: Union['ExchangeResult', 'ExchangeP2PResult']) -> list[TradeOffer]:
+        now = time.monotonic()
+        self._exchanges += 1
+
+        pending = self._pending[kind]
+        if pending:
+            self._items += len(pending)
+            self._events.append((now, len(pending), sum(now - seen for seen in pending.values())))
+            pending.clear()
+
+        if kind == 'bot':
+            updates = [(str(result.offer_id), 'sent', result.code, result.items)]
+        else:
+            updates = [(send.trade_link, 'send', None, ()) for send in result.send]
+            updates += [(str(obj.offerid), 'receive', obj.code, obj.items) for obj in result.receive]
+            updates += [(str(obj.offerid), 'confirm', obj.code, ()) for obj in result.confirm]
+            updates += [(str(offerid), 'cancel', None, ()) for offerid in result.cancel]
+
+        changed = []
+        for offerid, state, code, items in updates:
+            offer = self.offers.get(offerid)
+            if offer is None:
+                offer = TradeOffer(offerid, kind, state, now, now, code, items)
+                self.offers[offerid] = offer
+            elif offer.state != state:
+                offer.state = state
+                offer.updated = now
+                if code is not None:
+                    offer.code = code
+                if items:
+                    offer.items = items
+            else:
+                continue
+            changed.append(offer)
+        return changed
+
+    def _signal(self, websocket) -> None:
+        if websocket is not None and websocket.messages:
+            self.interval = self.min_interval
+
+    def _adjust(self, timers: list[int], retry: bool) -> None:
+        if retry:
+            self.interval = self.min_interval
+        elif timers:
+            self.interval = max(self.min_interval, self.interval / 2)
+            # Не спим дольше половины оставшегося окна передачи, иначе можно получить штраф
+            self.interval = max(self.min_interval, min(self.interval, min(timers) / 2))
+        else:
+            self.interval = min(self.max_interval, self.interval * 1.5)
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        for offerid in [key for key, offer in self.offers.items() if now - offer.updated > self.keep]:
+            del self.offers[offerid]
+
+
+class TradeProcessorAsync(TradeProcessor):
+    """Класс, представляющий асинхронный обработчик обменов с ботом и p2p обменов.
+
+    Args:
+        client (:class:`steam_trader.ClientAsync`): Клиент Steam Trader.
+        bot (:obj:`bool`): Обрабатывать обмены с ботом. По умолчанию True.
+        p2p (:obj:`bool`): Обрабатывать p2p обмены. По умолчанию True.
+        websocket (:obj:`bool`): Использовать AltWebSocket для обнаружения новых предметов. По умолчанию False.
+        min_interval (:obj:`float`): Минимальный интервал опроса в секундах. По умолчанию 5.
+        max_interval (:obj:`float`): Максимальный интервал опроса в секундах. По умолчанию 60.
+        window (:obj:`float`): Окно в секундах для расчёта пропускной способности и задержки. По умолчанию 3600.
+        keep (:obj:`float`): Время в секундах, в течение которого хранятся обмены. По умолчанию 10800.
+    """
+
+    __slots__ = []
+
+    async def poll(self) -> list[TradeOffer]:
+        """Выполнить один цикл обработки обменов.
+
+        Обмены с ботом и p2p обмены обрабатываются параллельно.
+
+        Returns:
+            list[:class:`TradeOffer`]: Новые или изменившиеся обмены.
+        """
+
+        if self.websocket:
+            self._signal(await self.client.trigger_alt_web_socket())
+
+        async def process(kind: str, fetch, exchange) -> tuple[list[int], list[TradeOffer], bool]:
+            items = await self._fetch_async(kind, fetch)
+            timers = self._see(kind, items)
+            if not items:
+                return timers, [], items is None
+            return timers, await self._exchange_async(kind, exchange), False
+
+        tasks = []
+        if self.bot:
+            tasks.append(process('bot', self.client.get_items_for_exchange, self.client.exchange))
+        if self.p2p:
+            tasks.append(process('p2p', self.client.get_items_for_exchange_p2p, self.client.exchange_p2p))
+
+        offers = []
+        timers = []
+        retry = False
+        for kind_timers, kind_offers, kind_retry in await asyncio.gather(*tasks):
+            timers.extend(kind_timers)
+            offers.extend(kind_offers)
+            retry |= kind_retry
+
+        self._adjust(timers, retry)
+        self._prune()
+        return offers
+
+    async def follow(self) -> AsyncIterator[TradeOffer]:
+        """Бесконечно обрабатывать обмены. Работает до вызова :meth:`stop` или отмены задачи.
+
+        Yields:
+            :class:`TradeOffer`: Новые или изменившиеся обмены.
+        """
+
+        self._running = True
+        while self._running:
+            for offer in await self.poll():
+                yield offer
+            await asyncio.sleep(self.interval)
+
+    async def run(self) -> None:
+        """Бесконечно обрабатывать обмены без возврата результатов.
+
+        Работает до вызова :meth:`stop` или отмены задачи.
+        """
+
+        async for _ in self.follow():
+            pass
+
+    async def _fetch_async(self, kind: str, method) -> Optional[Sequence['ItemForExchange']]:
+        try:
+            return (await method()).items
+        except exceptions.NoTradeItems:
+            return []
+        except RETRYABLE_TRADE_ERRORS as e:
+            logging.warning(f'Не удалось получить предметы для обмена ({kind}): {e}')
+            self._errors += 1
+            return None
+
+    async def _exchange_async(self, kind: str, method) -> list[TradeOffer]:
+        try:
+            result = await method()
+        except exceptions.NoTradeItems:
+            return []
+        except RETRYABLE_TRADE_ERRORS as e:
+            logging.warning(f'Не удалось выполнить обмен ({kind}): {e}')
+            self._errors += 1
+            self.interval = self.min_interval
+            return []
+        return self._record(kind, result)
@@ -13,6 +13,12 @@ NAME_BY_APPID: dict[int, str] = {
     STEAMGIFT_APPID: 'games',
 }
 
+# Допустимое количество предметов на странице сайта: от MIN до MAX с шагом ITEMS_ON_PAGE_STEP
+MIN_ITEMS_ON_PAGE: int = 24
+MAX_ITEMS_ON_PAGE: int = 120
+ITEMS_ON_PAGE_STEP: int = 6
+ITEMS_ON_PAGE_VALUES: range = range(MIN_ITEMS_ON_PAGE, MAX_ITEMS_ON_PAGE + 1, ITEMS_ON_PAGE_STEP)
+
 # Фильтры
 # TF2
 # Качества
@@ -238,3 +244,97 @@ STEAMGIFT_MODE_VALVE_ANTICHEAT_ENABLED: int = 81
 # Обмен
 STEAMGIFT_TRADABLE: int = 276
 STEAMGIFT_NOT_TRADABLE: int = 281
+
+# Группы фильтров по играм. Ключ - название поля в steam_trader.api.Filters.
+# Используются для плотного битового представления фильтров (см. steam_trader.api.FilterEncoder).
+TF2_FILTERS: dict[str, tuple[int, ...]] = {
+    'quality': (
+        TF2_QUALITY_COLLECTORS, TF2_QUALITY_DECORATED, TF2_QUALITY_GENUINE, TF2_QUALITY_HAUNTED,
+        TF2_QUALITY_SELFMADE, TF2_QUALITY_STOCK, TF2_QUALITY_STRANGE, TF2_QUALITY_UNIQUE,
+        TF2_QUALITY_UNUSUAL, TF2_QUALITY_VINTAGE
+    ),
+    'type': (
+        TF2_TYPE_ACTION, TF2_TYPE_BUILDING, TF2_TYPE_COSMETIC, TF2_TYPE_CRAFT_ITEM, TF2_TYPE_CRATE,
+        TF2_TYPE_FESTIVIZER, TF2_TYPE_GIFT1, TF2_TYPE_GIFT2, TF2_TYPE_KILLSTREAK_KIT, TF2_TYPE_MELEE,
+        TF2_TYPE_PACKAGE, TF2_TYPE_PARTY_FAVOR, TF2_TYPE_PRIMARY, TF2_TYPE_PRIMARY_PDA,
+        TF2_TYPE_PROFESSIONAL_KILLSTREAK_KIT, TF2_TYPE_RECIPE, TF2_TYPE_SECONDARY_PDA, TF2_TYPE_SECONDARY,
+        TF2_TYPE_SERVER_ENCHANTMENT, TF2_TYPE_SPECIALIZED_KILLSTREAK_KIT, TF2_TYPE_SPELLBOOK_PAGE,
+        TF2_TYPE_STRANGE_FILTER, TF2_TYPE_STRANGE_PART, TF2_TYPE_STRANGIFIER, TF2_TYPE_SUPPLY_CRATE,
+        TF2_TYPE_TAUNT, TF2_TYPE_TF_SPELLTOOL, TF2_TYPE_TOOL, TF2_TYPE_TYPE, TF2_TYPE_UNLOCKED_CRATE,
+        TF2_TYPE_UNUSUALIFIER, TF2_TYPE_USABLE_ITEM, TF2_TYPE_WARPAINT
+    ),
+    'used_by': (
+        TF2_CLASS_DEMOMAN, TF2_CLASS_ENGINEER, TF2_CLASS_HEAVY, TF2_CLASS_MEDIC, TF2_CLASS_PYRO,
+        TF2_CLASS_SCOUT, TF2_CLASS_SNIPER, TF2_CLASS_SOLDIER, TF2_CLASS_SPY
+    ),
+    'craft': (TF2_CRAFTABLE, TF2_NOT_CRAFTABLE),
+}
+
+DOTA2_FILTERS: dict[str, tuple[int, ...]] = {
+    'rarity': (
+        DOTA2_RARITY_ANCIENT, DOTA2_RARITY_ARCANA, DOTA2_RARITY_COMMON, DOTA2_RARITY_IMMORTAL,
+        DOTA2_RARITY_LEGENDARY, DOTA2_RARITY_MYTHICAL, DOTA2_RARITY_RARE, DOTA2_RARITY_SEASONAL,
+        DOTA2_RARITY_UNCOMMON
+    ),
+    'quality': (
+        DOTA2_QUALITY_ASCENDANT, DOTA2_QUALITY_AUSPICIOUS, DOTA2_QUALITY_AUTOGRAPHED, DOTA2_QUALITY_BASE1,
+        DOTA2_QUALITY_BASE2, DOTA2_QUALITY_CORRUPTED, DOTA2_QUALITY_CURSED, DOTA2_QUALITY_ELDER,
+        DOTA2_QUALITY_EXALTED, DOTA2_QUALITY_FROZEN, DOTA2_QUALITY_GENUINE, DOTA2_QUALITY_GLITTER,
+        DOTA2_QUALITY_GOLD, DOTA2_QUALITY_HEROIC, DOTA2_QUALITY_HOLO, DOTA2_QUALITY_INFUSED,
+        DOTA2_QUALITY_INSCRIBED, DOTA2_QUALITY_LEGACY, DOTA2_QUALITY_STANDARD, DOTA2_QUALITY_UNUSUAL
+    ),
+    'type': (
+        DOTA2_TYPE_ANCIENT, DOTA2_TYPE_ANNOUNCER, DOTA2_TYPE_BASE, DOTA2_TYPE_BUNDLE, DOTA2_TYPE_COURIER,
+        DOTA2_TYPE_CURSORS_PACK, DOTA2_TYPE_DIRE_TOWERS, DOTA2_TYPE_EMBLEM, DOTA2_TYPE_EMOTICON_TOOL,
+        DOTA2_TYPE_GEM_OR_RUNE, DOTA2_TYPE_HUD_SKIN, DOTA2_TYPE_LEAGUE, DOTA2_TYPE_LOADING_SCREEN,
+        DOTA2_TYPE_MISC, DOTA2_TYPE_MUSIC, DOTA2_TYPE_PENNANT, DOTA2_TYPE_PLAYER_CARD,
+        DOTA2_TYPE_RADIANT_TOWERS, DOTA2_TYPE_RECIPE, DOTA2_TYPE_RELIC, DOTA2_TYPE_RETIRED_CHEST,
+        DOTA2_TYPE_STICKER, DOTA2_TYPE_STICKER_CAPSULE, DOTA2_TYPE_TAUNT, DOTA2_TYPE_TERRAIN, DOTA2_TYPE_TOOL,
+        DOTA2_TYPE_TREASURE, DOTA2_TYPE_TREASURE_KEY, DOTA2_TYPE_WARD, DOTA2_TYPE_WEARABLE
+    ),
+    'hero': (),  # Константы героев пока отсутствуют, ID добавляются по мере появления.
+}
+
+STEAMGIFT_FILTERS: dict[str, tuple[int, ...]] = {
+    'region': (
+        STEAMGIFT_REGION_ASIA, STEAMGIFT_REGION_CHINA, STEAMGIFT_REGION_GLOBAL,
+        STEAMGIFT_REGION_HONG_KONG_OR_TAIWAN, STEAMGIFT_REGION_INDIA, STEAMGIFT_REGION_MIDDLE_EAST,
+        STEAMGIFT_REGION_RUSSIA_CIS, STEAMGIFT_REGION_SOUTH_AFRICA, STEAMGIFT_REGION_SOUTH_AMERICA_OR_BRAZIL,
+        STEAMGIFT_REGION_TURKEY
+    ),
+    'genre': (
+        STEAMGIFT_GENRE_ACCOUNTING, STEAMGIFT_GENRE_ACTION, STEAMGIFT_GENRE_ADVENTURE,
+        STEAMGIFT_GENRE_ANIMATION_AND_MODELING, STEAMGIFT_GENRE_AUDIO_PRODACTION, STEAMGIFT_GENRE_CASUAL,
+        STEAMGIFT_GENRE_DESIGN_AND_ILLUSTRATION, STEAMGIFT_GENRE_DECUMENTARY, STEAMGIFT_GENRE_EARLY_ACCESS,
+        STEAMGIFT_GENRE_EDUCATION, STEAMGIFT_GENRE_FREE_TO_PLAY, STEAMGIFT_GENRE_GAME_DEVELOPMENT,
+        STEAMGIFT_GENRE_GORE, STEAMGIFT_GENRE_INDIE, STEAMGIFT_GENRE_MASSIVELY_MULTIPLAYER, STEAMGIFT_GENRE_MOVIE,
+        STEAMGIFT_GENRE_NUDITY, STEAMGIFT_GENRE_PHOTO_EDITING, STEAMGIFT_GENRE_RPG, STEAMGIFT_GENRE_RACING,
+        STEAMGIFT_GENRE_SEXUAL_CONTENT, STEAMGIFT_GENRE_SIMULATION, STEAMGIFT_GENRE_SOFTWARE_TRAINING,
+        STEAMGIFT_GENRE_SPORTS, STEAMGIFT_GENRE_STRATEGY, STEAMGIFT_GENRE_UTILITIES,
+        STEAMGIFT_GENRE_VIDEO_PRODACTION, STEAMGIFT_GENRE_VIOLENT, STEAMGIFT_GENRE_WEB_PUBLISHING
+    ),
+    'mode': (
+        STEAMGIFT_MODE_ADDITIONAL_HIGH_QUALITY_AUDIO, STEAMGIFT_MODE_CAPTIONS_AVAILABLE, STEAMGIFT_MODE_CO_OP,
+        STEAMGIFT_MODE_OMMENTARY_AVAILABLE, STEAMGIFT_MODE_CROSS_PLATFORM_MULTIPLAYER,
+        STEAMGIFT_MODE_DOWNLOADABLE_CONTENT, STEAMGIFT_MODE_FAMILY_SHARING, STEAMGIFT_MODE_FULL_CONTROLLER_SUPPORT,
+        STEAMGIFT_MODE_INAPP_PURCHASES, STEAMGIFT_MODE_INCLUDES_SOURCE_SDK, STEAMGIFT_MODE_INCLUDES_LEVEL_EDITOR,
+        STEAMGIFT_MODE_LAN_CO_OP, STEAMGIFT_MODE_LAN_PVP, STEAMGIFT_MODE_MMO, STEAMGIFT_MODE_MULTIPLAYER,
+        STEAMGIFT_MODE_NATIVE_STEAM_CONTROLLER_SUPPORT, STEAMGIFT_MODE_ONLINE_CO_OP, STEAMGIFT_MODE_ONLINE_PVP,
+        STEAMGIFT_MODE_PARTIAL_CONTROLLER_SUPPORT, STEAMGIFT_MODE_PVP, STEAMGIFT_MODE_REMOTE_PLAY_TOGETHER,
+        STEAMGIFT_MODE_REMOTE_PLAY_ON_PHONE, STEAMGIFT_MODE_REMOTE_PLAY_ON_TV, STEAMGIFT_MODE_REMOTE_PLAY_ON_TABLET,
+        STEAMGIFT_MODE_SHARED_OR_SPLIT_SCREEN, STEAMGIFT_MODE_SHARED_OR_SPLIT_SCREEN_CO_OP,
+        STEAMGIFT_MODE_SHARED_OR_SPLIT_SCREEN_PVP, STEAMGIFT_MODE_SINGLEPLAYER, STEAMGIFT_MODE_STATS,
+        STEAMGIFT_MODE_STEAM_ACHIVEMENTS, STEAMGIFT_MODE_STEAM_CLOUD, STEAMGIFT_MODE_STEAM_LEADERBOARDS,
+        STEAMGIFT_MODE_STEAM_TIMELINE, STEAMGIFT_MODE_STEAM_TRADING_CARDS, STEAMGIFT_MODE_STEAM_TURN_NOTIFICATIONS,
+        STEAMGIFT_MODE_STEAM_WORKSHOP1, STEAMGIFT_MODE_STEAM_WORKSHOP2, STEAMGIFT_MODE_STEAM_VR_COLLECTABLES,
+        STEAMGIFT_MODE_TRACKED_CONTROLLER_SUPPORT, STEAMGIFT_MODE_VR_ONLY, STEAMGIFT_MODE_VR_SUPPORT,
+        STEAMGIFT_MODE_VR_SUPPORTED, STEAMGIFT_MODE_VALVE_ANTICHEAT_ENABLED
+    ),
+    'trade': (STEAMGIFT_TRADABLE, STEAMGIFT_NOT_TRADABLE),
+}
+
+FILTERS_BY_APPID: dict[int, dict[str, tuple[int, ...]]] = {
+    TEAM_FORTRESS2_APPID: TF2_FILTERS,
+    DOTA2_APPID: DOTA2_FILTERS,
+    STEAMGIFT_APPID: STEAMGIFT_FILTERS,
+}
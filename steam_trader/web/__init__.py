@@ -8,18 +8,37 @@ Licensed under the BSD 3-Clause License - Copyright (c) 2024-present, Lemon4ksan
 See LICENSE
 """
 
-from ._base import WebClientObject
+from typing import TYPE_CHECKING
 
-from ._client import WebClient
-from ._client_async import WebClientAsync
+from steam_trader._lazy import lazy_imports
 
-from ._dataclasses import MainPage
-from ._dataclasses import MainPageItem
-from ._dataclasses import ItemDescription
-from ._dataclasses import ItemInfo
-from ._dataclasses import SellOffer
-from ._dataclasses import Referal
-from ._dataclasses import HistoryItem
+if TYPE_CHECKING:
+    from ._base import WebClientObject
+
+    from ._client import WebClient
+    from ._client_async import WebClientAsync
+
+    from ._dataclasses import MainPage
+    from ._dataclasses import MainPageItem
+    from ._dataclasses import ItemDescription
+    from ._dataclasses import ItemInfo
+    from ._dataclasses import SellOffer
+    from ._dataclasses import Referal
+    from ._dataclasses import HistoryItem
+
+    from ._crawler import CatalogCrawler
+
+    from ._url_cache import ItemUrlCache
+
+    from ._proxy_pool import ProxyPool
+
+    from ._bulk import parse_item_infos
+    from ._bulk import parse_item_infos_async
+
+    from ._tape import HistoryTape
+    from ._tape import HistoryTapeAsync
+    from ._tape import TapeEntry
+    from ._tape import parse_history_date
 
 __all__ = [
     'WebClientObject',
@@ -30,5 +49,37 @@ __all__ = [
     'ItemInfo',
     'SellOffer',
     'Referal',
-    'HistoryItem'
+    'HistoryItem',
+    'CatalogCrawler',
+    'ItemUrlCache',
+    'ProxyPool',
+    'parse_item_infos',
+    'parse_item_infos_async',
+    'HistoryTape',
+    'HistoryTapeAsync',
+    'TapeEntry',
+    'parse_history_date'
 ]
+
+# Подмодули импортируются при первом обращении, чтобы не загружать httpx, bs4 и lxml без необходимости
+__getattr__, __dir__ = lazy_imports(globals(), {
+    'WebClientObject': '._base',
+    'WebClient': '._client',
+    'WebClientAsync': '._client_async',
+    'MainPage': '._dataclasses',
+    'MainPageItem': '._dataclasses',
+    'ItemDescription': '._dataclasses',
+    'ItemInfo': '._dataclasses',
+    'SellOffer': '._dataclasses',
+    'Referal': '._dataclasses',
+    'HistoryItem': '._dataclasses',
+    'CatalogCrawler': '._crawler',
+    'ItemUrlCache': '._url_cache',
+    'ProxyPool': '._proxy_pool',
+    'parse_item_infos': '._bulk',
+    'parse_item_infos_async': '._bulk',
+    'HistoryTape': '._tape',
+    'HistoryTapeAsync': '._tape',
+    'TapeEntry': '._tape',
+    'parse_history_date': '._tape'
+})
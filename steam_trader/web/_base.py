@@ -1,10 +1,11 @@
 import re
 import logging
+import functools
 import dataclasses
 from abc import ABCMeta
 from dataclasses import dataclass
-from collections.abc import MutableSequence
-from typing import TypeVar
+from collections.abc import Collection, MutableSequence
+from typing import Optional, TypeVar
 
 _WT = TypeVar("_WT")
 
@@ -43,30 +44,42 @@ class WebClientObject:
         return __obj
 
     @classmethod
-    def de_json(cls: dataclass, data: dict) -> dict:
+    def de_json(cls: dataclass, data: dict, *, values: Optional[dict] = None, ignore: Collection[str] = ()) -> dict:
         """Десериализация объекта.
 
+        Исходный словарь не изменяется и не копируется.
+
         Args:
             data (:obj:`dict`): Поля и значения десериализуемого объекта.
+            values (:obj:`dict`, optional): Преобразованные значения полей. Заменяют значения из data.
+                Словарь будет дополнен и возвращён.
+            ignore (Collection[:obj:`str`]): Ключи data, которые не нужно передавать датаклассу.
 
         Returns:
             :obj:`dict`, optional: Словарь с валидными аттрибутами для создания датакласса.
         """
 
-        data = data.copy()
-
-        fields = {f.name for f in dataclasses.fields(cls)}
+        fields = _fields(cls)
 
-        cleaned_data = {}
-        unknown_data = {}
+        cleaned_data = {} if values is None else values
+        unknown_data = None
 
         for k, v in data.items():
+            if k in cleaned_data or k in ignore:
+                continue
             if k in fields:
                 cleaned_data[k] = v
             else:
+                if unknown_data is None:
+                    unknown_data = {}
                 unknown_data[k] = v
 
         if unknown_data:
             logging.warning(f'Были получены неизвестные аттриубты для класса {cls} :: {unknown_data}')
 
         return cleaned_data
+
+
+@functools.cache
+def _fields(cls: type) -> frozenset[str]:
+    return frozenset(f.name for f in dataclasses.fields(cls))
@@ -0,0 +1,135 @@
+import json
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+from collections.abc import Iterable, Iterator
+from typing import Optional, Union
+
+from ._dataclasses import ItemInfo, SellOffer, ItemDescription
+from ._parsing import parse_html, item_page, item_descriptions
+from steam_trader.exceptions import UnknownItem
+
+
+OFFER_FIELDS = ('id', 'itemid', 'image_url', 'name', 'type', 'price')
+DESCRIPTION_FIELDS = ('name', 'type', 'image_small', 'color', 'outline', 'description')
+
+# Компактное представление страницы предмета, которое передаётся между процессами:
+# (auth, item, commission, discount, ((OFFER_FIELDS...), ...), ((itemid, DESCRIPTION_FIELDS...), ...) | None)
+CompactItemInfo = tuple
+
+
+def compact_item_info(body: Union[bytes, str]) -> Optional[CompactItemInfo]:
+    """Разобрать тело ответа страницы предмета в компактный кортеж.
+
+    Кортежи из строк и чисел сериализуются pickle значительно быстрее и занимают меньше места, чем датаклассы.
+
+    Args:
+        body (Union[:obj:`bytes`, :obj:`str`]): Тело ответа, например из
+            :meth:`steam_trader.web.WebClient.get_item_info_raw`.
+
+    Returns:
+        :obj:`tuple`, optional: Компактное представление страницы. None, если предмет неизвестен.
+    """
+
+    data = json.loads(body)
+    offers, script = item_page(parse_html(data['contents']))
+    try:
+        descriptions = item_descriptions(script)
+    except UnknownItem:
+        return None
+
+    return (
+        data['auth'],
+        data['item'],
+        data.get('commission'),
+        data.get('discount'),
+        tuple(tuple(offer[f] for f in OFFER_FIELDS) for offer in offers),
+        None if descriptions is None else tuple(
+            (itemid, *(description[f] for f in DESCRIPTION_FIELDS)) for itemid, description in descriptions.items()
+        )
+    )
+
+
+def item_info_from_compact(compact: CompactItemInfo) -> 'ItemInfo':
+    """Восстановить :class:`steam_trader.web.ItemInfo` из компактного кортежа.
+
+    Args:
+        compact (:obj:`tuple`): Результат :func:`compact_item_info`.
+
+    Returns:
+        :class:`steam_trader.web.ItemInfo`: Информация о предмете.
+    """
+
+    auth, item, commission, discount, offers, descriptions = compact
+    if descriptions is not None:
+        descriptions = {d[0]: ItemDescription(*d[1:]) for d in descriptions}
+    return ItemInfo(
+        auth=auth,
+        sell_offers=[SellOffer(*offer) for offer in offers],
+        descriptions=descriptions,
+        item=item,
+        commission=commission,
+        discount=discount
+    )
+
+
+def parse_item_infos(
+        bodies: Iterable[Union[bytes, str]],
+        *,
+        executor: Optional[Executor] = None,
+        chunksize: int = 16
+) -> Iterator[Optional['ItemInfo']]:
+    """Разобрать множество страниц предметов в пуле процессов.
+
+    Страницы разбираются во всех процессах пула, а в основной процесс возвращаются компактные кортежи.
+    Результаты возвращаются в порядке страниц.
+
+    Args:
+        bodies (Iterable[Union[:obj:`bytes`, :obj:`str`]]): Тела ответов страниц предметов.
+        executor (:class:`concurrent.futures.Executor`, optional): Пул для разбора. Если не указан,
+            создаётся пул процессов по количеству ядер и закрывается по окончании.
+        chunksize (:obj:`int`): Количество страниц, передаваемых процессу за раз. По умолчанию 16.
+
+    Yields:
+        :class:`steam_trader.web.ItemInfo`, optional: Информация о предмете. None, если предмет неизвестен.
+    """
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor()
+    try:
+        for compact in executor.map(compact_item_info, bodies, chunksize=chunksize):
+            yield None if compact is None else item_info_from_compact(compact)
+    finally:
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+
+
+async def parse_item_infos_async(
+        bodies: Iterable[Union[bytes, str]],
+        executor: Executor,
+        *,
+        chunksize: int = 16
+) -> list[Optional['ItemInfo']]:
+    """Разобрать множество страниц предметов в пуле процессов, не блокируя цикл событий.
+
+    Args:
+        bodies (Iterable[Union[:obj:`bytes`, :obj:`str`]]): Тела ответов страниц предметов.
+        executor (:class:`concurrent.futures.Executor`): Пул для разбора.
+        chunksize (:obj:`int`): Количество страниц, передаваемых процессу за раз. По умолчанию 16.
+
+    Returns:
+        list[:class:`steam_trader.web.ItemInfo`, optional]: Информация о предметах в порядке страниц.
+            None для неизвестных предметов.
+    """
+
+    bodies = list(bodies)
+    loop = asyncio.get_running_loop()
+    chunks = await asyncio.gather(*(
+        loop.run_in_executor(executor, _compact_chunk, bodies[i:i + chunksize])
+        for i in range(0, len(bodies), chunksize)
+    ))
+    return [None if compact is None else item_info_from_compact(compact) for chunk in chunks for compact in chunk]
+
+
+def _compact_chunk(bodies: list[Union[bytes, str]]) -> list[Optional[CompactItemInfo]]:
+    return [compact_item_info(body) for body in bodies]
@@ -1,4 +1,4 @@
-import bs4
+import json
 import httpx
 import logging
 import functools
@@ -6,8 +6,11 @@ from collections.abc import Sequence, Callable
 from typing import Optional, LiteralString, TypeVar, Any
 from ._base import WebClientObject
 from ._dataclasses import MainPage, ItemInfo, Referal, HistoryItem
+from ._url_cache import ItemUrlCache, is_stale
+from ._proxy_pool import ProxyPool
+from ._parsing import parse_html, history_page
 from steam_trader import constants
-from steam_trader.exceptions import Unauthorized, UnsupportedAppID
+from steam_trader.exceptions import Unauthorized, UnsupportedAppID, TooManyRequests
 
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -42,18 +45,25 @@ class WebClient(WebClientObject):
         sessionid (:obj:`int`), optional: ID сессии. Может быть пустым.
         proxy (:obj:`str`, optional): Прокси для запросов. Для использования нужен контекстный менеджер with.
         base_url (:obj:`str`, optional): Ссылка на API Steam Trader.
+        url_cache (:class:`steam_trader.web.ItemUrlCache`, optional): Кэш ссылок на страницы предметов.
+            Один кэш можно передать нескольким клиентам. По умолчанию у каждого клиента свой кэш в памяти.
+        proxy_pool (:class:`steam_trader.web.ProxyPool`, optional): Пул прокси. Нельзя указывать вместе с proxy.
         **kwargs: Будут переданы httpx клиенту. Например timeout.
 
     Attributes:
         sessionid (:obj:`int`), optional: ID сессии.
         proxy (:obj:`str`, optional): Прокси для запросов.
         base_url (:obj:`str`, optional): Ссылка на API Steam Trader.
+        url_cache (:class:`steam_trader.web.ItemUrlCache`): Кэш ссылок на страницы предметов.
+        proxy_pool (:class:`steam_trader.web.ProxyPool`, optional): Пул прокси.
     """
 
     __slots__ = [
         'sessionid',
         'proxy',
-        'base_utl'
+        'base_utl',
+        'url_cache',
+        'proxy_pool'
     ]
 
     def __init__(
@@ -62,6 +72,8 @@ class WebClient(WebClientObject):
             *,
             proxy: Optional[str] = None,
             base_url: Optional[str] = None,
+            url_cache: Optional['ItemUrlCache'] = None,
+            proxy_pool: Optional['ProxyPool'] = None,
             **kwargs
     ):
 
@@ -73,6 +85,12 @@ class WebClient(WebClientObject):
 
         self._httpx_client = None
         self.proxy = proxy
+        self.url_cache = url_cache if url_cache is not None else ItemUrlCache()
+        self.proxy_pool = proxy_pool
+        if proxy_pool is not None:
+            if proxy is not None:
+                raise ValueError('Нельзя указать proxy и proxy_pool одновременно.')
+            kwargs['transport'] = proxy_pool
         self.kwargs = kwargs
 
     def __enter__(self) -> 'WebClient':
@@ -120,6 +138,9 @@ class WebClient(WebClientObject):
 
         Returns:
             :class:`steam_trader.web_api.MainPage`: Главная страница покупки.
+
+        Raises:
+            TooManyRequests: Сайт ограничил частоту запросов (HTTP 429).
         """
 
         try:
@@ -127,7 +148,7 @@ class WebClient(WebClientObject):
         except KeyError:
             raise UnsupportedAppID('Указан недействительный AppID.')
 
-        if items_on_page not in range(24, 121) or items_on_page % 6 != 0:
+        if items_on_page not in constants.ITEMS_ON_PAGE_VALUES:
             logging.warning(f'Неправильное значение items_on_page >> {items_on_page}')
 
         if sort not in [None, '-rating', 'rating', '-price', 'price', '-benefit', 'benefit', '-name', 'name']:
@@ -156,9 +177,11 @@ class WebClient(WebClientObject):
                 'sid': self.sessionid,
                 'settings': f'%7B%22market_{gameid}_onPage%22%3A{items_on_page}%7D'
             }
-        ).json()
+        )
+        if result.status_code == 429:
+            raise TooManyRequests('Вы отправили слишком много запросов.')
 
-        return MainPage.de_json(result)
+        return MainPage.de_json(result.json())
 
     @log
     def get_item_info(
@@ -180,17 +203,60 @@ class WebClient(WebClientObject):
             :class:`steam_trader.web_api.ItemInfo`: Информацию о предмете.
         """
 
-        if items_on_page not in range(24, 121) or items_on_page % 6 != 0:
+        if items_on_page not in constants.ITEMS_ON_PAGE_VALUES:
             logging.warning(f'Неправильное значение items_on_page >> {items_on_page}')
 
+        return ItemInfo.de_json(json.loads(self.get_item_info_raw(gid, page=page, items_on_page=items_on_page)))
+
+    def get_item_info_raw(
+            self,
+            gid: int,
+            *,
+            page: int = 1,
+            items_on_page: int = 24
+    ) -> bytes:
+        """Получить тело ответа страницы предмета без разбора.
+
+        Используется для массового разбора в пуле процессов, см. :func:`steam_trader.web.parse_item_infos`.
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+            page (:obj:`int`): Номер страницы.
+            items_on_page (:obj:`int`): Кол-во предметов на странице.
+                Значение должно быть в диапазоне от 24 до 120.
+
+        Returns:
+            :obj:`bytes`: Тело ответа.
+
+        Raises:
+            TooManyRequests: Сайт ограничил частоту запросов (HTTP 429).
+        """
+
+        url = self.url_cache.get(gid)
+        cached = url is not None
+        if not cached:
+            url = self._resolve_item_url(gid)
+
+        response = self._get_item_page(url, page, items_on_page)
+        if cached and is_stale(response):  # Например, предмет переименовали
+            self.url_cache.invalidate(gid)
+            response = self._get_item_page(self._resolve_item_url(gid), page, items_on_page)
+        if response.status_code == 429:
+            raise TooManyRequests('Вы отправили слишком много запросов.')
+        return response.content
+
+    def _resolve_item_url(self, gid: int) -> str:
         url = f'{self.base_url}tf2/{gid}-The-Wrap-Assassin'  # Сайт перенаправляет на корректную страницу
-        correct_url = (self._httpx_client or httpx).get(
+        correct_url = str((self._httpx_client or httpx).get(
             url,
             follow_redirects=True
-        ).url
+        ).url)
+        self.url_cache.set(gid, correct_url)
+        return correct_url
 
-        result = (self._httpx_client or httpx).get(
-            correct_url,
+    def _get_item_page(self, url: str, page: int, items_on_page: int) -> httpx.Response:
+        return (self._httpx_client or httpx).get(
+            url,
             headers={
                 'x-pjax': 'true',
                 'x-requested-with': 'XMLHttpRequest',
@@ -201,9 +267,7 @@ class WebClient(WebClientObject):
                 'sid': self.sessionid,
                 'settings': f'%7B%22item_onPage%22%3A{items_on_page}%7D'
             }
-        ).json()
-
-        return ItemInfo.de_json(result)
+        )
 
     @log
     def get_referral_link(self) -> str:
@@ -227,6 +291,8 @@ class WebClient(WebClientObject):
             cookies={'sid': self.sessionid}
         ).json()
 
+        import bs4  # Импортируется только при разборе реферальных страниц
+
         html = bs4.BeautifulSoup(result['contents'], 'lxml')
         return html.find('input', {'class': 'big'}).get('value')
 
@@ -253,7 +319,7 @@ class WebClient(WebClientObject):
         if not self.sessionid:
             raise Unauthorized('Для использования данного метода нужно указать sessionid (sid). Вы можете найти его в файлах куки.')
 
-        if items_on_page not in range(24, 121) or items_on_page % 6 != 0:
+        if items_on_page not in constants.ITEMS_ON_PAGE_VALUES:
             logging.warning(f'Неправильное значение items_on_page >> {items_on_page}')
 
         url = self.base_url + 'referral/'
@@ -268,6 +334,8 @@ class WebClient(WebClientObject):
             cookies={'sid': self.sessionid, 'settings': f'%7B%22referral_onPage%22%3A{items_on_page}%7D'}
         ).json()
 
+        import bs4  # Импортируется только при разборе реферальных страниц
+
         html = bs4.BeautifulSoup(result['contents'], 'lxml')
         tds = html.find_all('td')
 
@@ -320,12 +388,4 @@ class WebClient(WebClientObject):
         url = f'https://steam-trader.com/{game_name}/history/'
         page = (self._httpx_client or httpx).get(url)
 
-        html = bs4.BeautifulSoup(page.content, 'lxml')
-
-        history = html.find_all('div', {'class': 'items'})
-        history_items = history[i].find_all('a')
-
-        result = []
-        for item in history_items:
-            result.append(HistoryItem.de_json(item))
-        return result
+        return [HistoryItem(**item) for item in history_page(parse_html(page.content), i)]
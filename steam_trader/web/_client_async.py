@@ -1,14 +1,19 @@
-import bs4
+import json
 import httpx
+import asyncio
 import logging
 import functools
+from concurrent.futures import Executor
 from collections.abc import Sequence, Callable
 from typing import Optional, LiteralString, TypeVar, Any
 
 from ._base import WebClientObject
 from ._dataclasses import MainPage, ItemInfo, Referal, HistoryItem
+from ._url_cache import ItemUrlCache, is_stale
+from ._proxy_pool import ProxyPool
+from ._parsing import parse_html, history_page
 from steam_trader import constants
-from steam_trader.exceptions import Unauthorized, UnsupportedAppID
+from steam_trader.exceptions import Unauthorized, UnsupportedAppID, TooManyRequests
 
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -31,6 +36,20 @@ def log(method: F) -> F:
 
     return wrapper
 
+
+# Функции разбора объявлены на уровне модуля, чтобы их можно было передать в пул процессов.
+def _main_page_from_content(content: bytes) -> 'MainPage':
+    return MainPage.de_json(json.loads(content))
+
+
+def _item_info_from_content(content: bytes) -> 'ItemInfo':
+    return ItemInfo.de_json(json.loads(content))
+
+
+def _history_from_content(content: bytes, index: int) -> list['HistoryItem']:
+    return [HistoryItem(**item) for item in history_page(parse_html(content), index)]
+
+
 class WebClientAsync(WebClientObject):
     """Этот клиент позволяет получить данные сайта без API ключа или получить информацию, которая недоступна через API.
     Для некоторых методов необходимо указать ID сессии. Он сбрасывается раз в неделю и находится в файлах куки (или хедерах).
@@ -42,18 +61,34 @@ class WebClientAsync(WebClientObject):
         sessionid (:obj:`int`), optional: ID сессии. Может быть пустым.
         proxy (:obj:`str`, optional): Прокси для запросов.
         base_url (:obj:`str`, optional): Ссылка на API Steam Trader.
+        url_cache (:class:`steam_trader.web.ItemUrlCache`, optional): Кэш ссылок на страницы предметов.
+            Один кэш можно передать нескольким клиентам. По умолчанию у каждого клиента свой кэш в памяти.
+        proxy_pool (:class:`steam_trader.web.ProxyPool`, optional): Пул прокси. Нельзя указывать вместе с proxy.
+        parse_executor (:class:`concurrent.futures.Executor`, optional): Пул потоков или процессов для разбора
+            страниц, чтобы разбор не блокировал цикл событий. По умолчанию пул потоков цикла событий.
+        parse_threshold (:obj:`int`, optional): Размер ответа в байтах, начиная с которого разбор переносится
+            в parse_executor. Меньшие ответы разбираются сразу. Если None, разбор всегда выполняется
+            в цикле событий. По умолчанию 64 КБ.
         **kwargs: Будут переданы httpx клиенту. Например timeout.
 
     Attributes:
         sessionid (:obj:`int`), optional: ID сессии.
         proxy (:obj:`str`, optional): Прокси для запросов.
         base_url (:obj:`str`, optional): Ссылка на API Steam Trader.
+        url_cache (:class:`steam_trader.web.ItemUrlCache`): Кэш ссылок на страницы предметов.
+        proxy_pool (:class:`steam_trader.web.ProxyPool`, optional): Пул прокси.
+        parse_executor (:class:`concurrent.futures.Executor`, optional): Пул для разбора страниц.
+        parse_threshold (:obj:`int`, optional): Размер ответа, начиная с которого разбор переносится в пул.
     """
 
     __slots__ = [
         'sessionid',
         'proxy',
-        'base_utl'
+        'base_utl',
+        'url_cache',
+        'proxy_pool',
+        'parse_executor',
+        'parse_threshold'
     ]
 
     def __init__(
@@ -62,6 +97,10 @@ class WebClientAsync(WebClientObject):
             *,
             proxy: Optional[str] = None,
             base_url: Optional[str] = None,
+            url_cache: Optional['ItemUrlCache'] = None,
+            proxy_pool: Optional['ProxyPool'] = None,
+            parse_executor: Optional[Executor] = None,
+            parse_threshold: Optional[int] = 64 * 1024,
             **kwargs
     ):
 
@@ -73,6 +112,14 @@ class WebClientAsync(WebClientObject):
 
         self._async_client = None
         self.proxy = proxy
+        self.url_cache = url_cache if url_cache is not None else ItemUrlCache()
+        self.proxy_pool = proxy_pool
+        if proxy_pool is not None:
+            if proxy is not None:
+                raise ValueError('Нельзя указать proxy и proxy_pool одновременно.')
+            kwargs['transport'] = proxy_pool
+        self.parse_executor = parse_executor
+        self.parse_threshold = parse_threshold
         self.kwargs = kwargs
 
     async def __aenter__(self) -> 'WebClientAsync':
@@ -82,6 +129,11 @@ class WebClientAsync(WebClientObject):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self._async_client.aclose()
 
+    async def _parse(self, parser: Callable[..., Any], content: bytes, *args) -> Any:
+        if self.parse_threshold is None or len(content) < self.parse_threshold:
+            return parser(content, *args)
+        return await asyncio.get_running_loop().run_in_executor(self.parse_executor, parser, content, *args)
+
     @log
     async def get_main_page(
             self,
@@ -120,6 +172,9 @@ class WebClientAsync(WebClientObject):
 
         Returns:
             :class:`steam_trader.web.MainPage`: Главная страница покупки.
+
+        Raises:
+            TooManyRequests: Сайт ограничил частоту запросов (HTTP 429).
         """
 
         try:
@@ -127,7 +182,7 @@ class WebClientAsync(WebClientObject):
         except KeyError:
             raise UnsupportedAppID('Указан недействительный AppID.')
 
-        if items_on_page not in range(24, 121) or items_on_page % 6 != 0:
+        if items_on_page not in constants.ITEMS_ON_PAGE_VALUES:
             logging.warning(f'Неправильное значение items_on_page >> {items_on_page}')
 
         if sort not in [None, '-rating', '+rating', '-price', '+price', '-benefit', '+benefit', 'name', '-name']:
@@ -137,7 +192,7 @@ class WebClientAsync(WebClientObject):
             filters = {}
 
         url = self.base_url + game_name + '/'
-        result = (await self._async_client.get(
+        result = await self._async_client.get(
             url,
             headers={
                 'x-pjax': 'true',
@@ -156,9 +211,11 @@ class WebClientAsync(WebClientObject):
                 'sid': self.sessionid,
                 'settings': f'%7B%22market_{gameid}_onPage%22%3A{items_on_page}%7D'
             }
-        )).json()
+        )
+        if result.status_code == 429:
+            raise TooManyRequests('Вы отправили слишком много запросов.')
 
-        return MainPage.de_json(result)
+        return await self._parse(_main_page_from_content, result.content)
 
     @log
     async def get_item_info(
@@ -180,16 +237,61 @@ class WebClientAsync(WebClientObject):
             :class:`steam_trader.web.ItemInfo`: Информацию о предмете.
         """
 
-        if items_on_page not in range(24, 121) or items_on_page % 6 != 0:
+        if items_on_page not in constants.ITEMS_ON_PAGE_VALUES:
             logging.warning(f'Неправильное значение items_on_page >> {items_on_page}')
 
+        content = await self.get_item_info_raw(gid, page=page, items_on_page=items_on_page)
+        return await self._parse(_item_info_from_content, content)
+
+    async def get_item_info_raw(
+            self,
+            gid: int,
+            *,
+            page: int = 1,
+            items_on_page: int = 24
+    ) -> bytes:
+        """Получить тело ответа страницы предмета без разбора.
+
+        Используется для массового разбора в пуле процессов, см. :func:`steam_trader.web.parse_item_infos`.
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+            page (:obj:`int`): Номер страницы.
+            items_on_page (:obj:`int`): Кол-во предметов на странице.
+                Значение должно быть в диапазоне от 24 до 120.
+
+        Returns:
+            :obj:`bytes`: Тело ответа.
+
+        Raises:
+            TooManyRequests: Сайт ограничил частоту запросов (HTTP 429).
+        """
+
+        url = self.url_cache.get(gid)
+        cached = url is not None
+        if not cached:
+            url = await self._resolve_item_url(gid)
+
+        response = await self._get_item_page(url, page, items_on_page)
+        if cached and is_stale(response):  # Например, предмет переименовали
+            self.url_cache.invalidate(gid)
+            response = await self._get_item_page(await self._resolve_item_url(gid), page, items_on_page)
+        if response.status_code == 429:
+            raise TooManyRequests('Вы отправили слишком много запросов.')
+        return response.content
+
+    async def _resolve_item_url(self, gid: int) -> str:
         url = f'{self.base_url}tf2/{gid}-The-Wrap-Assassin'  # Сайт перенаправляет на корректную страницу
-        correct_url = (await self._async_client.get(
+        correct_url = str((await self._async_client.get(
             url,
             follow_redirects=True
-        )).url
-        result = (await self._async_client.get(
-            correct_url,
+        )).url)
+        self.url_cache.set(gid, correct_url)
+        return correct_url
+
+    async def _get_item_page(self, url: str, page: int, items_on_page: int) -> httpx.Response:
+        return await self._async_client.get(
+            url,
             headers={
                 'x-pjax': 'true',
                 'x-requested-with': 'XMLHttpRequest',
@@ -200,9 +302,7 @@ class WebClientAsync(WebClientObject):
                 'sid': self.sessionid,
                 'settings': f'%7B%22item_onPage%22%3A{items_on_page}%7D'
             }
-        )).json()
-
-        return ItemInfo.de_json(result)
+        )
 
     @log
     async def get_referral_link(self) -> str:
@@ -226,6 +326,8 @@ class WebClientAsync(WebClientObject):
             cookies={'sid': self.sessionid}
         )).json()
 
+        import bs4  # Импортируется только при разборе реферальных страниц
+
         html = bs4.BeautifulSoup(result['contents'], 'lxml')
         return html.find('input', {'class': 'big'}).get('value')
 
@@ -252,7 +354,7 @@ class WebClientAsync(WebClientObject):
         if not self.sessionid:
             raise Unauthorized('Для использования данного метода нужно указать sessionid (sid). Вы можете найти его в файлах куки.')
 
-        if items_on_page not in range(24, 121) or items_on_page % 6 != 0:
+        if items_on_page not in constants.ITEMS_ON_PAGE_VALUES:
             logging.warning(f'Неправильное значение items_on_page >> {items_on_page}')
 
         url = self.base_url + 'referral/'
@@ -267,6 +369,8 @@ class WebClientAsync(WebClientObject):
             cookies={'sid': self.sessionid, 'settings': f'%7B%22referral_onPage%22%3A{items_on_page}%7D'}
         )).json()
 
+        import bs4  # Импортируется только при разборе реферальных страниц
+
         html = bs4.BeautifulSoup(result['contents'], 'lxml')
         tds = html.find_all('td')
 
@@ -287,13 +391,13 @@ class WebClientAsync(WebClientObject):
         return referals
 
     @log
-    async def get_history_page(self, gameid: int, category: LiteralString = 'last_purchases') -> Sequence['HistoryItem']:
+    async def get_history_page(self, gameid: int, category: LiteralString = 'last') -> Sequence['HistoryItem']:
         """Получить страницу истории продаж.
 
         Args:
             gameid (:obj:`int`): AppID игры.
             category (:obj:`str`): Категория истории.
-                'last_purchases': Последние покупки. По умолчанию.
+                'last': Последние покупки. По умолчанию. Для совместимости также принимается 'last_purchases'.
                 'day_most': Самые дорогие за 24 часа.
                 'all_time_most': Самые дорогие за все время.
 
@@ -307,7 +411,7 @@ class WebClientAsync(WebClientObject):
             raise UnsupportedAppID('Указан недействительный AppID.')
 
         match category:
-            case 'last_purchases':
+            case 'last' | 'last_purchases':
                 i = 0
             case 'day_most':
                 i = 1
@@ -319,12 +423,4 @@ class WebClientAsync(WebClientObject):
         url = f'https://steam-trader.com/{game_name}/history/'
         page = await self._async_client.get(url)
 
-        html = bs4.BeautifulSoup(page.content, 'lxml')
-
-        history = html.find_all('div', {'class': 'items'})
-        history_items = history[i].find_all('a')
-
-        result = []
-        for item in history_items:
-            result.append(HistoryItem.de_json(item))
-        return result
+        return await self._parse(_history_from_content, page.content, i)
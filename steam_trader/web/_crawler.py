@@ -0,0 +1,269 @@
+import json
+import time
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Sequence
+from typing import TYPE_CHECKING, Optional, LiteralString
+
+import httpx
+
+from ._dataclasses import MainPage, MainPageItem
+from steam_trader._rate_limit import AsyncRateLimiter
+from steam_trader.constants import MAX_ITEMS_ON_PAGE
+from steam_trader.exceptions import NotFoundError, TooManyRequests
+
+if TYPE_CHECKING:
+    from ._client_async import WebClientAsync
+
+
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+# Ошибки, после которых запрос страницы можно повторить.
+RETRY_ERRORS = (httpx.TransportError, json.JSONDecodeError, TooManyRequests)
+
+
+class CatalogCrawler:
+    """Класс, представляющий обходчик каталога игры.
+
+    Первая страница запрашивается отдельно, чтобы узнать количество страниц, остальные загружаются пулом
+    из workers задач с общим ограничением частоты. Предметы возвращаются по мере загрузки страниц.
+    Если во время обхода сайт переставил предметы, повторы отбрасываются по gid.
+    При ответе 429 все задачи приостанавливаются, и запрос повторяется с экспоненциальной задержкой.
+
+    Для полного обхода большого каталога используйте :meth:`crawl_bands`, который делит каталог
+    на ценовые диапазоны и не запрашивает глубокие страницы.
+
+    Args:
+        client (:class:`steam_trader.web.WebClientAsync`): Веб клиент.
+        workers (:obj:`int`): Количество одновременно загружаемых страниц. По умолчанию 4.
+        rate (:obj:`float`, optional): Максимальное количество запросов в секунду. По умолчанию не ограничено.
+        retries (:obj:`int`): Количество повторов при сетевых ошибках и ответе 429. По умолчанию 3.
+        items_on_page (:obj:`int`): Количество предметов на странице. По умолчанию наибольшее допустимое.
+
+    Attributes:
+        client (:class:`steam_trader.web.WebClientAsync`): Веб клиент.
+        workers (:obj:`int`): Количество одновременно загружаемых страниц.
+        retries (:obj:`int`): Количество повторов при сетевых ошибках и ответе 429.
+        items_on_page (:obj:`int`): Количество предметов на странице.
+
+    Raises:
+        ValueError: Недопустимое значение workers.
+    """
+
+    __slots__ = [
+        'client',
+        'workers',
+        'retries',
+        'items_on_page',
+        '_limiter',
+        '_semaphore',
+        '_resume_at'
+    ]
+
+    def __init__(
+            self,
+            client: 'WebClientAsync',
+            *,
+            workers: int = 4,
+            rate: Optional[float] = None,
+            retries: int = 3,
+            items_on_page: int = MAX_ITEMS_ON_PAGE
+    ) -> None:
+        if workers < 1:
+            raise ValueError(f'Недопустимое значение workers :: {workers}')
+
+        self.client = client
+        self.workers = workers
+        self.retries = retries
+        self.items_on_page = items_on_page
+        self._limiter = AsyncRateLimiter(rate) if rate is not None else None
+        self._semaphore = asyncio.Semaphore(workers)
+        self._resume_at = 0.0
+
+    async def crawl(
+            self,
+            gameid: int,
+            *,
+            price_from: int = 0,
+            price_to: int = 2000,
+            filters: Optional[dict[str, int]] = None,
+            text: Optional[str] = None,
+            sort: LiteralString = '-rating'
+    ) -> AsyncIterator['MainPageItem']:
+        """Обойти каталог игры. Аргументы аналогичны :meth:`steam_trader.web.WebClientAsync.get_main_page`.
+
+        Args:
+            gameid (:obj:`int`): AppID игры.
+            price_from (:obj:`int`): Минимальная цена предмета.
+            price_to (:obj:`int`): Максимальная цена предмета. Если больше или равно 2000, ограничение снимается.
+            filters (:obj:`dict[str, int]`, optional): Словарь пар название/ID.
+            text (:obj:`str`, optional): Текст, который должен встречаться в названии.
+            sort (:obj:`LiteralString`): Метод сортировки.
+
+        Yields:
+            :class:`steam_trader.web.MainPageItem`: Предметы в порядке загрузки страниц.
+        """
+
+        seen = set()
+        async for item in self._crawl(gameid, price_from, price_to, filters, text, sort):
+            if item.gid not in seen:
+                seen.add(item.gid)
+                yield item
+
+    async def _crawl(
+            self,
+            gameid: int,
+            price_from: int,
+            price_to: int,
+            filters: Optional[dict[str, int]],
+            text: Optional[str],
+            sort: LiteralString,
+            first: Optional['MainPage'] = None
+    ) -> AsyncIterator['MainPageItem']:
+
+        async def fetch(page: int) -> Optional['MainPage']:
+            return await self._fetch(
+                gameid, price_from=price_from, price_to=price_to, filters=filters, text=text, sort=sort, page=page
+            )
+
+        if first is None:
+            first = await fetch(1)
+            if first is None:
+                return
+        for item in first.items:
+            yield item
+
+        pages: asyncio.Queue[int] = asyncio.Queue()
+        for page in range(2, first.page_count + 1):
+            pages.put_nowait(page)
+        results: asyncio.Queue[Optional[MainPage] | Exception] = asyncio.Queue()
+
+        async def worker() -> None:
+            while not pages.empty():
+                page = pages.get_nowait()
+                try:
+                    main_page = await fetch(page)
+                except Exception as e:
+                    await results.put(e)
+                    return
+                await results.put(main_page)
+
+        tasks = [asyncio.create_task(worker()) for _ in range(min(self.workers, pages.qsize()))]
+        try:
+            for _ in range(first.page_count - 1):
+                main_page = await results.get()
+                if isinstance(main_page, Exception):
+                    raise main_page
+                if main_page is not None:
+                    for item in main_page.items:
+                        yield item
+        finally:
+            for task in tasks:  # При ошибке или досрочном выходе останавливаем загрузку
+                task.cancel()
+
+    async def crawl_bands(
+            self,
+            gameid: int,
+            *,
+            bands: Sequence[tuple[int, int]] = ((0, 2000),),
+            max_pages: int = 10,
+            filters: Optional[dict[str, int]] = None,
+            text: Optional[str] = None,
+            sort: LiteralString = '+price'
+    ) -> AsyncIterator['MainPageItem']:
+        """Обойти каталог игры, разбив его на ценовые диапазоны.
+
+        Диапазоны обходятся одновременно. Если в диапазоне больше max_pages страниц, он делится пополам,
+        поэтому глубокие, медленные и нестабильные страницы не запрашиваются. Результаты всех диапазонов
+        объединяются в один поток без повторов. Общее количество одновременных запросов не превышает workers.
+        Сайт принимает только целые цены, поэтому диапазон шириной 1 не делится и обходится полностью
+        с предупреждением в журнале.
+
+        Args:
+            gameid (:obj:`int`): AppID игры.
+            bands (Sequence[tuple[:obj:`int`, :obj:`int`]]): Начальные диапазоны цен (price_from, price_to).
+                По умолчанию весь каталог.
+            max_pages (:obj:`int`): Максимальное количество страниц в диапазоне. По умолчанию 10.
+            filters (:obj:`dict[str, int]`, optional): Словарь пар название/ID.
+            text (:obj:`str`, optional): Текст, который должен встречаться в названии.
+            sort (:obj:`LiteralString`): Метод сортировки внутри диапазона. По умолчанию по цене.
+
+        Yields:
+            :class:`steam_trader.web.MainPageItem`: Предметы в порядке загрузки страниц.
+        """
+
+        results: asyncio.Queue[Sequence[MainPageItem] | Exception | None] = asyncio.Queue()
+        tasks = []
+
+        def start(price_from: int, price_to: int) -> None:
+            tasks.append(asyncio.create_task(crawl_band(price_from, price_to)))
+
+        async def crawl_band(price_from: int, price_to: int) -> None:
+            try:
+                first = await self._fetch(
+                    gameid, price_from=price_from, price_to=price_to, filters=filters, text=text, sort=sort, page=1
+                )
+                if first is None:
+                    return
+                if first.page_count > max_pages:
+                    if price_to - price_from > 1:
+                        middle = (price_from + price_to) // 2
+                        start(price_from, middle)
+                        start(middle, price_to)
+                        await results.put(first.items)
+                        return
+                    # Сайт принимает только целые цены, поэтому диапазон уже минимален и обходится полностью
+                    logging.warning(
+                        f'Диапазон цен {price_from}-{price_to} нельзя разделить, '
+                        f'он содержит {first.page_count} страниц при max_pages {max_pages}.'
+                    )
+                async for item in self._crawl(gameid, price_from, price_to, filters, text, sort, first):
+                    await results.put((item,))
+            except Exception as e:
+                await results.put(e)
+            finally:
+                await results.put(None)  # Диапазон обработан
+
+        for price_from, price_to in bands:
+            start(price_from, price_to)
+
+        seen = set()
+        finished = 0
+        try:
+            while finished < len(tasks):
+                items = await results.get()
+                if items is None:
+                    finished += 1
+                    continue
+                if isinstance(items, Exception):
+                    raise items
+                for item in items:
+                    if item.gid not in seen:
+                        seen.add(item.gid)
+                        yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _fetch(self, gameid: int, **params) -> Optional['MainPage']:
+        for attempt in range(self.retries + 1):
+            if self._limiter is not None:
+                await self._limiter.acquire()
+            if (pause := self._resume_at - time.monotonic()) > 0:  # Сайт ограничил частоту, ждут все задачи
+                await asyncio.sleep(pause)
+            try:
+                async with self._semaphore:
+                    return await self.client.get_main_page(gameid, items_on_page=self.items_on_page, **params)
+            except NotFoundError:
+                return None
+            except RETRY_ERRORS as e:
+                if attempt == self.retries:
+                    raise
+                delay = 2 ** attempt
+                logging.warning(f'Не удалось загрузить страницу {params["page"]}: {e!r}. Повтор через {delay} с.')
+                if self._limiter is not None:
+                    self._limiter.penalize(delay)
+                elif isinstance(e, TooManyRequests):
+                    self._resume_at = max(self._resume_at, time.monotonic() + delay)
+                else:
+                    await asyncio.sleep(delay)
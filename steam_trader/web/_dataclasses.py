@@ -1,12 +1,14 @@
-import json
-import bs4
 from lxml import etree
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Union
 from collections.abc import Sequence
 
 from ._base import WebClientObject
-from steam_trader.exceptions import UnknownItem, NotFoundError
+from ._parsing import parse_html, offer_fields, history_fields, item_page, item_descriptions
+from steam_trader.exceptions import NotFoundError
+
+if TYPE_CHECKING:
+    import bs4
 
 
 @dataclass(slots=True)
@@ -40,8 +42,7 @@ class MainPageItem(WebClientObject):
     @classmethod
     def de_json(cls: dataclass, data: dict) -> 'MainPageItem':
 
-        del data['color']
-        data = super(MainPageItem, cls).de_json(data)
+        data = super(MainPageItem, cls).de_json(data, ignore=('color',))
 
         return cls(**data)
 
@@ -78,17 +79,15 @@ class MainPage(WebClientObject):
             pass
 
         try:
-            data['items'] = data['contents']['items']
+            items = [MainPageItem.de_json(item) for item in data['contents']['items']]
         except TypeError:
-            data['items'] = []
-        del data['contents']
-
-        for i, item in enumerate(data['items']):
-            data['items'][i] = MainPageItem.de_json(item)
+            items = []
 
-        del data['body'], data['chat'], data['handler'], data['menu'], data['sorter'], data['title'], data['game']
-
-        data = super(MainPage, cls).de_json(data)
+        data = super(MainPage, cls).de_json(
+            data,
+            values={'items': items},
+            ignore=('contents', 'body', 'chat', 'handler', 'menu', 'sorter', 'title', 'game')
+        )
 
         return cls(**data)
 
@@ -114,21 +113,20 @@ class SellOffer(WebClientObject):
     price: float
 
     @classmethod
-    def de_json(cls: dataclass, tag: 'bs4.Tag') -> 'SellOffer':
-
-        tree = etree.HTML(str(tag))
-        _type = tree.xpath('//div/table/tr/td[2]/div[2]/p[2]')[0].text
-
-        data = {
-            'id': int(tag.get('data-id')),  # Названия одинаковые, но это ID предложения
-            'itemid': int(tree.xpath('//div')[0].get('data-id')),  # А это ItemID
-            'image_url': tree.xpath('//div/table/tr/td[1]/img')[0].get('src'),
-            'name': tree.xpath('//div/table/tr/td[2]/div[1]')[0].text,
-            'type': _type if _type is not None else '',
-            # 'effect': tree.xpath('//div/table/tr/td[2]/div[3]')[0].text,  # Без понятия что это
-            'price': float(tree.xpath('//div/table/tr/td[4]/div')[0].get('data-price').replace('\xa0', ''))
-        }
-        return cls(**data)
+    def de_json(cls: dataclass, tag: Union['bs4.Tag', 'etree._Element']) -> 'SellOffer':
+        """Десериализация объекта.
+
+        Args:
+            tag (Union[:class:`bs4.Tag`, :class:`lxml.etree._Element`]): Элемент div.offer.
+                Элемент lxml используется без повторного разбора.
+
+        Changes:
+            0.5.0: Добавлена поддержка элементов lxml.
+        """
+
+        if not isinstance(tag, etree._Element):
+            tag = etree.HTML(str(tag)).find('.//div')
+        return cls(**offer_fields(tag))
 
 
 @dataclass(slots=True)
@@ -173,25 +171,17 @@ class ItemInfo(WebClientObject):
     @classmethod
     def de_json(cls: dataclass, data: dict) -> 'ItemInfo':
 
-        html = bs4.BeautifulSoup(data['contents'], 'lxml')
-        data['sell_offers'] = [SellOffer.de_json(tag) for tag in html.find_all('div', {'class': 'offer'})]
+        # Страница разбирается один раз, предложения извлекаются из уже готового дерева
+        offers, script = item_page(parse_html(data['contents']))
+        descriptions = item_descriptions(script)
+        if descriptions is not None:
+            descriptions = {k: ItemDescription.de_json(v) for k, v in descriptions.items()}
 
-        try:
-            script = html.find('script').text
-            descriptions = dict(json.loads(script[script.index('var d=') + 6:script.index(';Market.setItemOffers(d,')]))
-            for k, v in descriptions.copy().items():
-                descriptions[int(k)] = ItemDescription.de_json(v)
-                descriptions.pop(k)
-        except ValueError:
-            descriptions = None
-        except AttributeError:
-            raise UnknownItem('Неизвестный предмет.')
-
-        data['descriptions'] = descriptions
-
-        del data['title'], data['game'], data['menu'], data['contents']
-
-        data = super(ItemInfo, cls).de_json(data)
+        data = super(ItemInfo, cls).de_json(
+            data,
+            values={'sell_offers': [SellOffer(**offer) for offer in offers], 'descriptions': descriptions},
+            ignore=('title', 'game', 'menu', 'contents')
+        )
 
         return cls(**data)
 
@@ -239,15 +229,17 @@ class HistoryItem(WebClientObject):
     image_url: str
 
     @classmethod
-    def de_json(cls: dataclass, tag: bs4.Tag) -> 'HistoryItem':
+    def de_json(cls: dataclass, tag: Union['bs4.Tag', 'etree._Element']) -> 'HistoryItem':
+        """Десериализация объекта.
 
-        tree = etree.HTML(str(tag))
+        Args:
+            tag (Union[:class:`bs4.Tag`, :class:`lxml.etree._Element`]): Ссылка a.item.
+                Элемент lxml используется без повторного разбора.
 
-        data = {
-            'image_url': tree.xpath('//span[1]/img')[0].get('src'),
-            'price': float(tree.xpath('//span[2]')[0].text.replace('\xa0', '').replace(',', '.')),
-            'date': tree.xpath('//span[3]')[0].text,
-            'name': tree.xpath('//span[4]')[0].text,
-            'color': tree.xpath('//span[4]')[0].get('style')[7:]
-        }
-        return cls(**data)
+        Changes:
+            0.5.0: Добавлена поддержка элементов lxml.
+        """
+
+        if not isinstance(tag, etree._Element):
+            tag = etree.HTML(str(tag))
+        return cls(**history_fields(tag))
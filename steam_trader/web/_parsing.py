@@ -0,0 +1,109 @@
+import json
+from typing import Optional, Union
+
+from lxml import etree
+
+from steam_trader.exceptions import UnknownItem
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Выражения компилируются один раз при импорте и выполняются над уже разобранным деревом.
+_OFFERS = etree.XPath(f'//div[{_has_class("offer")}]')
+_OFFER_IMAGE = etree.XPath('./table/tr/td[1]/img/@src')
+_OFFER_NAME = etree.XPath('./table/tr/td[2]/div[1]')
+_OFFER_TYPE = etree.XPath('./table/tr/td[2]/div[2]/p[2]')
+_OFFER_PRICE = etree.XPath('./table/tr/td[4]/div/@data-price')
+_SCRIPT = etree.XPath('//script')
+
+_HISTORY_BLOCKS = etree.XPath(f'//div[{_has_class("items")}]')
+_HISTORY_LINKS = etree.XPath('.//a')
+_HISTORY_IMAGE = etree.XPath('.//span[1]/img/@src')
+_HISTORY_SPAN = etree.XPath('.//span[$n]')
+
+
+def parse_html(content: Union[str, bytes]) -> Optional[etree._Element]:
+    """Разобрать HTML один раз. Возвращает None для пустого документа."""
+
+    if not content:
+        return None
+    return etree.HTML(content)
+
+
+def offer_fields(element: etree._Element) -> dict:
+    """Извлечь поля предложения о продаже из элемента div.offer."""
+
+    _type = _OFFER_TYPE(element)[0].text
+    return {
+        'id': int(element.get('data-id')),  # Названия одинаковые, но это ID предложения
+        'itemid': int(element.get('data-id')),  # А это ItemID
+        'image_url': _OFFER_IMAGE(element)[0],
+        'name': _OFFER_NAME(element)[0].text,
+        'type': _type if _type is not None else '',
+        'price': float(_OFFER_PRICE(element)[0].replace('\xa0', ''))
+    }
+
+
+def history_fields(element: etree._Element) -> dict:
+    """Извлечь поля предмета истории продаж из ссылки a.item."""
+
+    price = _HISTORY_SPAN(element, n=2)[0]
+    date = _HISTORY_SPAN(element, n=3)[0]
+    name = _HISTORY_SPAN(element, n=4)[0]
+    return {
+        'image_url': _HISTORY_IMAGE(element)[0],
+        'price': float(price.text.replace('\xa0', '').replace(',', '.')),
+        'date': date.text,
+        'name': name.text,
+        'color': name.get('style')[7:]
+    }
+
+
+def item_page(root: Optional[etree._Element]) -> tuple[list[dict], Optional[str]]:
+    """Извлечь предложения о продаже и текст первого скрипта со страницы предмета.
+
+    Returns:
+        tuple[list[:obj:`dict`], :obj:`str`, optional]: Поля предложений и текст скрипта.
+            Текст равен None, если скрипта на странице нет.
+    """
+
+    if root is None:
+        return [], None
+    scripts = _SCRIPT(root)
+    script = (scripts[0].text or '') if scripts else None
+    return [offer_fields(element) for element in _OFFERS(root)], script
+
+
+def item_descriptions(script: Optional[str]) -> Optional[dict[int, dict]]:
+    """Извлечь описания предметов из скрипта страницы предмета.
+
+    Returns:
+        dict[:obj:`int`, :obj:`dict`], optional: Пары ItemID/поля описания. None, если предмет типовой.
+
+    Raises:
+        UnknownItem: На странице нет скрипта, то есть предмет неизвестен.
+    """
+
+    if script is None:
+        raise UnknownItem('Неизвестный предмет.')
+    try:
+        descriptions = json.loads(script[script.index('var d=') + 6:script.index(';Market.setItemOffers(d,')])
+    except ValueError:
+        return None
+    return {int(k): v for k, v in dict(descriptions).items()}
+
+
+def history_page(root: Optional[etree._Element], index: int) -> list[dict]:
+    """Извлечь предметы одного из блоков страницы истории продаж.
+
+    Args:
+        root (:class:`lxml.etree._Element`): Разобранная страница.
+        index (:obj:`int`): Номер блока. 0 - последние покупки, 1 - самые дорогие за 24 часа,
+            2 - самые дорогие за все время.
+    """
+
+    if root is None:
+        return []
+    return [history_fields(element) for element in _HISTORY_LINKS(_HISTORY_BLOCKS(root)[index])]
@@ -0,0 +1,264 @@
+import time
+import asyncio
+import logging
+import threading
+from http.cookies import SimpleCookie
+from collections.abc import Sequence
+from typing import Optional
+
+import httpx
+
+
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+
+class _Proxy:
+    __slots__ = [
+        'url',
+        'healthy',
+        'retry_at',
+        'failures',
+        'requests',
+        'transport',
+        'async_transport',
+        'checking'
+    ]
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.healthy = True
+        self.retry_at = 0.0
+        self.failures = 0
+        self.requests = 0
+        self.transport: Optional[httpx.BaseTransport] = None
+        self.async_transport: Optional[httpx.AsyncBaseTransport] = None
+        self.checking = False
+
+
+class ProxyPool(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Класс, представляющий пул прокси с проверкой работоспособности.
+
+    Запросы распределяются по работающим прокси по кругу, у каждого прокси свой пул соединений.
+    Прокси, на котором произошёл таймаут, ошибка соединения или ответ 429, исключается из ротации и
+    проверяется в фоне запросом на check_url, пока снова не заработает. Время между проверками
+    удваивается после каждой неудачи, но не превышает max_cooldown. Запрос, получивший ответ 429,
+    повторяется через следующий работающий прокси. Если работающих прокси не осталось, возвращается ответ 429.
+
+    Если в запросе есть куки sid, все запросы этой сессии отправляются через один прокси,
+    так как сайт может привязывать сессию к IP адресу. Сессия переходит на другой прокси,
+    только если её прокси перестал работать.
+
+    Пул является транспортом httpx, поэтому помимо параметра proxy_pool веб клиентов его можно
+    передать любому клиенту библиотеки как transport.
+
+    Args:
+        proxies (Sequence[:obj:`str`]): Ссылки на прокси.
+        cooldown (:obj:`float`): Время в секундах до первой проверки неработающего прокси. По умолчанию 30.
+        max_cooldown (:obj:`float`): Максимальное время между проверками. По умолчанию 600.
+        check_url (:obj:`str`): Ссылка для проверки прокси.
+        **kwargs: Будут переданы транспортам httpx. Например retries или verify.
+
+    Attributes:
+        cooldown (:obj:`float`): Время в секундах до первой проверки неработающего прокси.
+        max_cooldown (:obj:`float`): Максимальное время между проверками.
+        check_url (:obj:`str`): Ссылка для проверки прокси.
+
+    Raises:
+        ValueError: Не указан ни один прокси.
+    """
+
+    def __init__(
+            self,
+            proxies: Sequence[str],
+            *,
+            cooldown: float = 30,
+            max_cooldown: float = 600,
+            check_url: str = 'https://steam-trader.com/',
+            **kwargs
+    ) -> None:
+        if not proxies:
+            raise ValueError('Не указан ни один прокси.')
+
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.check_url = check_url
+        self._proxies = [_Proxy(url) for url in proxies]
+        self._kwargs = kwargs
+        self._next = 0
+        self._sessions: dict[str, _Proxy] = {}
+        self._lock = threading.Lock()
+        self._tasks: set[asyncio.Task] = set()
+        self._closed = threading.Event()
+
+    def healthy(self) -> list[str]:
+        """Получить работающие прокси.
+
+        Returns:
+            list[:obj:`str`]: Ссылки на работающие прокси.
+        """
+
+        return [proxy.url for proxy in self._proxies if proxy.healthy]
+
+    def stats(self) -> dict[str, int]:
+        """Получить количество запросов через каждый прокси.
+
+        Returns:
+            dict[:obj:`str`, :obj:`int`]: Пары ссылка/количество запросов.
+        """
+
+        return {proxy.url: proxy.requests for proxy in self._proxies}
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for _ in self._proxies:
+            proxy = self._select(request)
+            try:
+                response = self._transport(proxy).handle_request(request)
+            except (httpx.TimeoutException, httpx.NetworkError, httpx.ProxyError):
+                self._fail(proxy, None, False)
+                raise
+            if response.status_code != 429:
+                proxy.failures = 0
+                return response
+            self._fail(proxy, response.headers.get('retry-after'), False)
+            if not self.healthy():
+                break
+            response.close()
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for _ in self._proxies:
+            proxy = self._select(request)
+            try:
+                response = await self._async_transport(proxy).handle_async_request(request)
+            except (httpx.TimeoutException, httpx.NetworkError, httpx.ProxyError):
+                self._fail(proxy, None, True)
+                raise
+            if response.status_code != 429:
+                proxy.failures = 0
+                return response
+            self._fail(proxy, response.headers.get('retry-after'), True)
+            if not self.healthy():
+                break
+            await response.aclose()
+        return response
+
+    def close(self) -> None:
+        self._closed.set()
+        for proxy in self._proxies:
+            if proxy.transport is not None:
+                proxy.transport.close()
+                proxy.transport = None
+
+    async def aclose(self) -> None:
+        self._closed.set()
+        for task in self._tasks:
+            task.cancel()
+        for proxy in self._proxies:
+            if proxy.async_transport is not None:
+                await proxy.async_transport.aclose()
+                proxy.async_transport = None
+
+    def _select(self, request: httpx.Request) -> _Proxy:
+        session = _session(request)
+        with self._lock:
+            proxy = self._sessions.get(session) if session is not None else None
+            if proxy is None or not proxy.healthy:
+                proxy = self._round_robin()
+                if session is not None:
+                    self._sessions[session] = proxy
+            proxy.requests += 1
+            return proxy
+
+    def _round_robin(self) -> _Proxy:
+        count = len(self._proxies)
+        for i in range(count):
+            proxy = self._proxies[(self._next + i) % count]
+            if proxy.healthy:
+                self._next = (self._next + i + 1) % count
+                return proxy
+        logging.warning('Нет работающих прокси, используется прокси с ближайшей проверкой.')
+        return min(self._proxies, key=lambda p: p.retry_at)
+
+    def _fail(self, proxy: _Proxy, retry_after: Optional[str], is_async: bool) -> None:
+        with self._lock:
+            delay = self._delay(proxy)
+            if retry_after is not None and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            proxy.healthy = False
+            proxy.retry_at = time.monotonic() + delay
+            if proxy.checking or self._closed.is_set():
+                return
+            proxy.checking = True
+
+        logging.warning(f'Прокси {proxy.url} исключён из ротации на {delay:.0f} с.')
+        if is_async:
+            task = asyncio.get_running_loop().create_task(self._check_async(proxy))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        else:
+            threading.Thread(target=self._check, args=(proxy,), daemon=True).start()
+
+    def _delay(self, proxy: _Proxy) -> float:
+        proxy.failures += 1
+        return min(self.cooldown * 2 ** (proxy.failures - 1), self.max_cooldown)
+
+    def _check(self, proxy: _Proxy) -> None:
+        try:
+            while not self._closed.wait(max(0.0, proxy.retry_at - time.monotonic())):
+                try:
+                    response = self._transport(proxy).handle_request(httpx.Request('GET', self.check_url))
+                    response.close()
+                    ok = response.status_code != 429
+                except httpx.HTTPError:
+                    ok = False
+                if self._recover(proxy, ok):
+                    return
+        finally:
+            proxy.checking = False
+
+    async def _check_async(self, proxy: _Proxy) -> None:
+        try:
+            while not self._closed.is_set():
+                await asyncio.sleep(max(0.0, proxy.retry_at - time.monotonic()))
+                try:
+                    response = await self._async_transport(proxy).handle_async_request(
+                        httpx.Request('GET', self.check_url)
+                    )
+                    await response.aclose()
+                    ok = response.status_code != 429
+                except httpx.HTTPError:
+                    ok = False
+                if self._recover(proxy, ok):
+                    return
+        finally:
+            proxy.checking = False
+
+    def _transport(self, proxy: _Proxy) -> httpx.BaseTransport:
+        if proxy.transport is None:
+            proxy.transport = httpx.HTTPTransport(proxy=proxy.url, **self._kwargs)
+            self._closed.clear()  # Пул можно использовать снова после закрытия клиента
+        return proxy.transport
+
+    def _async_transport(self, proxy: _Proxy) -> httpx.AsyncBaseTransport:
+        if proxy.async_transport is None:
+            proxy.async_transport = httpx.AsyncHTTPTransport(proxy=proxy.url, **self._kwargs)
+            self._closed.clear()
+        return proxy.async_transport
+
+    def _recover(self, proxy: _Proxy, ok: bool) -> bool:
+        with self._lock:
+            if ok:
+                proxy.healthy = True
+                proxy.failures = 0
+                logging.info(f'Прокси {proxy.url} снова в ротации.')
+                return True
+            proxy.retry_at = time.monotonic() + self._delay(proxy)
+            return False
+
+
+def _session(request: httpx.Request) -> Optional[str]:
+    header = request.headers.get('cookie')
+    if not header:
+        return None
+    morsel = SimpleCookie(header).get('sid')
+    return morsel.value if morsel is not None and morsel.value else None
@@ -0,0 +1,220 @@
+import re
+import time
+import asyncio
+import logging
+from collections import deque, namedtuple
+from collections.abc import AsyncIterator, Iterator, Sequence
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Optional
+
+from ._dataclasses import HistoryItem
+
+if TYPE_CHECKING:
+    from ._client import WebClient
+
+
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+SITE_TIMEZONE = timezone(timedelta(hours=3))
+"""Часовой пояс, в котором сайт показывает время (Москва)."""
+
+TapeEntry = namedtuple('TapeEntry', ['timestamp', 'item'])
+
+_MONTHS = {
+    'января': 1, 'февраля': 2, 'марта': 3, 'апреля': 4, 'мая': 5, 'июня': 6,
+    'июля': 7, 'августа': 8, 'сентября': 9, 'октября': 10, 'ноября': 11, 'декабря': 12
+}
+_RELATIVE_DATE = re.compile(r'(Сегодня|Вчера) в (\d{1,2}):(\d{2})')
+_MONTH_DATE = re.compile(r'(\d{1,2}) ([а-я]+)(?: (\d{4}))?(?: в)? (\d{1,2}):(\d{2})')
+_NUMERIC_DATE = re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{2,4})(?: в)? (\d{1,2}):(\d{2})')
+
+
+def parse_history_date(text: str, now: Optional[datetime] = None) -> int:
+    """Преобразовать время из истории продаж в timestamp.
+
+    Поддерживаются форматы "Сегодня в 20:39", "Вчера в 20:39", "5 мая в 20:39", "5 мая 2024 в 20:39"
+    и "05.05.2024 20:39".
+
+    Args:
+        text (:obj:`str`): Отформатированная строка времени.
+        now (:class:`datetime.datetime`, optional): Текущее время. Нужно для относительных дат.
+
+    Returns:
+        :obj:`int`: Timestamp.
+
+    Raises:
+        ValueError: Неизвестный формат времени.
+    """
+
+    if now is None:
+        now = datetime.now(SITE_TIMEZONE)
+    else:
+        now = now.astimezone(SITE_TIMEZONE)
+    text = text.strip()
+
+    if match := _RELATIVE_DATE.fullmatch(text):
+        day, hour, minute = match.groups()
+        date = now.replace(hour=int(hour), minute=int(minute), second=0, microsecond=0)
+        if day == 'Вчера':
+            date -= timedelta(days=1)
+        elif date > now + timedelta(minutes=1):  # Страница загружена до полуночи, а разобрана после
+            date -= timedelta(days=1)
+    elif (match := _MONTH_DATE.fullmatch(text)) and match.group(2) in _MONTHS:
+        day, month, year, hour, minute = match.groups()
+        date = datetime(
+            int(year) if year else now.year, _MONTHS[month], int(day), int(hour), int(minute), tzinfo=SITE_TIMEZONE
+        )
+        if not year and date > now + timedelta(days=1):  # Дата прошлого года
+            date = date.replace(year=date.year - 1)
+    elif match := _NUMERIC_DATE.fullmatch(text):
+        day, month, year, hour, minute = match.groups()
+        year = int(year) if len(year) == 4 else 2000 + int(year)
+        date = datetime(year, int(month), int(day), int(hour), int(minute), tzinfo=SITE_TIMEZONE)
+    else:
+        raise ValueError(f'Неизвестный формат времени :: {text}')
+
+    return int(date.timestamp())
+
+
+class HistoryTape:
+    """Класс, представляющий ленту новых продаж игры.
+
+    Лента периодически запрашивает последние покупки и возвращает только новые продажи.
+    Если новых продаж нет, интервал опроса увеличивается, если есть - уменьшается.
+    Уже виденные продажи хранятся в кольцевом буфере ограниченного размера, поэтому память не растёт.
+
+    Продажи различаются по названию, времени (timestamp) и цене. Так как сайт показывает время с точностью до минуты,
+    одинаковые продажи одного предмета в одну минуту по одной цене считаются одной продажей, если
+    попали на разные страницы.
+
+    Args:
+        client (:class:`steam_trader.web.WebClient`): Веб клиент.
+        gameid (:obj:`int`): AppID игры.
+        min_interval (:obj:`float`): Минимальный интервал опроса в секундах. По умолчанию 5.
+        max_interval (:obj:`float`): Максимальный интервал опроса в секундах. По умолчанию 60.
+        memory (:obj:`int`): Количество запоминаемых продаж. По умолчанию 1024.
+
+    Attributes:
+        client (:class:`steam_trader.web.WebClient`): Веб клиент.
+        gameid (:obj:`int`): AppID игры.
+        min_interval (:obj:`float`): Минимальный интервал опроса в секундах.
+        max_interval (:obj:`float`): Максимальный интервал опроса в секундах.
+        interval (:obj:`float`): Текущий интервал опроса в секундах.
+    """
+
+    __slots__ = [
+        'client',
+        'gameid',
+        'min_interval',
+        'max_interval',
+        'interval',
+        '_seen',
+        '_ring'
+    ]
+
+    def __init__(
+            self,
+            client: 'WebClient',
+            gameid: int,
+            *,
+            min_interval: float = 5,
+            max_interval: float = 60,
+            memory: int = 1024
+    ) -> None:
+        self.client = client
+        self.gameid = gameid
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self._seen: set[tuple[str, int | str, float]] = set()
+        self._ring: deque[tuple[str, int | str, float]] = deque(maxlen=memory)
+
+    def poll(self) -> list[TapeEntry]:
+        """Запросить последние покупки один раз.
+
+        Returns:
+            list[:NamedTuple:`TapeEntry(timestamp: int, item: HistoryItem)`]: Новые продажи от старых к новым.
+        """
+
+        return self._process(self.client.get_history_page(self.gameid, 'last'))
+
+    def follow(self) -> Iterator[TapeEntry]:
+        """Бесконечно следить за новыми продажами.
+
+        Yields:
+            :NamedTuple:`TapeEntry(timestamp: int, item: HistoryItem)`: Новые продажи от старых к новым.
+        """
+
+        while True:
+            yield from self.poll()
+            time.sleep(self.interval)
+
+    def _process(self, items: Sequence['HistoryItem']) -> list[TapeEntry]:
+        now = datetime.now(SITE_TIMEZONE)
+        new = []
+        for item in items:  # Страница отсортирована от новых продаж к старым
+            try:
+                timestamp = parse_history_date(item.date, now)
+            except ValueError:
+                logging.warning(f'Не удалось разобрать время продажи :: {item.date}')
+                timestamp = None
+            # Ключ строится по timestamp, а не по строке: в полночь "Сегодня в ..." превращается в "Вчера в ..."
+            key = (item.name, item.date if timestamp is None else timestamp, item.price)
+            if key in self._seen:
+                break
+            new.append((key, timestamp, item))
+
+        if new and len(new) == len(items) and self._ring:
+            logging.warning('Все продажи на странице новые, часть продаж могла быть пропущена.')
+            self.interval = self.min_interval
+        elif new:
+            self.interval = max(self.min_interval, self.interval / 2)
+        else:
+            self.interval = min(self.max_interval, self.interval * 1.5)
+
+        entries = []
+        for key, timestamp, item in reversed(new):
+            self._remember(key)
+            entries.append(TapeEntry(int(now.timestamp()) if timestamp is None else timestamp, item))
+        return entries
+
+    def _remember(self, key: tuple[str, int | str, float]) -> None:
+        if len(self._ring) == self._ring.maxlen:
+            self._seen.discard(self._ring[0])
+        self._ring.append(key)
+        self._seen.add(key)
+
+
+class HistoryTapeAsync(HistoryTape):
+    """Класс, представляющий асинхронную ленту новых продаж игры.
+
+    Args:
+        client (:class:`steam_trader.web.WebClientAsync`): Веб клиент.
+        gameid (:obj:`int`): AppID игры.
+        min_interval (:obj:`float`): Минимальный интервал опроса в секундах. По умолчанию 5.
+        max_interval (:obj:`float`): Максимальный интервал опроса в секундах. По умолчанию 60.
+        memory (:obj:`int`): Количество запоминаемых продаж. По умолчанию 1024.
+    """
+
+    __slots__ = []
+
+    async def poll(self) -> list[TapeEntry]:
+        """Запросить последние покупки один раз.
+
+        Returns:
+            list[:NamedTuple:`TapeEntry(timestamp: int, item: HistoryItem)`]: Новые продажи от старых к новым.
+        """
+
+        return self._process(await self.client.get_history_page(self.gameid, 'last'))
+
+    async def follow(self) -> AsyncIterator[TapeEntry]:
+        """Бесконечно следить за новыми продажами.
+
+        Yields:
+            :NamedTuple:`TapeEntry(timestamp: int, item: HistoryItem)`: Новые продажи от старых к новым.
+        """
+
+        while True:
+            for entry in await self.poll():
+                yield entry
+            await asyncio.sleep(self.interval)
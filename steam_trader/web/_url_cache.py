@@ -0,0 +1,117 @@
+import os
+import json
+import threading
+from typing import TYPE_CHECKING, Optional, Union
+
+if TYPE_CHECKING:
+    import httpx
+
+
+def is_stale(response: 'httpx.Response') -> bool:
+    """Проверить, устарела ли сохранённая ссылка на страницу предмета.
+
+    Ссылка устарела, если страница не найдена или сайт перенаправляет на другую страницу,
+    например после переименования предмета. Остальные ответы, в том числе 429 и 5xx, не означают,
+    что ссылка устарела.
+
+    Args:
+        response (:class:`httpx.Response`): Ответ на запрос по сохранённой ссылке.
+
+    Returns:
+        :obj:`bool`: Истина, если ссылку нужно получить заново.
+    """
+
+    if response.status_code == 404:
+        return True
+    if response.is_redirect:
+        return response.url.join(response.headers.get('location', '')).path != response.url.path
+    return False
+
+
+class ItemUrlCache:
+    """Класс, представляющий кэш ссылок на страницы предметов.
+
+    Сайт открывает страницу предмета только по ссылке вида ``tf2/{gid}-{название}``, поэтому без кэша
+    каждый запрос информации о предмете начинается с перенаправления. Один кэш можно передать нескольким
+    веб клиентам, в том числе синхронному и асинхронному одновременно.
+
+    Если указан путь, кэш сохраняется в файл. Файл только дописывается, поэтому запись новой ссылки
+    не требует перезаписи всего кэша.
+
+    Args:
+        path (Union[:obj:`str`, :obj:`os.PathLike`], optional): Путь к файлу кэша. По умолчанию кэш хранится в памяти.
+
+    Attributes:
+        path (Union[:obj:`str`, :obj:`os.PathLike`], optional): Путь к файлу кэша.
+    """
+
+    __slots__ = [
+        'path',
+        '_urls',
+        '_lock'
+    ]
+
+    def __init__(self, path: Union[str, os.PathLike, None] = None) -> None:
+        self.path = path
+        self._urls: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+        if path is not None and os.path.exists(path):
+            with open(path, encoding='utf-8') as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    gid, url = json.loads(line)
+                    if url is None:
+                        self._urls.pop(gid, None)
+                    else:
+                        self._urls[gid] = url
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def __contains__(self, gid: int) -> bool:
+        return gid in self._urls
+
+    def get(self, gid: int) -> Optional[str]:
+        """Получить ссылку на страницу предмета.
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+
+        Returns:
+            :obj:`str`, optional: Ссылка. None, если её нет в кэше.
+        """
+
+        return self._urls.get(gid)
+
+    def set(self, gid: int, url: str) -> None:
+        """Сохранить ссылку на страницу предмета.
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+            url (:obj:`str`): Ссылка.
+        """
+
+        with self._lock:
+            if self._urls.get(gid) == url:
+                return
+            self._urls[gid] = url
+            self._append(gid, url)
+
+    def invalidate(self, gid: int) -> None:
+        """Удалить устаревшую ссылку на страницу предмета.
+
+        Args:
+            gid (:obj:`int`): ID группы предметов.
+        """
+
+        with self._lock:
+            if self._urls.pop(gid, None) is not None:
+                self._append(gid, None)
+
+    def _append(self, gid: int, url: Optional[str]) -> None:
+        if self.path is None:
+            return
+        with open(self.path, 'a', encoding='utf-8') as file:
+            file.write(json.dumps([gid, url]) + '\n')
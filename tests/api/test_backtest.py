@@ -0,0 +1,65 @@
+import unittest
+from steam_trader.api import OrderBook, SellHistoryItem
+from steam_trader.api.ext import Backtest, BacktestClient, MarketReplay, Repricer, UndercutStrategy
+from steam_trader.exceptions import NoLongerExists
+
+
+def make_replay():
+    replay = MarketReplay()
+    replay.add_order_book(
+        1226, 0, OrderBook(success=True, sell=[[10.0, 2], [11.0, 1]], buy=[[8.0, 1]], total_sell=3, total_buy=1)
+    )
+    replay.add_sales(1226, [SellHistoryItem(date=300, price=9.5), SellHistoryItem(date=120, price=9.99)])
+    return replay
+
+
+class IndependentTests(unittest.TestCase):
+
+    def test_repricer(self):
+
+        def bot(client):
+            for item in client.get_inventory(440).items:
+                client.sell(item.itemid, item.assetid, 12.0)
+            Repricer(client, UndercutStrategy()).reprice(440)
+
+        report = Backtest(make_replay(), bot, interval=60, inventory={1226: 1}, commission=0.05).run()
+        self.assertEqual(report.steps, 6)
+        self.assertEqual([(t.timestamp, t.side, t.price) for t in report.trades], [(120, 'sell', 9.49)])
+        self.assertEqual(report.balance, 9.49)
+        self.assertEqual(report.pnl, round(9.49 - 8.0 * 0.95, 2))
+
+    def test_buy_order(self):
+        orders = []
+
+        def bot(client):
+            if not orders:
+                orders.append(client.create_buy_order(1226, 9.6))
+
+        backtest = Backtest(make_replay(), bot, interval=100, balance=20)
+        report = backtest.run()
+        self.assertEqual(orders[0].placed, 1)
+        self.assertEqual([(t.timestamp, t.side) for t in report.trades], [(300, 'buy')])
+        self.assertEqual(report.balance, 10.4)
+        self.assertEqual(len(backtest.client.get_inventory(440).items), 1)
+
+    def test_buy_consumes_book(self):
+        client = BacktestClient(make_replay(), balance=100)
+        self.assertEqual(client.buy(1226, 1, 10.0).new_price, 10.0)
+        self.assertEqual(client.buy(1226, 1, 10.0).new_price, 11.0)
+        with self.assertRaises(NoLongerExists):
+            client.buy(1226, 1, 10.0)  # Уровень 10.0 израсходован на этом шаге
+        self.assertEqual(client.get_order_book(1226).sell, [[11.0, 1]])
+        client.buy(1226, 1, 11.0)
+        self.assertEqual(client.balance, 69.0)
+
+        client.advance(60)  # Новый шаг, записанный стакан снова доступен
+        client.buy(1226, 1, 10.0)
+
+        with self.assertRaises(ValueError):
+            client.buy('nc-link', 2, 10.0)
+        with self.assertRaises(ValueError):
+            client.buy(1, 3, 10.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
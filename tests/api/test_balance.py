@@ -0,0 +1,77 @@
+import json
+import unittest
+import httpx
+from steam_trader.api import Client, ClientAsync, BalanceCache
+from steam_trader.exceptions import NotEnoughMoney
+
+RESPONSES = {
+    '/getbalance/': {'success': True, 'balance': 100.0},
+    '/buy/': {'success': True, 'id': 1, 'gid': 1226, 'itemid': 2, 'price': 10.5, 'new_price': 11.0, 'discount': 0},
+    '/multibuy/': {'success': True, 'balance': 70.0, 'spent': 20.0, 'orders': []},
+    '/sale/': {'success': True, 'id': 3, 'position': 0, 'fast_execute': True, 'nc': '', 'price': 5.0},
+    '/createbuyorder/': {'success': False, 'code': 5, 'error': 'Недостаточно средств.', 'orders': []}
+}
+
+
+class Transport:
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request.url.path)
+        return httpx.Response(200, content=json.dumps(RESPONSES[request.url.path]))
+
+
+class IndependentTests(unittest.TestCase):
+
+    def test_ttl(self):
+        cache = BalanceCache(60)
+        self.assertIsNone(cache.get())
+        cache.set(10.0)
+        cache.add(-2.5)
+        self.assertEqual(cache.get(), 7.5)
+        cache.invalidate()
+        self.assertIsNone(cache.get())
+        with self.assertRaises(ValueError):
+            BalanceCache(0)
+
+    def test_local_updates(self):
+        transport = Transport()
+        with Client('', balance_ttl=60, transport=httpx.MockTransport(transport)) as client:
+            self.assertEqual(client.balance, 100.0)
+            client.buy(1226, 1, 10.5)
+            self.assertEqual(client.balance, 89.5)
+            client.sell(3, 4, 5.0)
+            self.assertEqual(client.balance, 94.5)
+            client.multi_buy(1226, 10.0, 2)
+            self.assertEqual(client.balance, 70.0)
+            self.assertEqual(transport.requests.count('/getbalance/'), 1)
+
+            with self.assertRaises(NotEnoughMoney):
+                client.create_buy_order(1226, 500.0)
+            self.assertEqual(client.balance, 100.0)
+            self.assertEqual(transport.requests.count('/getbalance/'), 2)
+
+    def test_disabled(self):
+        transport = Transport()
+        with Client('', transport=httpx.MockTransport(transport)) as client:
+            self.assertIsNone(client.balance_cache)
+            _ = client.balance
+            _ = client.balance
+        self.assertEqual(transport.requests.count('/getbalance/'), 2)
+
+
+class AsyncTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_local_updates(self):
+        transport = Transport()
+        async with ClientAsync('', balance_ttl=60, transport=httpx.MockTransport(transport)) as client:
+            self.assertEqual(await client.balance, 100.0)
+            await client.buy(1226, 1, 10.5)
+            self.assertEqual(await client.balance, 89.5)
+        self.assertEqual(transport.requests.count('/getbalance/'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import copy
+import unittest
+import httpx
+from steam_trader.api import Client, CompactInventory, Inventory, Filters, Filter
+from steam_trader.api.ext import ExtClient, ExtClientAsync
+from steam_trader.constants import TF2_QUALITY_STRANGE, TF2_QUALITY_UNIQUE
+
+
+def item(itemid, price, status, _type=0, gid=2435):
+    return {
+        'id': itemid * 10, 'assetid': '3227691166', 'gid': gid, 'itemid': itemid, 'price': price, 'currency': 1,
+        'timer': None, 'type': _type, 'status': status, 'position': None, 'nc': None, 'percent': 5,
+        'steam_item': True, 'nm': False
+    }
+
+
+RESPONSE = {
+    'success': True,
+    'count': 4,
+    'game': 440,
+    'last_update': 1682937514,
+    'items': [item(1, 1.5, 0), item(2, None, -2, None), item(3, 10, 0, 1, gid=1226), item(4, 3.25, 0)]
+}
+
+QUALITY = {2435: TF2_QUALITY_UNIQUE, 1226: TF2_QUALITY_STRANGE}
+
+
+def handler(request):
+    if request.url.path.endswith('/iteminfo/'):
+        quality = QUALITY[int(request.url.params['gid'])]
+        return httpx.Response(200, json={
+            'success': True, 'name': '', 'hash_name': '', 'type': '', 'gameid': 440, 'contextid': 2, 'color': '',
+            'small_image': '', 'large_image': '', 'marketable': True, 'tradable': True, 'description': '',
+            'market_price': None, 'buy_price': None, 'steam_price': None,
+            'filters': {'quality': [{'id': quality, 'title': '', 'color': None}], 'type': [], 'class': [], 'craft': []},
+            'sell_offers': [], 'buy_offers': [], 'sell_history': []
+        })
+    return httpx.Response(200, json=copy.deepcopy(RESPONSE))
+
+
+STRANGE = Filters(quality=[Filter(id=TF2_QUALITY_STRANGE)])
+
+
+class IndependentTests(unittest.TestCase):
+
+    def test_rows_match_items(self):
+        compact = CompactInventory.de_json(copy.deepcopy(RESPONSE))
+        full = Inventory.de_json(copy.deepcopy(RESPONSE))
+        self.assertEqual((compact.count, compact.gameid, compact.last_update), (4, 440, 1682937514))
+        self.assertEqual(len(compact.items), 4)
+        for row, full_item in zip(compact.items, full.items):
+            self.assertEqual(row, full_item)
+        self.assertIsNone(compact[1].price)
+        self.assertIsNone(compact[1].type)
+        self.assertEqual(compact[-1].price, 3.25)
+        self.assertEqual(compact[0].to_item().itemid, 1)
+
+    def test_filters(self):
+        compact = CompactInventory.de_json(copy.deepcopy(RESPONSE))
+        self.assertEqual([r.itemid for r in compact.filter(status=[0], type=0)], [1, 4])
+        self.assertEqual([r.itemid for r in compact.filter(min_price=2)], [3, 4])
+        self.assertEqual([r.itemid for r in compact.filter(max_price=5, gid=2435)], [1, 4])
+        self.assertEqual(compact.mask(status=[-2]), [False, True, False, False])
+        self.assertEqual(list(compact.column('gid')), [2435, 2435, 1226, 2435])
+
+    def test_status_and_client(self):
+        with Client('', transport=httpx.MockTransport(handler)) as client:
+            inventory = client.get_inventory(440, status=[0], compact=True)
+        self.assertIsInstance(inventory, CompactInventory)
+        self.assertEqual([r.itemid for r in inventory], [1, 3, 4])
+        self.assertEqual(inventory[0].assetid, '3227691166')
+
+    def test_ext_client(self):
+        with ExtClient('', transport=httpx.MockTransport(handler)) as client:
+            inventory = client.get_inventory(440, filters=STRANGE, status=[0], compact=True)
+        self.assertIsInstance(inventory, CompactInventory)
+        self.assertEqual([r.itemid for r in inventory], [3])
+
+
+class AsyncTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_ext_client(self):
+        async with ExtClientAsync('', transport=httpx.MockTransport(handler)) as client:
+            inventory = await client.get_inventory(440, filters=STRANGE, compact=True)
+            full = await client.get_inventory(440, filters=STRANGE)
+        self.assertIsInstance(inventory, CompactInventory)
+        self.assertEqual([r.itemid for r in inventory], [3])
+        self.assertEqual([item.itemid for item in full.items], [3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,7 @@
 import os
+import copy
+import pickle
+import dataclasses
 import unittest
 import steam_trader.api as steam_trader
 
@@ -8,9 +11,27 @@ class IndependentTests(unittest.TestCase):
     def setUp(self):
         self.client = steam_trader.Client(os.getenv('TOKEN'))
 
-    def assertion(self, test_response, result):
+    def assertion(self, test_response, result, renames=None, ignore=()):
+        renames = renames or {}
         for name, value in test_response.items():
-            self.assertEqual(value, result.__getattribute__(name))
+            if name not in ignore:
+                self.assert_value(value, result.__getattribute__(renames.get(name, name)), renames, ignore)
+
+    def assert_value(self, value, result, renames, ignore):
+        if dataclasses.is_dataclass(result) and isinstance(value, dict):
+            self.assertion(value, result, renames, ignore)
+        elif dataclasses.is_dataclass(result) and isinstance(value, list):
+            self.assertEqual(tuple(value), dataclasses.astuple(result))
+        elif isinstance(value, list) and isinstance(result, list):
+            self.assertEqual(len(value), len(result))
+            for v, r in zip(value, result):
+                self.assert_value(v, r, renames, ignore)
+        elif isinstance(value, dict) and isinstance(result, dict):
+            self.assertEqual(len(value), len(result))
+            for k, v in value.items():
+                self.assert_value(v, result[k if k in result else int(k)], renames, ignore)
+        else:
+            self.assertEqual(value, result)
 
     def test_sell_result(self):
         test_response1 = {
@@ -73,7 +94,7 @@ class IndependentTests(unittest.TestCase):
             "placed": 2
         }
         result = steam_trader.BuyOrderResult.de_json(test_response, client=self.client)
-        self.assertion(test_response, result)
+        self.assertion(test_response, result, ignore=('orders',))
 
     def test_multi_buy_result(self):
         test_response = {
@@ -211,7 +232,9 @@ class IndependentTests(unittest.TestCase):
             ]
         }
         result = steam_trader.ExchangeResult.de_json(test_response, client=self.client)
-        self.assertion(test_response, result)
+        self.assertion(
+            test_response, result, {'offerId': 'offer_id', 'botSteamId': 'bot_steamid', 'botNick': 'bot_nick'}
+        )
 
     def test_exchange_p2p_result(self):
         test_response = {
@@ -267,7 +290,12 @@ class IndependentTests(unittest.TestCase):
             ]
         }
         result = steam_trader.ExchangeP2PResult.de_json(test_response, client=self.client)
-        self.assertion(test_response, result)
+        self.assertion(test_response, result, {
+            'tradeLink': 'trade_link',
+            'tradeOffer': 'trade_offer',
+            'offerId': 'offerid',
+            'partnerSteamId': 'partner_steamid'
+        })
 
     def test_min_prices(self):
         test_response = {
@@ -368,7 +396,7 @@ class IndependentTests(unittest.TestCase):
             ]
         }
         result = steam_trader.ItemInfo.de_json(test_response, client=self.client)
-        self.assertion(test_response, result)
+        self.assertion(test_response, result, {'class': 'used_by'})
 
     def test_order_book(self):
         test_response = {
@@ -424,7 +452,7 @@ class IndependentTests(unittest.TestCase):
             ]
         }
         result = steam_trader.Inventory.de_json(test_response, client=self.client)
-        self.assertion(test_response, result)
+        self.assertion(test_response, result, {'game': 'gameid'})
 
     def test_buy_orders(self):
         test_response = {
@@ -521,7 +549,10 @@ class IndependentTests(unittest.TestCase):
             "itemsInCache": 9
         }
         result = steam_trader.InventoryState.de_json(test_response, client=self.client)
-        self.assertion(test_response, result)
+        self.assertion(
+            test_response, result,
+            {'updatingNow': 'updating_now', 'lastUpdate': 'last_update', 'itemsInCache': 'items_in_cache'}
+        )
 
     def test_alt_ws(self):
         test_response = {
@@ -536,5 +567,48 @@ class IndependentTests(unittest.TestCase):
         result = steam_trader.AltWebSocket.de_json(test_response, client=self.client)
         self.assertion(test_response, result)
 
+    def test_no_mutation(self):
+        test_response = {
+            "success": True,
+            "count": 1,
+            "game": 440,
+            "last_update": 1509898188,
+            "items": [
+                {
+                    "id": 1,
+                    "assetid": None,
+                    "gid": 1226,
+                    "itemid": 2,
+                    "price": 3.3,
+                    "currency": 1,
+                    "timer": None,
+                    "type": 0,
+                    "status": 0,
+                    "position": 1,
+                    "nc": None,
+                    "percent": None,
+                    "steam_item": True,
+                    "nm": False
+                }
+            ]
+        }
+        expected = copy.deepcopy(test_response)
+        result1 = steam_trader.Inventory.de_json(test_response, client=self.client)
+        result2 = steam_trader.Inventory.de_json(test_response, client=self.client)
+        self.assertEqual(expected, test_response)
+        self.assertEqual(result1, result2)
+
+    def test_pickle(self):
+        test_response = {
+            "success": True,
+            "sell": [[0.5, 1], [0.61, 3]],
+            "buy": [[0.4, 2]],
+            "total_sell": 4,
+            "total_buy": 2
+        }
+        result = steam_trader.OrderBook.de_json(test_response, client=self.client)
+        self.assertFalse(hasattr(result, 'client'))
+        self.assertEqual(pickle.loads(pickle.dumps(result)), result)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,104 @@
+import math
+import asyncio
+import unittest
+from array import array
+import httpx
+from steam_trader.api import Client, ClientAsync, Discounts, Discount, Inventory, InventoryItem, CompactInventory, OrderBook
+from steam_trader.api.ext import FeeModel, Fees
+from steam_trader.exceptions import UnsupportedAppID
+
+DISCOUNTS = Discounts(success=True, data={
+    440: Discount(total_buy=0, total_sell=0, discount=5, commission=10),
+    730: Discount(total_buy=0, total_sell=0, discount=0, commission=20)
+})
+
+RESPONSE = {
+    'success': True,
+    'data': {
+        '440': {'total_buy': 0, 'total_sell': 0, 'discount': 5, 'commission': 10},
+        '730': {'total_buy': 0, 'total_sell': 0, 'discount': 0, 'commission': 20}
+    }
+}
+
+
+class Transport:
+
+    def __init__(self):
+        self.requests = 0
+
+    def __call__(self, request):
+        self.requests += 1
+        return httpx.Response(200, json=RESPONSE)
+
+
+def item(itemid, price):
+    return InventoryItem(
+        id=itemid, assetid=None, gid=1226, itemid=itemid, price=price, currency=1, timer=None, type=0, status=0,
+        position=None, nc=None, percent=None, steam_item=True, nm=False
+    )
+
+
+class IndependentTests(unittest.TestCase):
+
+    def test_calculations(self):
+        model = FeeModel(discounts=DISCOUNTS)
+        self.assertEqual(model.fees(440), Fees(0.1, 0.05))
+        self.assertEqual(list(model.net_proceeds(440, [10.0, 20.0])), [9.0, 18.0])
+        self.assertEqual(list(model.purchase_cost(440, [10.0])), [9.5])
+        self.assertAlmostEqual(model.break_even(730, [8.0])[0], 10.0)
+        self.assertIsInstance(model.net_proceeds(440, array('d', [1.0])), array)
+        with self.assertRaises(UnsupportedAppID):
+            model.fees(570)
+
+    def test_inventory_and_order_book(self):
+        model = FeeModel(discounts=DISCOUNTS)
+        items = [item(1, 10.0), item(2, None)]
+        inventory = Inventory(success=True, count=2, gameid=440, last_update=0, items=items)
+        proceeds = model.inventory_proceeds(inventory)
+        self.assertEqual(proceeds[0], 9.0)
+        self.assertTrue(math.isnan(proceeds[1]))
+        compact = CompactInventory.from_items(items, gameid=440)
+        self.assertEqual(model.inventory_proceeds(compact)[0], 9.0)
+
+        book = OrderBook(success=True, sell=[[10.0, 1], [12.0, 2]], buy=[[8.0, 3]], total_sell=3, total_buy=3)
+        costs, proceeds = model.order_book(440, book)
+        self.assertEqual(costs[0], 9.5)
+        self.assertAlmostEqual(costs[1], 11.4)
+        self.assertEqual(list(proceeds), [7.2])
+
+    def test_refresh(self):
+        transport = Transport()
+        with Client('', transport=httpx.MockTransport(transport)) as client:
+            model = FeeModel(client, ttl=60)
+            self.assertTrue(model.stale)
+            self.assertEqual(model.fees(440), Fees(0.1, 0.05))
+            model.fees(730)
+            self.assertEqual(transport.requests, 1)
+            model.ttl = 0
+            model.fees(440)
+            self.assertEqual(transport.requests, 2)
+
+
+class AsyncTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_run(self):
+        transport = Transport()
+        async with ClientAsync('', transport=httpx.MockTransport(transport)) as client:
+            model = FeeModel(client, ttl=0.01)
+            task = asyncio.create_task(model.run())
+            await asyncio.sleep(0.05)
+            task.cancel()
+        self.assertGreater(transport.requests, 1)
+        self.assertEqual(model.fees(440).commission, 0.1)
+
+    async def test_not_loaded(self):
+        async with ClientAsync('', transport=httpx.MockTransport(Transport())) as client:
+            model = FeeModel(client)
+            with self.assertRaises(RuntimeError):
+                model.fees(440)
+            await model.refresh_async()
+        self.assertEqual(model.fees(440).discount, 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
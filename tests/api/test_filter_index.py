@@ -0,0 +1,69 @@
+import unittest
+from steam_trader.api import Filters, Filter, FilterEncoder, FilterIndex
+from steam_trader.constants import *
+from steam_trader.exceptions import UnsupportedAppID
+
+
+class IndependentTests(unittest.TestCase):
+
+    def setUp(self):
+        self.encoder = FilterEncoder(TEAM_FORTRESS2_APPID)
+        self.strange_soldier_cosmetic = Filters(
+            quality=[Filter(id=TF2_QUALITY_STRANGE), Filter(id=TF2_QUALITY_UNIQUE)],
+            type=[Filter(id=TF2_TYPE_COSMETIC)],
+            used_by=[Filter(id=TF2_CLASS_SOLDIER)],
+            craft=[Filter(id=TF2_CRAFTABLE)]
+        )
+        self.unique_scout_primary = Filters(
+            quality=[Filter(id=TF2_QUALITY_UNIQUE)],
+            type=[Filter(id=TF2_TYPE_PRIMARY)],
+            used_by=[Filter(id=TF2_CLASS_SCOUT)],
+            craft=[Filter(id=TF2_CRAFTABLE)]
+        )
+
+    def test_encode_decode(self):
+        mask = self.encoder.encode(self.strange_soldier_cosmetic)
+        self.assertEqual(mask.bit_count(), 5)
+        self.assertEqual(self.encoder.encode(self.encoder.decode(mask)), mask)
+
+    def test_matches(self):
+        mask = self.encoder.encode(self.strange_soldier_cosmetic)
+        query = self.encoder.encode_query({'quality': [TF2_QUALITY_STRANGE], 'used_by': [TF2_CLASS_SOLDIER, TF2_CLASS_SPY]})
+        self.assertTrue(self.encoder.matches(mask, query))
+        query = self.encoder.encode_query({'quality': [TF2_QUALITY_STRANGE], 'used_by': [TF2_CLASS_SPY]})
+        self.assertFalse(self.encoder.matches(mask, query))
+        self.assertTrue(self.encoder.matches(mask, self.encoder.encode_query(None)))
+
+    def test_unknown_filter(self):
+        size = len(self.encoder)
+        bit = self.encoder.bit('hero', 99999)
+        self.assertEqual(bit, size)
+        self.assertEqual(self.encoder.bit('hero', 99999), bit)
+        self.assertEqual(self.encoder.category_mask('hero'), 1 << bit)
+
+    def test_unsupported_appid(self):
+        with self.assertRaises(UnsupportedAppID):
+            FilterEncoder(CSGO_APPID)
+
+    def test_index(self):
+        index = FilterIndex(self.encoder)
+        index.add(1, self.strange_soldier_cosmetic)
+        index.add(2, self.unique_scout_primary)
+        index.add(3, {'quality': [TF2_QUALITY_STRANGE], 'type': [TF2_TYPE_COSMETIC], 'used_by': [TF2_CLASS_SPY]})
+
+        query = {'quality': [TF2_QUALITY_STRANGE], 'type': [TF2_TYPE_COSMETIC], 'used_by': [TF2_CLASS_SOLDIER]}
+        self.assertEqual(index.select(query), {1})
+        self.assertEqual(index.select({'quality': [TF2_QUALITY_UNIQUE]}), {1, 2})
+        self.assertEqual(index.select(None), {1, 2, 3})
+        self.assertEqual(index.gids_with('craft', TF2_CRAFTABLE), {1, 2})
+
+        index.add(1, self.unique_scout_primary)
+        self.assertEqual(index.select(query), set())
+        self.assertEqual(index.mask_of(1), index.mask_of(2))
+
+        index.remove(2)
+        self.assertNotIn(2, index)
+        self.assertEqual(index.select({'used_by': [TF2_CLASS_SCOUT]}), {1})
+
+if __name__ == '__main__':
+    unittest.main()
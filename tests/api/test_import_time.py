@@ -0,0 +1,56 @@
+import sys
+import subprocess
+import unittest
+
+HEAVY_MODULES = (
+    'httpx',
+    'bs4',
+    'lxml',
+    'steam_trader.api._client',
+    'steam_trader.api._client_async',
+    'steam_trader.api.ext._client_ext',
+    'steam_trader.web._client'
+)
+"""Модули, которые не должны загружаться при импорте пакетов."""
+
+
+def run(code):
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+
+
+class IndependentTests(unittest.TestCase):
+
+    def test_heavy_modules(self):
+        result = run(
+            'import sys\n'
+            'import steam_trader, steam_trader.api, steam_trader.api.ext, steam_trader.web\n'
+            f'print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))'
+        )
+        self.assertEqual(result.stdout.strip(), '[]')
+
+    def test_lazy_dataclasses(self):
+        result = run(
+            'import sys\n'
+            'from steam_trader.api import MinPrices\n'
+            'from steam_trader.web import ProxyPool\n'
+            'print(sorted(m for m in ("steam_trader.api._client", "bs4", "lxml") if m in sys.modules))'
+        )
+        self.assertEqual(result.stdout.strip(), '[]')
+
+    def test_exports(self):
+        import steam_trader.api
+        import steam_trader.api.ext
+        import steam_trader.web
+
+        for package in (steam_trader.api, steam_trader.api.ext, steam_trader.web):
+            for name in package.__all__:
+                with self.subTest(name=name):
+                    self.assertIn(name, dir(package))
+                    self.assertIsNotNone(getattr(package, name))
+
+        with self.assertRaises(AttributeError):
+            _ = steam_trader.api.Unknown
+
+
+if __name__ == '__main__':
+    unittest.main()
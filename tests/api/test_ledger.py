@@ -0,0 +1,62 @@
+import unittest
+import httpx
+from steam_trader.api import OperationsHistoryItem
+from steam_trader.api.ext import ExtClient, ExtClientAsync, OperationsLedger
+
+PAGE_SIZE = 2
+
+
+def operation(_id, operation_type, amount, date):
+    return {'id': _id, 'name': 'op', 'type': operation_type, 'amount': amount, 'currency': 1, 'date': date}
+
+
+class Transport:
+
+    def __init__(self):
+        self.operations = [operation(3, 2, 30.0, 300), operation(2, 1, -20.0, 200), operation(1, 4, 100.0, 100)]
+        self.pages = 0
+
+    def __call__(self, request):
+        self.pages += 1
+        page = int(request.url.params['page'])
+        data = self.operations[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]
+        return httpx.Response(200, json={'success': True, 'data': data})
+
+
+class IndependentTests(unittest.TestCase):
+
+    def test_sync(self):
+        transport = Transport()
+        with ExtClient('', transport=httpx.MockTransport(transport)) as client, OperationsLedger() as ledger:
+            self.assertEqual(ledger.sync(client), 3)
+            self.assertEqual(ledger.last_id, 3)
+
+            transport.operations.insert(0, operation(4, 1, -5.0, 400))
+            transport.pages = 0
+            self.assertEqual(ledger.sync(client), 1)
+            self.assertEqual(transport.pages, 1)
+            self.assertEqual(len(ledger), 4)
+
+    def test_query(self):
+        with ExtClient('', transport=httpx.MockTransport(Transport())) as client, OperationsLedger() as ledger:
+            ledger.sync(client)
+            self.assertEqual(ledger.add([OperationsHistoryItem(1, 'op', 4, 100.0, 1, 100)]), 0)
+            self.assertEqual([item.id for item in ledger.query()], [3, 2, 1])
+            self.assertEqual([item.id for item in ledger.query(operation_type=[1, 2])], [3, 2])
+            self.assertEqual([item.id for item in ledger.query(since=150, until=300)], [2])
+            self.assertEqual([item.id for item in ledger.query(min_amount=0, limit=1)], [3])
+            self.assertEqual(ledger.total(), 110.0)
+            self.assertEqual(ledger.total(operation_type=1), -20.0)
+
+
+class AsyncTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_sync(self):
+        async with ExtClientAsync('', transport=httpx.MockTransport(Transport())) as client:
+            with OperationsLedger() as ledger:
+                self.assertEqual(await ledger.sync_async(client), 3)
+                self.assertEqual(await ledger.sync_async(client), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
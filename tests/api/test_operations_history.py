@@ -0,0 +1,83 @@
+import asyncio
+import unittest
+import httpx
+from steam_trader.api.ext import ExtClient, ExtClientAsync
+
+PAGE_SIZE = 3
+
+
+def make_history(operation_type, count, start_id, start_date, step):
+    return [
+        {'id': start_id - i, 'name': 'op', 'type': operation_type, 'amount': 1.0, 'currency': 1,
+         'date': start_date - i * step}
+        for i in range(count)
+    ]
+
+
+HISTORY = {
+    1: make_history(1, 7, 100, 1000, 10),
+    2: make_history(2, 5, 50, 995, 20),
+}
+
+
+def get_page(request):
+    operation_type = request.url.params.get('type')
+    page = int(request.url.params['page'])
+    if operation_type is None:
+        items = sorted(HISTORY[1] + HISTORY[2], key=lambda item: item['date'], reverse=True)
+    else:
+        items = HISTORY[int(operation_type)]
+    return httpx.Response(200, json={'success': True, 'data': items[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]})
+
+
+class Transport:
+
+    def __init__(self):
+        self.requested = []
+
+    async def __call__(self, request):
+        self.requested.append(int(request.url.params['page']))
+        await asyncio.sleep(0.001)
+        return get_page(request)
+
+
+class IndependentTests(unittest.TestCase):
+
+    def test_iter(self):
+        with ExtClient('', transport=httpx.MockTransport(get_page)) as client:
+            items = list(client.iter_operations_history(operation_type=1))
+            self.assertEqual([item.id for item in items], list(range(100, 93, -1)))
+            items = list(client.iter_operations_history(operation_type=1, until_id=97))
+            self.assertEqual([item.id for item in items], [100, 99, 98])
+
+    def test_merge(self):
+        with ExtClient('', transport=httpx.MockTransport(get_page)) as client:
+            dates = [item.date for item in client.iter_operations_history(operation_type=[1, 2])]
+        self.assertEqual(len(dates), 12)
+        self.assertEqual(dates, sorted(dates, reverse=True))
+
+
+class AsyncTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_iter(self):
+        async with ExtClientAsync('', transport=httpx.MockTransport(Transport())) as client:
+            items = [item async for item in client.iter_operations_history(operation_type=1, prefetch=2)]
+        self.assertEqual([item.id for item in items], list(range(100, 93, -1)))
+
+    async def test_until_id(self):
+        transport = Transport()
+        async with ExtClientAsync('', transport=httpx.MockTransport(transport)) as client:
+            items = [item async for item in client.iter_operations_history(operation_type=1, prefetch=4, until_id=99)]
+        self.assertEqual([item.id for item in items], [100])
+        self.assertEqual(transport.requested, [0, 1, 2, 3])
+
+    async def test_merge(self):
+        async with ExtClientAsync('', transport=httpx.MockTransport(Transport())) as client:
+            items = [item async for item in client.iter_operations_history(operation_type=[1, 2])]
+        with ExtClient('', transport=httpx.MockTransport(get_page)) as client:
+            expected = list(client.iter_operations_history(operation_type=[1, 2]))
+        self.assertEqual(items, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import asyncio
+import unittest
+from collections import Counter
+import httpx
+from steam_trader.api import ClientPool, ClientAsync
+
+ORDER_BOOK = {'success': True, 'sell': [[1.0, 1]], 'buy': [], 'total_sell': 1, 'total_buy': 0}
+
+
+class AsyncTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_routing(self):
+        seen = Counter()
+
+        def handler(request):
+            seen[request.headers['Api-Key']] += 1
+            if request.url.path.strip('/') == 'getbalance':
+                return httpx.Response(200, json={'success': True, 'balance': 1.0})
+            return httpx.Response(200, json=ORDER_BOOK)
+
+        async with ClientPool(['a', 'b'], rate=100, transport=httpx.MockTransport(handler)) as pool:
+            await asyncio.gather(*(pool.get_order_book(1226) for _ in range(6)))
+            self.assertEqual(seen, {'a': 3, 'b': 3})
+
+            await pool['b'].balance
+            self.assertEqual(seen['b'], 4)
+            self.assertEqual(pool.requests, {'a': 3, 'b': 4})
+            self.assertGreater(pool.throughput(), 7 / pool.window)  # Окно ещё не прошло
+
+    async def test_throughput(self):
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json=ORDER_BOOK))
+        async with ClientPool(['a', 'b'], rate=100, window=0.2, transport=transport) as pool:
+            await asyncio.sleep(0.25)  # Окно прошло, делитель равен window
+            await asyncio.gather(*(pool.get_order_book(1226) for _ in range(4)))
+            self.assertAlmostEqual(pool.throughput(), 4 / pool.window)
+            self.assertAlmostEqual(pool.throughput('a'), 2 / pool.window)
+
+            await asyncio.sleep(0.25)  # Запросы вышли из окна
+            self.assertEqual(pool.throughput(), 0)
+
+    async def test_enter_failure(self):
+
+        class FailingClient(ClientAsync):
+
+            async def __aenter__(self):
+                raise RuntimeError('Не удалось открыть клиент')
+
+        pool = ClientPool(['a', 'b', 'c'])
+        pool.clients['c'] = FailingClient('c')
+        with self.assertRaises(RuntimeError):
+            async with pool:
+                pass
+        self.assertTrue(pool['a']._async_client.is_closed)
+        self.assertTrue(pool['b']._async_client.is_closed)
+
+    def test_no_tokens(self):
+        with self.assertRaises(ValueError):
+            ClientPool([])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import tempfile
+import unittest
+from steam_trader.api import MinPrices
+from steam_trader.api.ext import PriceStore, PriceSample, PRICE_RECORD
+
+
+def min_prices(price):
+    return MinPrices(
+        success=True, market_price=price, buy_price=None, steam_price=price * 2,
+        count_sell_offers=3, count_buy_offers=0
+    )
+
+
+class IndependentTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_range(self):
+        with PriceStore(self.directory.name) as store:
+            for minute in range(10):
+                store.append(1226, min_prices(float(minute)), timestamp=60 * minute)
+            store.append(1227, min_prices(1.0), timestamp=0)
+
+            self.assertEqual(store.gids(), [1226, 1227])
+            self.assertEqual(len(store.samples(1226)), 10)
+            self.assertEqual(
+                store.samples(1226, since=120, until=240),
+                [PriceSample(60 * m, float(m), None, m * 2.0, 3, 0) for m in (2, 3, 4)]
+            )
+            self.assertEqual(store.samples(1226, since=121, until=179), [])
+            self.assertEqual(store.samples(404), [])
+
+            view = store.view(1226, since=540)
+            self.assertEqual(len(view), PRICE_RECORD.size)
+            self.assertEqual(PRICE_RECORD.unpack(view)[0], 540)
+            view.release()
+
+    def test_reopen(self):
+        with PriceStore(self.directory.name) as store:
+            store.append(1226, min_prices(1.0), timestamp=100)
+            self.assertEqual(len(store.samples(1226)), 1)
+
+        with PriceStore(self.directory.name) as store:
+            with self.assertRaises(ValueError):
+                store.append(1226, min_prices(1.0), timestamp=50)
+            store.append(1226, min_prices(2.0), timestamp=200)
+            self.assertEqual([s.market_price for s in store.samples(1226)], [1.0, 2.0])
+
+    def test_bounded_maps(self):
+        with PriceStore(self.directory.name, max_open=4) as store:
+            for gid in range(300):
+                store.append(gid, min_prices(1.0), timestamp=100)
+            self.assertEqual(len(store._maps), 0)  # Запись не открывает отображений
+
+            for gid in range(300):
+                self.assertEqual(len(store.samples(gid)), 1)
+            self.assertEqual(list(store._maps), [296, 297, 298, 299])
+
+            view = store.view(0)  # Вытесненное отображение, на которое есть ссылка, остаётся рабочим
+            for gid in range(1, 10):
+                store.samples(gid)
+            self.assertEqual(PRICE_RECORD.unpack(view)[0], 100)
+            view.release()
+
+        with self.assertRaises(ValueError):
+            PriceStore(self.directory.name, max_open=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
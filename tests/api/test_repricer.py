@@ -0,0 +1,89 @@
+import unittest
+import urllib.parse
+import httpx
+from steam_trader.api import Client, ClientAsync, InventoryItem
+from steam_trader.api.ext import Repricer, RepricerAsync, RepriceDecision, UndercutStrategy
+
+
+def listing(_id, gid, price):
+    return InventoryItem(
+        id=_id, assetid=_id, gid=gid, itemid=_id, price=price, currency=1, timer=None, type=0, status=0,
+        position=None, nc=None, percent=None, steam_item=True, nm=False
+    )
+
+
+BOOKS = {
+    1: {'sell': [[5.0, 2], [5.5, 1]], 'buy': [[4.0, 1]]},
+    2: {'sell': [[3.0, 1]], 'buy': [[2.99, 3]]},
+}
+
+
+class Transport:
+
+    def __init__(self):
+        self.book_requests = []
+        self.edits = []
+
+    def __call__(self, request):
+        if request.url.path == '/orderbook/':
+            gid = int(request.url.params['gid'])
+            self.book_requests.append(gid)
+            book = BOOKS[gid]
+            return httpx.Response(200, json={
+                'success': True, 'sell': book['sell'], 'buy': book['buy'],
+                'total_sell': sum(count for _, count in book['sell']), 'total_buy': 1
+            })
+
+        form = urllib.parse.parse_qs(request.content.decode())
+        _id, price = int(form['id'][0]), float(form['price'][0])
+        if _id == 13:
+            return httpx.Response(200, json={'success': False, 'code': 2})
+        self.edits.append((_id, price))
+        return httpx.Response(200, json={'success': True, 'type': 0, 'position': 1, 'fast_execute': False})
+
+
+LISTINGS = [listing(10, 1, 5.0), listing(11, 1, 5.49), listing(12, 1, 6.0), listing(20, 2, 3.5)]
+
+
+class IndependentTests(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = Transport()
+        self.client = self.enterContext(Client('', transport=httpx.MockTransport(self.transport)))
+
+    def test_plan(self):
+        decisions = Repricer(self.client).plan(LISTINGS)
+        self.assertEqual(self.transport.book_requests, [1, 2])
+        # Собственное предложение за 5.0 не считается конкурентом, но за 5.0 продаёт ещё один продавец.
+        # Для gid 2 цена упала бы до лучшей заявки на покупку, поэтому она не меняется.
+        self.assertEqual(decisions, [
+            RepriceDecision(10, 1, 5.0, 4.99), RepriceDecision(11, 1, 5.49, 4.99), RepriceDecision(12, 1, 6.0, 4.99)
+        ])
+
+    def test_exclude_own(self):
+        decisions = Repricer(self.client).plan([listing(10, 1, 5.0), listing(11, 1, 5.0), listing(12, 1, 6.0)])
+        self.assertEqual([decision.new_price for decision in decisions], [5.49, 5.49, 5.49])
+
+    def test_skip_unchanged(self):
+        decisions = Repricer(self.client, UndercutStrategy(min_price=4.99)).plan([listing(10, 1, 4.99)])
+        self.assertEqual(decisions, [])
+
+    def test_apply(self):
+        applied = Repricer(self.client).apply([RepriceDecision(13, 1, 5.0, 4.99), RepriceDecision(11, 1, 5.49, 4.99)])
+        self.assertEqual(applied, [RepriceDecision(11, 1, 5.49, 4.99)])
+        self.assertEqual(self.transport.edits, [(11, 4.99)])
+
+
+class AsyncTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_plan_and_apply(self):
+        transport = Transport()
+        async with ClientAsync('', transport=httpx.MockTransport(transport)) as client:
+            repricer = RepricerAsync(client, max_concurrency=2)
+            applied = await repricer.apply(await repricer.plan(LISTINGS))
+        self.assertEqual(sorted(transport.book_requests), [1, 2])
+        self.assertEqual(len(applied), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
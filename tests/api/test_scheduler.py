@@ -0,0 +1,59 @@
+import asyncio
+import unittest
+import httpx
+from steam_trader.api import ClientAsync, RequestScheduler, PRIORITY_TRADE, PRIORITY_ACCOUNT, PRIORITY_DATA
+
+
+class AsyncTests(unittest.IsolatedAsyncioTestCase):
+
+    async def run_requests(self, scheduler, priorities):
+        order = []
+
+        async def request(i, priority):
+            await scheduler.acquire(priority)
+            order.append(i)
+
+        scheduler.penalize(0.05)  # Приостанавливаем выдачу, чтобы все запросы встали в очередь.
+        tasks = [asyncio.create_task(request(i, priority)) for i, priority in enumerate(priorities)]
+        await asyncio.gather(*tasks)
+        return order
+
+    async def test_trade_goes_first(self):
+        scheduler = RequestScheduler(rate=200)
+        priorities = [PRIORITY_DATA] * 5 + [PRIORITY_TRADE]
+        order = await self.run_requests(scheduler, priorities)
+        self.assertEqual(order[0], 5)
+
+    async def test_weighted_fair_queuing(self):
+        scheduler = RequestScheduler(rate=200)
+        priorities = [PRIORITY_DATA] * 6 + [PRIORITY_ACCOUNT] * 6
+        order = await self.run_requests(scheduler, priorities)
+        first = [priorities[i] for i in order[:6]]
+        self.assertEqual(first.count(PRIORITY_ACCOUNT), 4)
+        self.assertEqual(first.count(PRIORITY_DATA), 2)
+
+    async def test_cancelled_request(self):
+        scheduler = RequestScheduler(rate=200)
+        scheduler.penalize(0.05)
+        task = asyncio.create_task(scheduler.acquire(PRIORITY_DATA))
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.wait_for(scheduler.acquire(PRIORITY_DATA), 1)
+        self.assertEqual(scheduler.pending(), 0)
+
+    async def test_client_hooks(self):
+        scheduler = RequestScheduler(rate=200)
+        seen = []
+
+        def handler(request):
+            seen.append(scheduler.classify(request))
+            return httpx.Response(200, json={'success': True, 'balance': 1.5})
+
+        async with ClientAsync('', scheduler=scheduler, transport=httpx.MockTransport(handler)) as client:
+            self.assertEqual(await client.balance, 1.5)
+            with scheduler.priority(PRIORITY_TRADE):
+                await client.balance
+        self.assertEqual(seen, [PRIORITY_ACCOUNT, PRIORITY_TRADE])
+
+if __name__ == '__main__':
+    unittest.main()
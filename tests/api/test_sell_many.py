@@ -0,0 +1,69 @@
+import asyncio
+import unittest
+import urllib.parse
+import httpx
+from steam_trader.api.ext import ExtClient, ExtClientAsync, SellTask
+from steam_trader.exceptions import ItemAlreadySold, NoTradeLink
+
+
+ERRORS = {2: 5, 4: 3}
+"""Коды ошибок продажи по itemid. 5 - ItemAlreadySold, 3 - NoTradeLink."""
+
+
+def respond(request):
+    itemid = int(urllib.parse.parse_qs(request.content.decode())['itemid'][0])
+    if itemid in ERRORS:
+        return httpx.Response(200, json={'success': False, 'code': ERRORS[itemid], 'error': ''})
+    return httpx.Response(200, json={'success': True, 'id': itemid, 'position': 1, 'fast_execute': False, 'nc': ''})
+
+
+class Transport:
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, request):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return respond(request)
+
+
+class IndependentTests(unittest.TestCase):
+
+    def test_sell_many(self):
+        with ExtClient('', transport=httpx.MockTransport(respond)) as client:
+            attempts = list(client.sell_many([SellTask(1, 10, 1.0), SellTask(2, 20, 1.0), SellTask(3, 30, 1.0)]))
+        self.assertEqual([attempt.success for attempt in attempts], [True, False, True])
+        self.assertIsInstance(attempts[1].error, ItemAlreadySold)
+
+    def test_fatal_error(self):
+        with ExtClient('', transport=httpx.MockTransport(respond)) as client:
+            with self.assertRaises(NoTradeLink):
+                list(client.sell_many([SellTask(1, 10, 1.0), SellTask(4, 40, 1.0), SellTask(3, 30, 1.0)]))
+
+
+class AsyncTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_sell_many(self):
+        transport = Transport()
+        tasks = [SellTask(i, i * 10, 1.0) for i in (1, 2, 3, 5, 6, 7)]
+        async with ExtClientAsync('', transport=httpx.MockTransport(transport)) as client:
+            attempts = [attempt async for attempt in client.sell_many(tasks, max_concurrency=2)]
+        self.assertEqual(len(attempts), 6)
+        self.assertEqual(sum(attempt.success for attempt in attempts), 5)
+        self.assertIsInstance(next(a.error for a in attempts if not a.success), ItemAlreadySold)
+        self.assertLessEqual(transport.max_running, 2)
+
+    async def test_fatal_error(self):
+        tasks = [SellTask(i, i * 10, 1.0) for i in (1, 4, 3)]
+        async with ExtClientAsync('', transport=httpx.MockTransport(Transport())) as client:
+            with self.assertRaises(NoTradeLink):
+                async for _ in client.sell_many(tasks, max_concurrency=1):
+                    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
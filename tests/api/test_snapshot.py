@@ -0,0 +1,70 @@
+import os
+import csv
+import tempfile
+import unittest
+from steam_trader.api import MinPrices
+from steam_trader.api.ext import SnapshotWriter, SNAPSHOT_COLUMNS
+from steam_trader.web import MainPageItem
+
+try:
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+def main_page_item(gid):
+    return MainPageItem(
+        benefit=False, count=gid, description='', gid=gid, hash_name=f'hash {gid}', image_small='',
+        name=f'item {gid}', outline='', price=1.0, type=''
+    )
+
+
+def min_prices(gid):
+    return MinPrices(
+        success=True, market_price=gid + 0.5, buy_price=None, steam_price=gid + 1.0,
+        count_sell_offers=gid, count_buy_offers=0
+    )
+
+
+class IndependentTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_csv(self):
+        path = os.path.join(self.directory.name, 'snapshot.csv')
+        with SnapshotWriter(path, 'csv', timestamp=1714521600, chunk_size=2) as writer:
+            for gid in range(5):
+                writer.write(main_page_item(gid), min_prices(gid))
+            writer.write(main_page_item(5))
+            self.assertLessEqual(len(writer._columns['gid']), 2)
+
+        with open(path, encoding='utf-8', newline='') as file:
+            rows = list(csv.reader(file))
+        self.assertEqual(tuple(rows[0]), SNAPSHOT_COLUMNS)
+        self.assertEqual(len(rows), 7)
+        self.assertEqual(rows[2], ['1714521600', '1', 'item 1', 'hash 1', '1', '1.5', '', '2.0', '1', '0'])
+        self.assertEqual(rows[6][5:], ['', '', '', '', ''])
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            SnapshotWriter(os.path.join(self.directory.name, 'snapshot.xml'), 'xml')
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow не установлен')
+    def test_parquet(self):
+        path = os.path.join(self.directory.name, 'snapshot.parquet')
+        with SnapshotWriter(path, 'parquet', timestamp=1714521600, chunk_size=2) as writer:
+            for gid in range(5):
+                writer.write(main_page_item(gid), min_prices(gid))
+
+        table = pyarrow.parquet.read_table(path)
+        self.assertEqual(table.num_rows, 5)
+        self.assertEqual(table.column('gid').to_pylist(), [0, 1, 2, 3, 4])
+        self.assertEqual(set(table.column('timestamp').to_pylist()), {1714521600})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,209 @@
+import asyncio
+import unittest
+import httpx
+from steam_trader.api import Client, ClientAsync
+from steam_trader.api.ext import TradeProcessor, TradeProcessorAsync
+
+TRADE_CREATION_FAIL = 3
+"""Код ошибки exchange, соответствующий TradeCreationFail."""
+
+TOO_MANY_REQUESTS = 429
+
+
+def exchange_item(itemid, timer=600, asset_type=0):
+    return {
+        'id': itemid, 'assetid': itemid, 'gameid': 440, 'contextid': 2, 'classid': 1, 'instanceid': 0, 'gid': 1226,
+        'itemid': itemid, 'price': 1.0, 'currency': 1, 'timer': timer, 'asset_type': asset_type, 'percent': 10.0,
+        'steam_item': True
+    }
+
+
+def p2p_result(receive=(), confirm=(), cancel=()):
+    return {
+        'success': True, 'send': [],
+        'receive': [{'offerId': offerid, 'code': 'XYZ', 'items': [], 'partnerSteamId': 2} for offerid in receive],
+        'confirm': [{'offerId': offerid, 'code': 'XYZ', 'partnerSteamId': 2} for offerid in confirm],
+        'cancel': list(cancel)
+    }
+
+
+def items_response(items):
+    if not items:
+        return {'success': False, 'code': 2}  # NoTradeItems
+    return {'success': True, 'items': items, 'descriptions': {}}
+
+
+class Transport:
+
+    def __init__(self, bot_items=(), p2p_items=(), fail=None, fetch_fail=None):
+        self.bot_items = list(bot_items)
+        self.p2p_items = list(p2p_items)
+        self.fail = fail
+        self.fetch_fail = fetch_fail
+        self.p2p_result = p2p_result(confirm=[7], cancel=['8'])
+        self.calls = []
+        self.offer_id = 100
+
+    def __call__(self, request):
+        path = request.url.path.strip('/')
+        self.calls.append(path)
+        return httpx.Response(200, json=self.respond(path))
+
+    def respond(self, path):
+        match path:
+            case 'altws':
+                return {'success': True, 'messages': [{'type': 1, 'data': ''}]}
+            case 'itemsforexchange':
+                if self.fetch_fail is not None:
+                    return {'success': False, 'code': self.fetch_fail}
+                return items_response(self.bot_items)
+            case 'exchange':
+                if self.fail is not None:
+                    return {'success': False, 'code': self.fail}
+                self.bot_items = []
+                self.offer_id += 1
+                return {
+                    'success': True, 'offerId': self.offer_id, 'code': 'ABC', 'botSteamId': 1, 'botNick': 'bot',
+                    'items': []
+                }
+            case 'itemsforexchangep2p':
+                return items_response(self.p2p_items)
+            case 'exchangep2p':
+                return self.p2p_result
+
+
+def make_client(transport):
+    return Client('', transport=httpx.MockTransport(transport))
+
+
+class IndependentTests(unittest.TestCase):
+
+    def test_batches_pending_items(self):
+        transport = Transport(bot_items=[exchange_item(1), exchange_item(2)])
+        processor = TradeProcessor(self.enterContext(make_client(transport)), p2p=False, min_interval=1, max_interval=8)
+        offers = processor.poll()
+        self.assertEqual(transport.calls.count('exchange'), 1)
+        self.assertEqual([(offer.offerid, offer.kind, offer.state) for offer in offers], [('101', 'bot', 'sent')])
+
+        stats = processor.stats()
+        self.assertEqual((stats.exchanges, stats.offers, stats.items, stats.pending), (1, 1, 2, 0))
+        self.assertIsNotNone(stats.latency)
+
+    def test_idle_backoff(self):
+        processor = TradeProcessor(self.enterContext(make_client(Transport())), min_interval=1, max_interval=2)
+        for _ in range(3):
+            self.assertEqual(processor.poll(), [])
+        self.assertEqual(processor.interval, 2)
+        self.assertEqual(processor.stats().exchanges, 0)
+
+    def test_interval_bounded_by_timer(self):
+        client = self.enterContext(make_client(Transport(p2p_items=[exchange_item(1, timer=6)])))
+        processor = TradeProcessor(client, bot=False, min_interval=1, max_interval=60)
+        processor.interval = 60
+        processor.poll()
+        self.assertEqual(processor.interval, 3)
+
+    def test_p2p_states(self):
+        client = self.enterContext(make_client(Transport(p2p_items=[exchange_item(1, asset_type=1)])))
+        processor = TradeProcessor(client, bot=False)
+        offers = processor.poll()
+        self.assertEqual({offer.offerid: offer.state for offer in offers}, {'7': 'confirm', '8': 'cancel'})
+        self.assertEqual(processor.poll(), [])  # Состояния не изменились
+
+    def test_state_change(self):
+        transport = Transport(p2p_items=[exchange_item(1, asset_type=1)])
+        transport.p2p_result = p2p_result(receive=[7])
+        processor = TradeProcessor(self.enterContext(make_client(transport)), bot=False)
+        self.assertEqual([offer.state for offer in processor.poll()], ['receive'])
+
+        transport.p2p_result = p2p_result(confirm=[7])
+        offers = processor.poll()
+        self.assertEqual([(offer.offerid, offer.state) for offer in offers], [('7', 'confirm')])
+        self.assertIs(offers[0], processor.offers['7'])
+
+    def test_fetch_error(self):
+        client = self.enterContext(make_client(Transport(fetch_fail=TOO_MANY_REQUESTS)))
+        processor = TradeProcessor(client, p2p=False, min_interval=1)
+        processor.interval = 10
+        with self.assertLogs(level='WARNING'):
+            self.assertEqual(processor.poll(), [])
+        self.assertEqual((processor.stats().errors, processor.interval), (1, 1))
+
+    def test_vanished_items(self):
+        transport = Transport(bot_items=[exchange_item(1), exchange_item(2)], fail=TRADE_CREATION_FAIL)
+        processor = TradeProcessor(self.enterContext(make_client(transport)), p2p=False)
+        with self.assertLogs(level='WARNING'):
+            processor.poll()
+        self.assertEqual(processor.stats().pending, 2)
+
+        transport.bot_items = [exchange_item(2)]
+        with self.assertLogs(level='WARNING'):
+            processor.poll()
+        self.assertEqual(processor.stats().pending, 1)
+
+        transport.fetch_fail = TOO_MANY_REQUESTS
+        with self.assertLogs(level='WARNING'):
+            processor.poll()
+        self.assertEqual(processor.stats().pending, 1)  # Неудачный запрос не сбрасывает ожидающие предметы
+
+        transport.fetch_fail = None
+        transport.bot_items = []
+        processor.poll()
+        self.assertEqual(processor.stats().pending, 0)
+
+    def test_retryable_error(self):
+        client = self.enterContext(make_client(Transport(bot_items=[exchange_item(1)], fail=TRADE_CREATION_FAIL)))
+        processor = TradeProcessor(client, p2p=False, min_interval=1)
+        with self.assertLogs(level='WARNING'):
+            self.assertEqual(processor.poll(), [])
+        stats = processor.stats()
+        self.assertEqual((stats.errors, stats.pending), (1, 1))
+
+    def test_prune(self):
+        client = self.enterContext(make_client(Transport(bot_items=[exchange_item(1)])))
+        processor = TradeProcessor(client, p2p=False, keep=0)
+        processor.poll()
+        processor._prune()
+        self.assertEqual(processor.offers, {})
+
+    def test_invalid(self):
+        client = Client('')
+        with self.assertRaises(ValueError):
+            TradeProcessor(client, bot=False, p2p=False)
+        with self.assertRaises(ValueError):
+            TradeProcessor(client, min_interval=10, max_interval=5)
+
+
+class AsyncTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_poll(self):
+        transport = Transport(bot_items=[exchange_item(1)], p2p_items=[exchange_item(2)])
+        async with ClientAsync('', transport=httpx.MockTransport(transport)) as client:
+            processor = TradeProcessorAsync(client, websocket=True, min_interval=1)
+            processor.interval = 4
+            offers = await processor.poll()
+        self.assertEqual(transport.calls[0], 'altws')
+        self.assertEqual({offer.offerid for offer in offers}, {'101', '7', '8'})
+        self.assertEqual(processor.interval, 1)
+        self.assertEqual(processor.stats().items, 2)
+
+    async def test_fetch_error(self):
+        transport = Transport(p2p_items=[exchange_item(2)], fetch_fail=TOO_MANY_REQUESTS)
+        async with ClientAsync('', transport=httpx.MockTransport(transport)) as client:
+            processor = TradeProcessorAsync(client, min_interval=1)
+            with self.assertLogs(level='WARNING'):
+                offers = await processor.poll()
+        self.assertEqual({offer.offerid for offer in offers}, {'7', '8'})
+        self.assertEqual(processor.stats().errors, 1)
+
+    async def test_stop(self):
+        async with ClientAsync('', transport=httpx.MockTransport(Transport())) as client:
+            processor = TradeProcessorAsync(client, min_interval=0.01, max_interval=0.01)
+            task = asyncio.create_task(processor.run())
+            await asyncio.sleep(0.05)
+            processor.stop()
+            await asyncio.wait_for(task, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
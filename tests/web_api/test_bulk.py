@@ -0,0 +1,50 @@
+import json
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from steam_trader.web import ItemInfo, parse_item_infos, parse_item_infos_async
+
+OFFER = (
+    '<div class="offer" data-id="{id}"><table><tr><td class="offer_img"><img src="/img/{id}.png"></td>'
+    '<td class="offer_descr"><div class="name">Ракетомёт</div><div class="type ha tf2"><p>Team Fortress 2</p><p></p></div>'
+    '<div class="effect"></div></td><td class="offer_price col">1&nbsp;550 ₽</td><td class="col">'
+    '<div class="button inactive" data-id="6786327" data-price="{price}" data-currency="1" data-type="3"></div></td></tr></table></div>'
+)
+DESCRIPTION = {
+    'name': 'Ракетомёт', 'type': '', 'image_small': 'abc', 'color': 'FAFAFA', 'outline': 'FAFAFA', 'description': '<p></p>'
+}
+
+
+def item_page(n):
+    offers = ''.join(OFFER.format(id=n * 10 + i, price=100 + i) for i in range(3))
+    descriptions = json.dumps({str(n * 10 + i): DESCRIPTION for i in range(3)}, ensure_ascii=False)
+    contents = f'<div class="wrap">{offers}</div><script>var d={descriptions};Market.setItemOffers(d,1);</script>'
+    return json.dumps({
+        'auth': True, 'item': True, 'commission': 5, 'discount': 0, 'title': '', 'game': 440, 'menu': '',
+        'contents': contents
+    }).encode()
+
+
+UNKNOWN_PAGE = json.dumps({'auth': False, 'item': False, 'title': '', 'game': 440, 'menu': '', 'contents': '<div></div>'})
+
+
+class IndependentTests(unittest.TestCase):
+
+    def test_parse_item_infos(self):
+        bodies = [item_page(n) for n in range(1, 6)] + [UNKNOWN_PAGE]
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = list(parse_item_infos(bodies, executor=executor, chunksize=2))
+        self.assertEqual(results[:5], [ItemInfo.de_json(json.loads(body)) for body in bodies[:5]])
+        self.assertEqual(results[0].sell_offers[2].price, 102.0)
+        self.assertIsNone(results[5])
+
+
+class AsyncTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_parse_item_infos(self):
+        bodies = [item_page(n) for n in range(1, 4)]
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = await parse_item_infos_async(bodies, executor, chunksize=2)
+        self.assertEqual([result.descriptions.keys() for result in results], [{10, 11, 12}, {20, 21, 22}, {30, 31, 32}])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import time
+import asyncio
+import unittest
+import httpx
+from steam_trader.web import WebClientAsync, CatalogCrawler, MainPage
+from steam_trader.constants import TEAM_FORTRESS2_APPID
+from steam_trader.exceptions import TooManyRequests
+
+
+def main_page(page, gids, page_count):
+    return MainPage.de_json({
+        'auth': False, 'currency': 1, 'current_page': page, 'page_count': page_count,
+        'contents': {'items': [
+            {'gid': gid, 'hash_name': str(gid), 'name': str(gid), 'color': '', 'image_small': '', 'price': 1.0,
+             'benefit': False, 'outline': '', 'count': 1, 'description': '', 'type': ''}
+            for gid in gids
+        ]},
+        'body': '', 'chat': True, 'handler': '', 'menu': '', 'sorter': {}, 'title': '', 'game': 440
+    })
+
+
+class FakeWebClientAsync(WebClientAsync):
+
+    def __init__(self, pages, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pages = pages
+        self.failed = set()
+        self.running = 0
+        self.max_running = 0
+        self.items_on_page = set()
+
+    async def get_main_page(self, gameid, *, page=1, items_on_page=24, **kwargs):
+        self.items_on_page.add(items_on_page)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        if page == 3 and page not in self.failed:
+            self.failed.add(page)
+            raise httpx.ConnectError('Обрыв соединения')
+        return main_page(page, self.pages[page - 1], len(self.pages))
+
+
+class FakeMarketClientAsync(WebClientAsync):
+    """Каталог из 60 предметов с ценами от 1 до 60, по 3 предмета на странице."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prices = {gid: gid for gid in range(1, 61)}
+        self.max_page = 0
+
+    async def get_main_page(self, gameid, *, price_from=0, price_to=2000, page=1, sort='-rating', **kwargs):
+        self.max_page = max(self.max_page, page)
+        await asyncio.sleep(0)
+        gids = sorted(gid for gid, price in self.prices.items() if price_from <= price and (price <= price_to or price_to >= 2000))
+        page_count = max(1, -(-len(gids) // 3))
+        return main_page(page, gids[(page - 1) * 3:page * 3], page_count)
+
+
+class AsyncTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_crawl(self):
+        # Предмет 3 сместился на следующую страницу во время обхода.
+        client = FakeWebClientAsync([[1, 2, 3], [3, 4, 5], [6, 7, 8], [9, 10]])
+        crawler = CatalogCrawler(client, workers=2, rate=1000)
+        gids = [item.gid async for item in crawler.crawl(TEAM_FORTRESS2_APPID)]
+        self.assertEqual(sorted(gids), list(range(1, 11)))
+        self.assertEqual(gids[:3], [1, 2, 3])
+        self.assertLessEqual(client.max_running, 2)
+        self.assertEqual(client.items_on_page, {120})
+        self.assertEqual(client.failed, {3})
+
+    async def test_too_many_requests(self):
+        client = FakeWebClientAsync([[1], [2], [4], [5]])
+        throttled = []
+
+        async def get_main_page(gameid, *, page=1, **kwargs):
+            if page == 2 and not throttled:
+                throttled.append(time.monotonic())
+                raise TooManyRequests('Вы отправили слишком много запросов.')
+            return main_page(page, client.pages[page - 1], len(client.pages))
+
+        client.get_main_page = get_main_page
+        crawler = CatalogCrawler(client, workers=3)
+        with self.assertLogs(level='WARNING'):
+            gids = [item.gid async for item in crawler.crawl(TEAM_FORTRESS2_APPID)]
+        self.assertEqual(sorted(gids), [1, 2, 4, 5])
+        self.assertGreaterEqual(time.monotonic() - throttled[0], 1)
+
+    async def test_fatal(self):
+        crawler = CatalogCrawler(FakeWebClientAsync([[1], [2], [3]]), retries=0)
+        with self.assertRaises(httpx.ConnectError):
+            async for _ in crawler.crawl(TEAM_FORTRESS2_APPID):
+                pass
+
+    async def test_crawl_bands(self):
+        client = FakeMarketClientAsync()
+        crawler = CatalogCrawler(client, workers=3)
+        gids = [item.gid async for item in crawler.crawl_bands(TEAM_FORTRESS2_APPID, max_pages=2)]
+        self.assertEqual(sorted(gids), list(range(1, 61)))
+        self.assertLessEqual(client.max_page, 2)
+
+    async def test_crawl_explicit_bands(self):
+        client = FakeMarketClientAsync()
+        crawler = CatalogCrawler(client)
+        gids = [item.gid async for item in crawler.crawl_bands(TEAM_FORTRESS2_APPID, bands=[(0, 10), (10, 20)])]
+        self.assertEqual(sorted(gids), list(range(1, 21)))
+
+    async def test_crawl_indivisible_band(self):
+        client = FakeMarketClientAsync()
+        client.prices = {gid: 5 for gid in range(1, 31)}
+        crawler = CatalogCrawler(client)
+        with self.assertLogs(level='WARNING') as logs:
+            gids = [item.gid async for item in crawler.crawl_bands(TEAM_FORTRESS2_APPID, bands=[(5, 6)], max_pages=2)]
+        self.assertEqual(sorted(gids), list(range(1, 31)))
+        self.assertIn('5-6', logs.output[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
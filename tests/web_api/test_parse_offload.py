@@ -0,0 +1,64 @@
+import json
+import unittest
+import httpx
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from steam_trader.web import WebClientAsync
+from steam_trader.constants import TEAM_FORTRESS2_APPID
+
+MAIN_PAGE = {
+    'auth': False, 'currency': 1, 'current_page': 1, 'page_count': 1,
+    'contents': {'items': [
+        {'gid': 1226, 'hash_name': 'Refined Metal', 'name': 'Очищенный металл', 'color': '7D6D00', 'image_small': '',
+         'price': 2.57, 'benefit': False, 'outline': '7D6D00', 'count': 641, 'description': '', 'type': ''}
+    ]},
+    'body': '', 'chat': True, 'handler': '', 'menu': '', 'sorter': {}, 'title': '', 'game': 440
+}
+HISTORY_PAGE = (
+    '<div class="items"><a class="item" href="/tf2/85949-More-Gun-Marshal"><span class="img"><img src="/a.png"/></span>'
+    '<span class="price">19 <span>₽</span></span><span class="date">Сегодня в 20:39</span>'
+    '<span class="name" style="color:#7D6D00">Многопушечный маршал</span></a></div>'
+)
+
+
+def handler(request):
+    if request.url.path.endswith('/history/'):
+        return httpx.Response(200, text=HISTORY_PAGE)
+    return httpx.Response(200, content=json.dumps(MAIN_PAGE).encode())
+
+
+class CountingExecutor(ThreadPoolExecutor):
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+class AsyncTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_threshold(self):
+        with CountingExecutor() as executor:
+            client = WebClientAsync(parse_executor=executor, parse_threshold=10 ** 6, transport=httpx.MockTransport(handler))
+            async with client:
+                await client.get_main_page(TEAM_FORTRESS2_APPID)
+                self.assertEqual(executor.submitted, 0)
+
+                client.parse_threshold = 0
+                main_page = await client.get_main_page(TEAM_FORTRESS2_APPID)
+                self.assertEqual(executor.submitted, 1)
+                self.assertEqual(main_page.items[0].gid, 1226)
+
+    async def test_process_pool(self):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            client = WebClientAsync(parse_executor=executor, parse_threshold=0, transport=httpx.MockTransport(handler))
+            async with client:
+                history = await client.get_history_page(TEAM_FORTRESS2_APPID)
+                main_page = await client.get_main_page(TEAM_FORTRESS2_APPID)
+        self.assertEqual(history[0].price, 19.0)
+        self.assertEqual(main_page.items[0].name, 'Очищенный металл')
+
+if __name__ == '__main__':
+    unittest.main()
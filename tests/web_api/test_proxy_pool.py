@@ -0,0 +1,97 @@
+import time
+import asyncio
+import unittest
+import httpx
+from steam_trader.web import ProxyPool, WebClient
+
+
+class FakeProxy:
+
+    def __init__(self, status=200):
+        self.status = status
+        self.requests = 0
+
+    def __call__(self, request):
+        self.requests += 1
+        return httpx.Response(self.status, json={})
+
+
+def make_pool(*proxies, **kwargs):
+    pool = ProxyPool([f'http://proxy{i}' for i in range(len(proxies))], **kwargs)
+    for state, handler in zip(pool._proxies, proxies):
+        state.transport = httpx.MockTransport(handler)
+        state.async_transport = httpx.MockTransport(handler)
+    return pool
+
+
+class IndependentTests(unittest.TestCase):
+
+    def test_round_robin(self):
+        a, b = FakeProxy(), FakeProxy()
+        pool = make_pool(a, b)
+        with httpx.Client(transport=pool) as client:
+            for _ in range(4):
+                client.get('https://steam-trader.com/')
+        self.assertEqual((a.requests, b.requests), (2, 2))
+        self.assertEqual(pool.stats(), {'http://proxy0': 2, 'http://proxy1': 2})
+
+    def test_unhealthy_and_recovery(self):
+        a, b = FakeProxy(429), FakeProxy()
+        pool = make_pool(a, b, cooldown=0.05)
+        with httpx.Client(transport=pool) as client:
+            self.assertEqual(client.get('https://steam-trader.com/').status_code, 200)  # Повтор через proxy1
+            self.assertEqual(pool.healthy(), ['http://proxy1'])
+            for _ in range(3):
+                client.get('https://steam-trader.com/')
+            self.assertEqual((a.requests, b.requests), (1, 4))
+
+            a.status = 200
+            deadline = time.monotonic() + 2
+            while len(pool.healthy()) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(len(pool.healthy()), 2)
+
+    def test_all_unhealthy(self):
+        a, b = FakeProxy(429), FakeProxy(429)
+        pool = make_pool(a, b)
+        with httpx.Client(transport=pool) as client:
+            self.assertEqual(client.get('https://steam-trader.com/').status_code, 429)
+        self.assertEqual((a.requests, b.requests), (1, 1))
+        self.assertEqual(pool.healthy(), [])
+
+    def test_sticky_session(self):
+        a, b = FakeProxy(), FakeProxy()
+        pool = make_pool(a, b)
+        with httpx.Client(transport=pool) as client:
+            for _ in range(3):
+                client.get('https://steam-trader.com/', headers={'cookie': 'sid=abc'})
+        self.assertEqual(sorted((a.requests, b.requests)), [0, 3])
+
+    def test_web_client(self):
+        with self.assertRaises(ValueError):
+            WebClient(proxy='http://proxy', proxy_pool=make_pool(FakeProxy()))
+
+
+class AsyncTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_async(self):
+        a, b = FakeProxy(), FakeProxy()
+        pool = make_pool(a, b)
+        async with httpx.AsyncClient(transport=pool) as client:
+            for _ in range(4):
+                await client.get('https://steam-trader.com/')
+        self.assertEqual((a.requests, b.requests), (2, 2))
+
+    async def test_closed(self):
+        a, b = FakeProxy(429), FakeProxy()
+        pool = make_pool(a, b, cooldown=0.01)
+        pool.close()
+        async with httpx.AsyncClient(transport=pool) as client:
+            await client.get('https://steam-trader.com/')
+            a.status = 200
+            await asyncio.sleep(0.1)
+            self.assertEqual(pool.healthy(), ['http://proxy1'])  # Закрытый пул не проверяет прокси
+
+
+if __name__ == '__main__':
+    unittest.main()
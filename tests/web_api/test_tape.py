@@ -0,0 +1,119 @@
+import unittest
+from unittest import mock
+from datetime import datetime
+import httpx
+from steam_trader.web import HistoryItem, HistoryTape, HistoryTapeAsync, WebClient, WebClientAsync, parse_history_date
+from steam_trader.web._tape import SITE_TIMEZONE
+
+
+def sale(name, date, price):
+    return HistoryItem(name=name, date=date, price=price, color='ffffff', image_url='/a.png')
+
+
+class Transport:
+    """Отдаёт страницы истории продаж по очереди. Каждая страница - последние покупки."""
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    def __call__(self, request):
+        links = ''.join(
+            f'<a class="item" href="/tf2/1226"><span class="img"><img src="{item.image_url}"/></span>'
+            f'<span class="price">{item.price}</span><span class="date">{item.date}</span>'
+            f'<span class="name" style="color:#{item.color}">{item.name}</span></a>'
+            for item in self.pages.pop(0)
+        )
+        empty = '<div class="items"></div>'
+        body = f'<div class="items">{links}</div>{empty}{empty}'
+        return httpx.Response(200, text=f'<html><head><meta charset="utf-8"/></head><body>{body}</body></html>')
+
+
+def frozen_datetime(now):
+
+    class FrozenDatetime(datetime):
+
+        @classmethod
+        def now(cls, tz=None):
+            return now.astimezone(tz)
+
+    return FrozenDatetime
+
+
+class IndependentTests(unittest.TestCase):
+
+    def test_parse_history_date(self):
+        now = datetime(2024, 5, 10, 12, 0, tzinfo=SITE_TIMEZONE)
+        self.assertEqual(
+            parse_history_date('Сегодня в 11:30', now),
+            int(datetime(2024, 5, 10, 11, 30, tzinfo=SITE_TIMEZONE).timestamp())
+        )
+        self.assertEqual(
+            parse_history_date('Вчера в 23:59', now),
+            int(datetime(2024, 5, 9, 23, 59, tzinfo=SITE_TIMEZONE).timestamp())
+        )
+        self.assertEqual(
+            parse_history_date('3 мая в 08:05', now),
+            int(datetime(2024, 5, 3, 8, 5, tzinfo=SITE_TIMEZONE).timestamp())
+        )
+        self.assertEqual(
+            parse_history_date('31 декабря в 10:00', now),
+            int(datetime(2023, 12, 31, 10, 0, tzinfo=SITE_TIMEZONE).timestamp())
+        )
+        self.assertEqual(
+            parse_history_date('01.02.2023 10:00', now),
+            int(datetime(2023, 2, 1, 10, 0, tzinfo=SITE_TIMEZONE).timestamp())
+        )
+        with self.assertRaises(ValueError):
+            parse_history_date('Когда-то', now)
+
+    def test_only_new_sales(self):
+        a = sale('A', 'Сегодня в 10:00', 1.0)
+        b = sale('B', 'Сегодня в 10:01', 2.0)
+        c = sale('C', 'Сегодня в 10:02', 3.0)
+        d = sale('D', 'Сегодня в 10:03', 4.0)
+        transport = Transport([[b, a], [d, c, b, a], [d, c, b, a]])
+        with WebClient(transport=httpx.MockTransport(transport)) as client:
+            tape = HistoryTape(client, 440, min_interval=2, max_interval=8)
+
+            self.assertEqual([e.item for e in tape.poll()], [a, b])
+            self.assertEqual([e.item for e in tape.poll()], [c, d])  # От старых к новым
+            self.assertEqual(tape.poll(), [])
+            self.assertEqual(tape.interval, 3)
+
+    def test_midnight(self):
+        before = sale('A', 'Сегодня в 23:59', 1.0)
+        after = sale('A', 'Вчера в 23:59', 1.0)
+        evening = frozen_datetime(datetime(2024, 5, 10, 23, 59, 30, tzinfo=SITE_TIMEZONE))
+        night = frozen_datetime(datetime(2024, 5, 11, 0, 0, 30, tzinfo=SITE_TIMEZONE))
+        with WebClient(transport=httpx.MockTransport(Transport([[before], [after]]))) as client:
+            tape = HistoryTape(client, 440)
+            with mock.patch('steam_trader.web._tape.datetime', evening):
+                self.assertEqual(len(tape.poll()), 1)
+            with mock.patch('steam_trader.web._tape.datetime', night):
+                self.assertEqual(tape.poll(), [])  # Та же продажа, другая строка времени
+
+    def test_bounded_memory(self):
+        items = [sale(str(i), 'Сегодня в 10:00', 1.0) for i in range(10)]
+        with WebClient(transport=httpx.MockTransport(Transport([items]))) as client:
+            tape = HistoryTape(client, 440, memory=4)
+            tape.poll()
+        self.assertEqual(len(tape._seen), 4)
+
+
+class AsyncTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_follow(self):
+        a = sale('A', 'Сегодня в 10:00', 1.0)
+        b = sale('B', 'Сегодня в 10:01', 2.0)
+        async with WebClientAsync(transport=httpx.MockTransport(Transport([[a], [a], [b, a]]))) as client:
+            tape = HistoryTapeAsync(client, 440, min_interval=0, max_interval=0)
+            entries = []
+            async for entry in tape.follow():
+                entries.append(entry.item)
+                if len(entries) == 2:
+                    break
+        self.assertEqual(entries, [a, b])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+import httpx
+from steam_trader.web import WebClient, WebClientAsync, ItemUrlCache
+from steam_trader.exceptions import TooManyRequests
+
+ITEM_PAGE = {
+    'auth': False, 'item': True, 'title': '', 'game': 440, 'menu': '',
+    'contents': '<div></div><script>var d=[];Market.setItemOffers(d,</script>'
+}
+
+
+class FakeSite:
+
+    def __init__(self):
+        self.requests = []
+        self.slug = 'Real-Name'
+        self.status = None
+
+    def __call__(self, request):
+        self.requests.append(request.url.path)
+        if self.status is not None:
+            return httpx.Response(self.status)
+        gid, slug = request.url.path.split('/')[2].split('-', 1)
+        if slug != self.slug:
+            return httpx.Response(302, headers={'location': f'/tf2/{gid}-{self.slug}'})
+        return httpx.Response(200, json=ITEM_PAGE)
+
+
+class IndependentTests(unittest.TestCase):
+
+    def test_cache(self):
+        site = FakeSite()
+        cache = ItemUrlCache()
+        with WebClient(url_cache=cache, transport=httpx.MockTransport(site)) as client:
+            client.get_item_info(1226)
+            client.get_item_info(1226)
+        self.assertEqual(len(site.requests), 4)  # Перенаправление и переход по нему только при первом запросе
+        self.assertEqual(cache.get(1226), 'https://steam-trader.com/tf2/1226-Real-Name')
+
+    def test_stale_url(self):
+        site = FakeSite()
+        with WebClient(transport=httpx.MockTransport(site)) as client:
+            client.get_item_info(1226)
+            site.slug = 'New-Name'
+            client.get_item_info(1226)
+            self.assertEqual(client.url_cache.get(1226), 'https://steam-trader.com/tf2/1226-New-Name')
+
+    def test_throttled(self):
+        site = FakeSite()
+        with WebClient(transport=httpx.MockTransport(site)) as client:
+            client.get_item_info(1226)
+            site.requests.clear()
+            site.status = 429
+            with self.assertRaises(TooManyRequests):
+                client.get_item_info(1226)
+            self.assertEqual(len(site.requests), 1)  # Ссылка не запрашивается заново
+            self.assertEqual(client.url_cache.get(1226), 'https://steam-trader.com/tf2/1226-Real-Name')
+
+    def test_not_found(self):
+        site = FakeSite()
+        with WebClient(transport=httpx.MockTransport(site)) as client:
+            client.url_cache.set(1226, 'https://steam-trader.com/tf2/1226-Deleted')
+            site.slug = 'Deleted'
+            site.status = 404
+            client.get_item_info_raw(1226)
+            self.assertEqual(len(site.requests), 3)
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'urls.jsonl')
+            cache = ItemUrlCache(path)
+            cache.set(1, 'a')
+            cache.set(2, 'b')
+            cache.invalidate(1)
+            cache.set(2, 'c')
+
+            cache = ItemUrlCache(path)
+            self.assertNotIn(1, cache)
+            self.assertEqual(cache.get(2), 'c')
+
+
+class AsyncTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_shared_cache(self):
+        site = FakeSite()
+        cache = ItemUrlCache()
+        with WebClient(url_cache=cache, transport=httpx.MockTransport(site)) as client:
+            client.get_item_info(1226)
+        site.requests.clear()
+        async with WebClientAsync(url_cache=cache, transport=httpx.MockTransport(site)) as client:
+            await client.get_item_info(1226)
+        self.assertEqual(site.requests, ['/tf2/1226-Real-Name'])
+
+if __name__ == '__main__':
+    unittest.main()